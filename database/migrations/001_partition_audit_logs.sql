@@ -0,0 +1,118 @@
+-- Convert an existing (unpartitioned) audit_logs table to the monthly
+-- partitioned layout, keeping every row and log_id.
+-- New databases get the partitioned table from schema.sql directly.
+--
+-- Run once (stop the API first):
+--   psql -d ems_db -f database/migrations/001_partition_audit_logs.sql
+
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+-- Move the old table and the names recreated below out of the way
+ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned;
+ALTER TABLE audit_logs_unpartitioned RENAME CONSTRAINT audit_logs_pkey TO audit_logs_unpartitioned_pkey;
+ALTER SEQUENCE audit_logs_log_id_seq RENAME TO audit_logs_unpartitioned_log_id_seq;
+ALTER INDEX IF EXISTS idx_audit_logs_admin_id RENAME TO idx_audit_logs_unpartitioned_admin_id;
+ALTER INDEX IF EXISTS idx_audit_logs_emp_id RENAME TO idx_audit_logs_unpartitioned_emp_id;
+ALTER INDEX IF EXISTS idx_audit_logs_timestamp RENAME TO idx_audit_logs_unpartitioned_timestamp;
+
+-- Partitioned table, rollup table and maintenance functions. Spelled out
+-- here (as in schema.sql at the time) rather than included, so later
+-- schema changes do not leak into this migration.
+CREATE TABLE audit_logs (
+    log_id SERIAL,
+    admin_id INT REFERENCES admins(admin_id) ON DELETE SET NULL,
+    emp_id INT REFERENCES employees(emp_id) ON DELETE SET NULL,
+    action TEXT NOT NULL,
+    details TEXT,
+    timestamp TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (log_id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+CREATE TABLE IF NOT EXISTS audit_log_daily_counts (
+    day DATE NOT NULL,
+    action TEXT NOT NULL,
+    count BIGINT NOT NULL,
+    PRIMARY KEY (day, action)
+);
+
+CREATE INDEX idx_audit_logs_admin_id ON audit_logs(admin_id);
+CREATE INDEX idx_audit_logs_emp_id ON audit_logs(emp_id);
+CREATE INDEX idx_audit_logs_timestamp ON audit_logs(timestamp);
+
+-- Create the monthly audit_logs partition audit_logs_pYYYYMM containing `month`.
+-- Rows that already landed in the default partition for that month are moved in.
+CREATE OR REPLACE FUNCTION ensure_audit_log_partition(month DATE) RETURNS TEXT AS $$
+DECLARE
+    range_start DATE := date_trunc('month', month)::date;
+    range_end DATE := (date_trunc('month', month) + INTERVAL '1 month')::date;
+    partition_name TEXT := 'audit_logs_p' || to_char(range_start, 'YYYYMM');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM audit_logs_default WHERE timestamp >= range_start AND timestamp < range_end) THEN
+        EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM audit_logs_default WHERE timestamp >= %L AND timestamp < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            range_start, range_end, partition_name
+        );
+        EXECUTE format(
+            'ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, range_start, range_end
+        );
+    ELSE
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            partition_name, range_start, range_end
+        );
+    END IF;
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute audit_log_daily_counts for from_day <= day < to_day
+CREATE OR REPLACE FUNCTION rollup_audit_log_counts(from_day DATE, to_day DATE) RETURNS VOID AS $$
+BEGIN
+    DELETE FROM audit_log_daily_counts WHERE day >= from_day AND day < to_day;
+    INSERT INTO audit_log_daily_counts (day, action, count)
+    SELECT timestamp::date, action, COUNT(*)
+    FROM audit_logs
+    WHERE timestamp >= from_day AND timestamp < to_day
+    GROUP BY 1, 2;
+END;
+$$ LANGUAGE plpgsql;
+
+-- One partition per month of existing history
+SELECT ensure_audit_log_partition(month::date)
+FROM generate_series(
+    (SELECT date_trunc('month', MIN(timestamp)) FROM audit_logs_unpartitioned),
+    date_trunc('month', NOW()),
+    INTERVAL '1 month'
+) AS month;
+
+-- timestamp is now NOT NULL (it is the partition key)
+INSERT INTO audit_logs (log_id, admin_id, emp_id, action, details, timestamp)
+SELECT log_id, admin_id, emp_id, action, details, COALESCE(timestamp, NOW())
+FROM audit_logs_unpartitioned;
+
+SELECT setval(
+    pg_get_serial_sequence('audit_logs', 'log_id'),
+    COALESCE((SELECT MAX(log_id) FROM audit_logs), 0) + 1,
+    false
+);
+
+SELECT rollup_audit_log_counts((SELECT MIN(timestamp)::date FROM audit_logs), CURRENT_DATE + 1);
+
+DROP TABLE audit_logs_unpartitioned;
+
+-- Partitions for this month and the next two; the API keeps creating them ahead
+SELECT ensure_audit_log_partition((date_trunc('month', NOW()) + n * INTERVAL '1 month')::date)
+FROM generate_series(0, 2) AS n;
+
+COMMIT;
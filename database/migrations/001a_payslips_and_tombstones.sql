@@ -0,0 +1,40 @@
+-- Add the payslips metadata table and the employee_tombstones table read by
+-- the change feed (GET /employees/changes) to a database created before
+-- them, with their indexes. New databases get them from schema.sql directly.
+--
+-- Safe to run more than once. Run before 002_payslip_blobs.sql; until it
+-- has run, the payslip and change feed routes fail. Payslip files already
+-- on disk are indexed by the API on its next start.
+--
+--   psql -d ems_db -f database/migrations/001a_payslips_and_tombstones.sql
+
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+-- As in schema.sql before the blob store; 002 adds the checksum foreign key
+CREATE TABLE IF NOT EXISTS payslips (
+    payslip_id SERIAL PRIMARY KEY,
+    emp_id INT NOT NULL REFERENCES employees(emp_id) ON DELETE CASCADE,
+    filename TEXT UNIQUE NOT NULL,
+    original_filename TEXT,
+    size_bytes BIGINT NOT NULL,
+    mime_type TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    pay_period DATE,
+    uploaded_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS employee_tombstones (
+    emp_id INT PRIMARY KEY,
+    deleted_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_employees_designation ON employees(designation);
+CREATE INDEX IF NOT EXISTS idx_employees_updated_at ON employees(updated_at);
+CREATE INDEX IF NOT EXISTS idx_employee_tombstones_deleted_at ON employee_tombstones(deleted_at);
+CREATE INDEX IF NOT EXISTS idx_payslips_emp_id_uploaded_at ON payslips(emp_id, uploaded_at DESC, payslip_id DESC);
+CREATE INDEX IF NOT EXISTS idx_payslips_pay_period ON payslips(pay_period);
+CREATE INDEX IF NOT EXISTS idx_payslips_uploaded_at ON payslips(uploaded_at DESC, payslip_id DESC);
+
+COMMIT;
@@ -0,0 +1,66 @@
+-- Add the content-addressed payslip_blobs table to a database whose payslips
+-- table predates it. New databases get both from schema.sql directly.
+--
+-- Existing payslips are registered as blobs with reference counts taken from
+-- the payslips table. On its next start the API moves the files themselves
+-- from uploads/payslips/<emp_id>/ into uploads/blobs/; until then downloads
+-- are served from the old location.
+--
+-- Needs the payslips table (001a_payslips_and_tombstones.sql).
+--
+-- Run once (stop the API first):
+--   psql -d ems_db -f database/migrations/002_payslip_blobs.sql
+
+\set ON_ERROR_STOP on
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS payslip_blobs (
+    checksum TEXT PRIMARY KEY,
+    size_bytes BIGINT NOT NULL,
+    stored_bytes BIGINT NOT NULL,
+    encoding TEXT NOT NULL DEFAULT 'identity',
+    ref_count INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    released_at TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_payslip_blobs_released_at ON payslip_blobs(released_at) WHERE ref_count <= 0;
+
+INSERT INTO payslip_blobs (checksum, size_bytes, stored_bytes, encoding, ref_count, created_at)
+SELECT checksum, MAX(size_bytes), MAX(size_bytes), 'identity', COUNT(*), MIN(uploaded_at)
+FROM payslips
+GROUP BY checksum
+ON CONFLICT (checksum) DO NOTHING;
+
+-- Guarded: a database whose payslips table came from a newer schema.sql
+-- already has the constraint
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'payslips_checksum_fkey') THEN
+        ALTER TABLE payslips
+            ADD CONSTRAINT payslips_checksum_fkey FOREIGN KEY (checksum) REFERENCES payslip_blobs(checksum);
+    END IF;
+END;
+$$;
+
+-- Same as in schema.sql
+CREATE OR REPLACE FUNCTION payslip_blob_refcount() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE payslip_blobs SET ref_count = ref_count + 1, released_at = NULL
+        WHERE checksum = NEW.checksum;
+        RETURN NEW;
+    END IF;
+    UPDATE payslip_blobs
+    SET ref_count = ref_count - 1,
+        released_at = CASE WHEN ref_count - 1 <= 0 THEN NOW() ELSE released_at END
+    WHERE checksum = OLD.checksum;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER payslips_blob_refcount
+AFTER INSERT OR DELETE ON payslips
+FOR EACH ROW EXECUTE FUNCTION payslip_blob_refcount();
+
+COMMIT;
@@ -0,0 +1,28 @@
+-- Add the trigram search index used by GET /employees/search to an existing
+-- database. New databases get it from schema.sql directly.
+--
+-- The index is built CONCURRENTLY so the API can keep running; on a large
+-- employees table this takes a while. pg_trgm is a trusted extension, so the
+-- database owner can create it.
+--
+-- Run once:
+--   psql -d ems_db -f database/migrations/003_employee_search.sql
+
+\set ON_ERROR_STOP on
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Same as in schema.sql
+CREATE OR REPLACE FUNCTION employee_search_text(
+    first_name TEXT, last_name TEXT, email TEXT, phone TEXT, designation TEXT
+) RETURNS TEXT AS $$
+    SELECT first_name || ' ' || last_name || ' ' || COALESCE(email, '') || ' '
+        || COALESCE(phone, '') || ' ' || COALESCE(regexp_replace(phone, '\D', '', 'g'), '') || ' '
+        || COALESCE(designation, '');
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+-- An interrupted build leaves an INVALID index behind; drop it and run again
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_employees_search ON employees
+USING GIN (employee_search_text(first_name, last_name, email, phone, designation) gin_trgm_ops);
+
+ANALYZE employees;
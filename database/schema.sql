@@ -1,5 +1,8 @@
 -- Employee Management System Database Schema
 
+-- Trigram matching for employee search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Table: admins
 CREATE TABLE IF NOT EXISTS admins (
     admin_id SERIAL PRIMARY KEY,
@@ -35,22 +38,157 @@ CREATE TABLE IF NOT EXISTS employment_history (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
--- Table: audit_logs
+-- Table: audit_logs (partitioned by month, see ensure_audit_log_partition)
 CREATE TABLE IF NOT EXISTS audit_logs (
-    log_id SERIAL PRIMARY KEY,
+    log_id SERIAL,
     admin_id INT REFERENCES admins(admin_id) ON DELETE SET NULL,
     emp_id INT REFERENCES employees(emp_id) ON DELETE SET NULL,
     action TEXT NOT NULL,
     details TEXT,
-    timestamp TIMESTAMP DEFAULT NOW()
+    timestamp TIMESTAMP NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (log_id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+-- Catches rows for months that have no partition yet so inserts never fail
+CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT;
+
+-- Table: audit_log_daily_counts (per-day action totals, see rollup_audit_log_counts)
+CREATE TABLE IF NOT EXISTS audit_log_daily_counts (
+    day DATE NOT NULL,
+    action TEXT NOT NULL,
+    count BIGINT NOT NULL,
+    PRIMARY KEY (day, action)
+);
+
+-- Table: payslip_blobs (content-addressed payslip files, one per distinct SHA-256)
+CREATE TABLE IF NOT EXISTS payslip_blobs (
+    checksum TEXT PRIMARY KEY,
+    size_bytes BIGINT NOT NULL,
+    stored_bytes BIGINT NOT NULL,
+    encoding TEXT NOT NULL DEFAULT 'identity',
+    ref_count INT NOT NULL DEFAULT 0,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    released_at TIMESTAMP
+);
+
+-- Table: payslips (metadata of uploaded payslip files)
+CREATE TABLE IF NOT EXISTS payslips (
+    payslip_id SERIAL PRIMARY KEY,
+    emp_id INT NOT NULL REFERENCES employees(emp_id) ON DELETE CASCADE,
+    filename TEXT UNIQUE NOT NULL,
+    original_filename TEXT,
+    size_bytes BIGINT NOT NULL,
+    mime_type TEXT NOT NULL,
+    checksum TEXT NOT NULL REFERENCES payslip_blobs(checksum),
+    pay_period DATE,
+    uploaded_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Table: employee_tombstones (deleted employees, read by the change feed)
+CREATE TABLE IF NOT EXISTS employee_tombstones (
+    emp_id INT PRIMARY KEY,
+    deleted_at TIMESTAMP DEFAULT NOW()
 );
 
 -- Indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_employees_email ON employees(email);
 CREATE INDEX IF NOT EXISTS idx_employees_department ON employees(department);
 CREATE INDEX IF NOT EXISTS idx_employees_status ON employees(status);
+CREATE INDEX IF NOT EXISTS idx_employees_designation ON employees(designation);
+CREATE INDEX IF NOT EXISTS idx_employees_updated_at ON employees(updated_at);
+CREATE INDEX IF NOT EXISTS idx_employee_tombstones_deleted_at ON employee_tombstones(deleted_at);
 CREATE INDEX IF NOT EXISTS idx_employment_history_emp_id ON employment_history(emp_id);
+CREATE INDEX IF NOT EXISTS idx_payslips_emp_id_uploaded_at ON payslips(emp_id, uploaded_at DESC, payslip_id DESC);
+CREATE INDEX IF NOT EXISTS idx_payslips_pay_period ON payslips(pay_period);
+CREATE INDEX IF NOT EXISTS idx_payslips_checksum ON payslips(checksum);
+CREATE INDEX IF NOT EXISTS idx_payslips_uploaded_at ON payslips(uploaded_at DESC, payslip_id DESC);
+CREATE INDEX IF NOT EXISTS idx_payslip_blobs_released_at ON payslip_blobs(released_at) WHERE ref_count <= 0;
 CREATE INDEX IF NOT EXISTS idx_audit_logs_admin_id ON audit_logs(admin_id);
 CREATE INDEX IF NOT EXISTS idx_audit_logs_emp_id ON audit_logs(emp_id);
 CREATE INDEX IF NOT EXISTS idx_audit_logs_timestamp ON audit_logs(timestamp);
 
+
+-- Create the monthly audit_logs partition audit_logs_pYYYYMM containing `month`.
+-- Rows that already landed in the default partition for that month are moved in.
+CREATE OR REPLACE FUNCTION ensure_audit_log_partition(month DATE) RETURNS TEXT AS $$
+DECLARE
+    range_start DATE := date_trunc('month', month)::date;
+    range_end DATE := (date_trunc('month', month) + INTERVAL '1 month')::date;
+    partition_name TEXT := 'audit_logs_p' || to_char(range_start, 'YYYYMM');
+BEGIN
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN partition_name;
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM audit_logs_default WHERE timestamp >= range_start AND timestamp < range_end) THEN
+        EXECUTE format('CREATE TABLE %I (LIKE audit_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)', partition_name);
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM audit_logs_default WHERE timestamp >= %L AND timestamp < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            range_start, range_end, partition_name
+        );
+        EXECUTE format(
+            'ALTER TABLE audit_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+            partition_name, range_start, range_end
+        );
+    ELSE
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF audit_logs FOR VALUES FROM (%L) TO (%L)',
+            partition_name, range_start, range_end
+        );
+    END IF;
+    RETURN partition_name;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute audit_log_daily_counts for from_day <= day < to_day
+CREATE OR REPLACE FUNCTION rollup_audit_log_counts(from_day DATE, to_day DATE) RETURNS VOID AS $$
+BEGIN
+    DELETE FROM audit_log_daily_counts WHERE day >= from_day AND day < to_day;
+    INSERT INTO audit_log_daily_counts (day, action, count)
+    SELECT timestamp::date, action, COUNT(*)
+    FROM audit_logs
+    WHERE timestamp >= from_day AND timestamp < to_day
+    GROUP BY 1, 2;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Keep payslip_blobs.ref_count equal to the number of payslips pointing at each
+-- blob. A blob whose count drops to zero is stamped released_at and deleted by
+-- the API's maintenance task once it has stayed unreferenced for a while.
+CREATE OR REPLACE FUNCTION payslip_blob_refcount() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE payslip_blobs SET ref_count = ref_count + 1, released_at = NULL
+        WHERE checksum = NEW.checksum;
+        RETURN NEW;
+    END IF;
+    UPDATE payslip_blobs
+    SET ref_count = ref_count - 1,
+        released_at = CASE WHEN ref_count - 1 <= 0 THEN NOW() ELSE released_at END
+    WHERE checksum = OLD.checksum;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE TRIGGER payslips_blob_refcount
+AFTER INSERT OR DELETE ON payslips
+FOR EACH ROW EXECUTE FUNCTION payslip_blob_refcount();
+
+-- Searchable text of an employee: name, email, phone (as written and digits
+-- only) and designation. GET /employees/search matches against exactly this
+-- expression so the trigram index below is used.
+CREATE OR REPLACE FUNCTION employee_search_text(
+    first_name TEXT, last_name TEXT, email TEXT, phone TEXT, designation TEXT
+) RETURNS TEXT AS $$
+    SELECT first_name || ' ' || last_name || ' ' || COALESCE(email, '') || ' '
+        || COALESCE(phone, '') || ' ' || COALESCE(regexp_replace(phone, '\D', '', 'g'), '') || ' '
+        || COALESCE(designation, '');
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE INDEX IF NOT EXISTS idx_employees_search ON employees
+USING GIN (employee_search_text(first_name, last_name, email, phone, designation) gin_trgm_ops);
+
+-- Partitions for this month and the next two; the API keeps creating them ahead
+SELECT ensure_audit_log_partition((date_trunc('month', NOW()) + n * INTERVAL '1 month')::date)
+FROM generate_series(0, 2) AS n;
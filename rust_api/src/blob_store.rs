@@ -0,0 +1,204 @@
+// ================================================================
+//  Employee Management System (EMS)
+//  Developed by: Sam Ranjith Paul
+//  GitHub: https://github.com/samranjithpaul
+//  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+//  Unauthorized removal of this header is prohibited.
+// ================================================================
+
+// Content-addressed payslip storage. Every distinct file is stored once as
+// ./uploads/blobs/<first two hex digits>/<sha256>, gzip-compressed (".gz")
+// when that pays off. payslips.checksum points at a blob; payslip_blobs
+// tracks how many payslips reference each one (maintained by a trigger) and
+// unreferenced blobs are removed by the maintenance task.
+
+use diesel::prelude::*;
+use diesel::sql_types::{BigInt, Integer, Text};
+use flate2::read::GzDecoder;
+use flate2::write::GzEncoder;
+use flate2::Compression;
+use std::fs::{self, File};
+use std::io::{self, BufWriter, Read};
+use std::path::{Path, PathBuf};
+use uuid::Uuid;
+
+pub const BLOB_DIR: &str = "./uploads/blobs";
+pub const IDENTITY: &str = "identity";
+pub const GZIP: &str = "gzip";
+
+// PDFs and legacy Office formats often compress well; xlsx/docx are already zips
+const COMPRESSIBLE_EXTENSIONS: [&str; 3] = ["pdf", "doc", "xls"];
+// Keep the compressed copy only if it is at least this much smaller
+const MIN_COMPRESSION_SAVING: f64 = 0.1;
+// Unreferenced blobs are kept this long before deletion, so an upload that
+// deduplicated onto one just before its last payslip went away still finds it
+const BLOB_GRACE_HOURS: i32 = 1;
+
+pub struct StoredBlob {
+    pub checksum: String,
+    pub size: u64,
+    pub stored_size: u64,
+    pub encoding: &'static str,
+    // False when an identical blob already existed
+    pub created: bool,
+}
+
+#[derive(QueryableByName)]
+struct ReleasedBlobRow {
+    #[diesel(sql_type = Text)]
+    checksum: String,
+    #[diesel(sql_type = Text)]
+    encoding: String,
+}
+
+pub fn blob_path(checksum: &str, encoding: &str) -> PathBuf {
+    let name = if encoding == GZIP {
+        format!("{}.gz", checksum)
+    } else {
+        checksum.to_string()
+    };
+    Path::new(BLOB_DIR).join(&checksum[..2.min(checksum.len())]).join(name)
+}
+
+fn existing_blob(checksum: &str) -> Option<(&'static str, u64)> {
+    [GZIP, IDENTITY].into_iter().find_map(|encoding| {
+        fs::metadata(blob_path(checksum, encoding))
+            .ok()
+            .map(|metadata| (encoding, metadata.len()))
+    })
+}
+
+// Write `source` (already hashed to `checksum`) into the store. An existing
+// blob with the same checksum is reused. With `move_source`, an uncompressed
+// blob is renamed into place instead of copied; otherwise `source` is left alone.
+pub fn store_blob(
+    source: &Path,
+    checksum: &str,
+    size: u64,
+    extension: &str,
+    move_source: bool,
+) -> io::Result<StoredBlob> {
+    let stored = |encoding, stored_size, created| StoredBlob {
+        checksum: checksum.to_string(),
+        size,
+        stored_size,
+        encoding,
+        created,
+    };
+
+    if let Some((encoding, stored_size)) = existing_blob(checksum) {
+        return Ok(stored(encoding, stored_size, false));
+    }
+
+    let dir = blob_path(checksum, IDENTITY).parent().map(Path::to_path_buf).unwrap_or_default();
+    fs::create_dir_all(&dir)?;
+    let temp_path = dir.join(format!(".{}.tmp", Uuid::new_v4()));
+
+    if COMPRESSIBLE_EXTENSIONS.contains(&extension) {
+        let written = (|| {
+            let mut encoder = GzEncoder::new(BufWriter::new(File::create(&temp_path)?), Compression::default());
+            io::copy(&mut File::open(source)?, &mut encoder)?;
+            let file = encoder.finish()?.into_inner().map_err(|e| e.into_error())?;
+            file.sync_all()?;
+            fs::metadata(&temp_path).map(|m| m.len())
+        })();
+        match written {
+            Ok(stored_size) if (stored_size as f64) <= size as f64 * (1.0 - MIN_COMPRESSION_SAVING) => {
+                fs::rename(&temp_path, blob_path(checksum, GZIP))?;
+                return Ok(stored(GZIP, stored_size, true));
+            }
+            Ok(_) => {
+                let _ = fs::remove_file(&temp_path);
+            }
+            Err(e) => {
+                let _ = fs::remove_file(&temp_path);
+                return Err(e);
+            }
+        }
+    }
+
+    let target = blob_path(checksum, IDENTITY);
+    if move_source {
+        fs::rename(source, &target)?;
+    } else {
+        fs::copy(source, &temp_path)
+            .and_then(|_| fs::rename(&temp_path, &target))
+            .map_err(|e| {
+                let _ = fs::remove_file(&temp_path);
+                e
+            })?;
+    }
+    Ok(stored(IDENTITY, size, true))
+}
+
+// Register a blob so payslips can reference it. An unreferenced blob gets a
+// fresh released_at, restarting its grace period, and the row stays locked
+// until the caller's transaction ends so collect_unreferenced_blobs waits.
+pub fn upsert_blob(conn: &mut PgConnection, blob: &StoredBlob) -> QueryResult<usize> {
+    diesel::sql_query(
+        "INSERT INTO payslip_blobs (checksum, size_bytes, stored_bytes, encoding, released_at) \
+         VALUES ($1, $2, $3, $4, NOW()) \
+         ON CONFLICT (checksum) DO UPDATE SET \
+            stored_bytes = EXCLUDED.stored_bytes, \
+            encoding = EXCLUDED.encoding, \
+            released_at = CASE WHEN payslip_blobs.ref_count > 0 THEN NULL ELSE NOW() END",
+    )
+    .bind::<Text, _>(&blob.checksum)
+    .bind::<BigInt, _>(blob.size as i64)
+    .bind::<BigInt, _>(blob.stored_size as i64)
+    .bind::<Text, _>(blob.encoding)
+    .execute(conn)
+}
+
+// Reader over the original (decompressed) bytes of a file stored with `encoding`
+pub fn open_blob(path: &Path, encoding: &str) -> io::Result<Box<dyn Read + Send>> {
+    let file = File::open(path)?;
+    if encoding == GZIP {
+        Ok(Box::new(GzDecoder::new(file)))
+    } else {
+        Ok(Box::new(file))
+    }
+}
+
+// Recount references from payslips (after bulk changes made outside the trigger)
+pub fn reconcile_ref_counts(conn: &mut PgConnection) -> QueryResult<usize> {
+    diesel::sql_query(
+        "UPDATE payslip_blobs b SET ref_count = c.refs, \
+            released_at = CASE WHEN c.refs > 0 THEN NULL ELSE COALESCE(b.released_at, NOW()) END \
+         FROM (SELECT b2.checksum, COUNT(p.payslip_id) AS refs \
+               FROM payslip_blobs b2 LEFT JOIN payslips p ON p.checksum = b2.checksum \
+               GROUP BY b2.checksum) c \
+         WHERE b.checksum = c.checksum AND b.ref_count <> c.refs",
+    )
+    .execute(conn)
+}
+
+// Whether the blob's file is (still) on disk
+pub fn blob_exists(blob: &StoredBlob) -> bool {
+    blob_path(&blob.checksum, blob.encoding).is_file()
+}
+
+// Delete blobs no payslip has referenced for BLOB_GRACE_HOURS. Files are
+// removed before the deleting transaction commits: an upload reusing one of
+// these blobs either registers it first (and the row no longer qualifies) or
+// finds the file gone once it gets the row (see blob_exists).
+pub fn collect_unreferenced_blobs(conn: &mut PgConnection) -> QueryResult<usize> {
+    conn.transaction(|conn| {
+        let released: Vec<ReleasedBlobRow> = diesel::sql_query(
+            "DELETE FROM payslip_blobs \
+             WHERE ref_count <= 0 AND released_at < NOW() - make_interval(hours => $1) \
+             RETURNING checksum, encoding",
+        )
+        .bind::<Integer, _>(BLOB_GRACE_HOURS)
+        .load(conn)?;
+
+        for blob in &released {
+            if let Err(e) = fs::remove_file(blob_path(&blob.checksum, &blob.encoding)) {
+                if e.kind() != io::ErrorKind::NotFound {
+                    eprintln!("Blob store: failed to remove {}: {}", blob.checksum, e);
+                }
+            }
+        }
+        Ok(released.len())
+    })
+}
@@ -6,7 +6,9 @@
 //  Unauthorized removal of this header is prohibited.
 // ================================================================
 
+mod blob_store;
 mod db;
+mod maintenance;
 mod models;
 mod routes;
 
@@ -17,6 +19,7 @@ use serde_json::json;
 
 use db::establish_connection;
 use models::Claims;
+use routes::audit;
 use routes::auth;
 use routes::employee;
 use routes::history;
@@ -62,6 +65,18 @@ async fn create_employee_wrapper(
     employee::create_employee(pool, data, admin_id).await
 }
 
+async fn bulk_create_employees_wrapper(
+    req: actix_web::HttpRequest,
+    pool: web::Data<db::DbPool>,
+    data: web::Json<Vec<models::EmployeeCreate>>,
+) -> actix_web::HttpResponse {
+    let admin_id = match extract_admin_id(&req) {
+        Ok(id) => id,
+        Err(e) => return e.into(),
+    };
+    employee::bulk_create_employees(pool, data, admin_id).await
+}
+
 async fn update_employee_wrapper(
     req: actix_web::HttpRequest,
     pool: web::Data<db::DbPool>,
@@ -110,69 +125,79 @@ async fn upload_payslip_wrapper(
     payslip::upload_payslip(pool, path, payload, admin_id).await
 }
 
-async fn get_audit_logs_wrapper(
-    _req: actix_web::HttpRequest,
+async fn create_payslip_upload_wrapper(
+    req: actix_web::HttpRequest,
     pool: web::Data<db::DbPool>,
+    path: web::Path<i32>,
+    data: web::Json<models::PayslipUploadCreate>,
 ) -> actix_web::HttpResponse {
-    use diesel::prelude::*;
-    use diesel::sql_types::{Integer, Nullable, Text, Timestamp};
-    
-    // Admin ID already validated by extract_admin_id in the route wrapper
-    
-    #[derive(diesel::QueryableByName)]
-    struct AuditLogRow {
-        #[diesel(sql_type = Integer)]
-        log_id: i32,
-        #[diesel(sql_type = Nullable<Integer>)]
-        admin_id: Option<i32>,
-        #[diesel(sql_type = Nullable<Integer>)]
-        emp_id: Option<i32>,
-        #[diesel(sql_type = Text)]
-        action: String,
-        #[diesel(sql_type = Nullable<Text>)]
-        details: Option<String>,
-        #[diesel(sql_type = Timestamp)]
-        timestamp: chrono::NaiveDateTime,
+    if let Err(e) = extract_admin_id(&req) {
+        return e.into();
     }
+    payslip::create_payslip_upload(pool, path, data).await
+}
 
-    let mut conn = match pool.get() {
-        Ok(conn) => conn,
-        Err(e) => {
-            eprintln!("Database connection error: {}", e);
-            return actix_web::HttpResponse::InternalServerError().json(models::ApiResponse::<()>::error(
-                "Database connection failed".to_string(),
-            ));
-        }
-    };
+async fn get_payslip_upload_wrapper(
+    req: actix_web::HttpRequest,
+    path: web::Path<String>,
+) -> actix_web::HttpResponse {
+    if let Err(e) = extract_admin_id(&req) {
+        return e.into();
+    }
+    payslip::get_payslip_upload(path).await
+}
 
-    let result: Result<Vec<AuditLogRow>, _> = diesel::sql_query(
-        "SELECT log_id, admin_id, emp_id, action, details, timestamp FROM audit_logs ORDER BY timestamp DESC LIMIT 100"
-    )
-    .load(&mut conn);
-
-    match result {
-        Ok(rows) => {
-            let logs: Vec<models::AuditLog> = rows.into_iter().map(|row| models::AuditLog {
-                log_id: row.log_id,
-                admin_id: row.admin_id,
-                emp_id: row.emp_id,
-                action: row.action,
-                details: row.details,
-                timestamp: row.timestamp,
-            }).collect();
-            
-            actix_web::HttpResponse::Ok().json(models::ApiResponse::success(
-                "Audit logs retrieved successfully".to_string(),
-                logs,
-            ))
-        }
-        Err(e) => {
-            eprintln!("Error fetching audit logs: {}", e);
-            actix_web::HttpResponse::InternalServerError().json(models::ApiResponse::<()>::error(
-                "Failed to fetch audit logs".to_string(),
-            ))
-        }
+async fn append_payslip_upload_wrapper(
+    req: actix_web::HttpRequest,
+    pool: web::Data<db::DbPool>,
+    path: web::Path<String>,
+    body: web::Payload,
+) -> actix_web::Result<actix_web::HttpResponse> {
+    let admin_id = extract_admin_id(&req)?;
+    payslip::append_payslip_upload(req, pool, path, body, admin_id).await
+}
+
+async fn cancel_payslip_upload_wrapper(
+    req: actix_web::HttpRequest,
+    path: web::Path<String>,
+) -> actix_web::HttpResponse {
+    if let Err(e) = extract_admin_id(&req) {
+        return e.into();
+    }
+    payslip::cancel_payslip_upload(path).await
+}
+
+async fn search_payslips_wrapper(
+    req: actix_web::HttpRequest,
+    pool: web::Data<db::DbPool>,
+    query: web::Query<models::PayslipQuery>,
+) -> actix_web::HttpResponse {
+    if let Err(e) = extract_admin_id(&req) {
+        return e.into();
+    }
+    payslip::search_payslips(pool, query).await
+}
+
+async fn get_audit_logs_wrapper(
+    req: actix_web::HttpRequest,
+    pool: web::Data<db::DbPool>,
+    query: web::Query<models::AuditLogQuery>,
+) -> actix_web::HttpResponse {
+    if let Err(e) = extract_admin_id(&req) {
+        return e.into();
     }
+    audit::get_audit_logs(req, pool, query).await
+}
+
+async fn get_audit_daily_counts_wrapper(
+    req: actix_web::HttpRequest,
+    pool: web::Data<db::DbPool>,
+    query: web::Query<models::AuditCountQuery>,
+) -> actix_web::HttpResponse {
+    if let Err(e) = extract_admin_id(&req) {
+        return e.into();
+    }
+    audit::get_audit_daily_counts(pool, query).await
 }
 
 #[actix_web::main]
@@ -185,9 +210,15 @@ async fn main() -> std::io::Result<()> {
     let _ = std::io::stderr().write_all(b"Connecting to database...\n");
     let pool = establish_connection();
     let _ = std::io::stderr().write_all(b"Database connection pool created successfully\n");
+
+    // Audit log partitions, daily rollups and retention; unreferenced payslip blobs
+    maintenance::spawn_audit_maintenance(pool.clone());
     
-    // Create uploads directory
+    // Create uploads directories
     std::fs::create_dir_all("./uploads/payslips").unwrap_or(());
+    std::fs::create_dir_all(blob_store::BLOB_DIR).unwrap_or(());
+    payslip::migrate_legacy_payslips(&pool);
+    payslip::remove_stale_uploads();
 
     eprintln!("Starting EMS API server on http://0.0.0.0:8000");
 
@@ -211,16 +242,31 @@ async fn main() -> std::io::Result<()> {
                 web::scope("/employees")
                     .route("", web::get().to(employee::get_employees))
                     .route("", web::post().to(create_employee_wrapper))
+                    .route("/bulk", web::post().to(bulk_create_employees_wrapper))
+                    .route("/batch", web::post().to(employee::get_employees_batch))
+                    .route("/stats", web::get().to(employee::get_employee_stats))
+                    .route("/search", web::get().to(employee::search_employees))
+                    .route("/history/stats", web::get().to(history::get_employment_history_stats))
+                    .route("/changes", web::get().to(employee::get_employee_changes))
                     .route("/{id}", web::get().to(employee::get_employee))
                     .route("/{id}", web::put().to(update_employee_wrapper))
                     .route("/{id}", web::delete().to(delete_employee_wrapper))
                     .route("/{id}/history", web::get().to(history::get_employment_history))
                     .route("/{id}/history", web::post().to(add_history_wrapper))
                     .route("/{id}/payslip", web::post().to(upload_payslip_wrapper))
+                    .route("/{id}/payslip/uploads", web::post().to(create_payslip_upload_wrapper))
                     .route("/{id}/payslips", web::get().to(payslip::list_payslips)),
             )
             .route("/payslip/{filename}", web::get().to(payslip::get_payslip))
+            .route("/payslips", web::get().to(search_payslips_wrapper))
+            .service(
+                web::scope("/payslip_uploads")
+                    .route("/{upload_id}", web::get().to(get_payslip_upload_wrapper))
+                    .route("/{upload_id}", web::put().to(append_payslip_upload_wrapper))
+                    .route("/{upload_id}", web::delete().to(cancel_payslip_upload_wrapper)),
+            )
             .route("/audit_logs", web::get().to(get_audit_logs_wrapper))
+            .route("/audit_logs/daily_counts", web::get().to(get_audit_daily_counts_wrapper))
             .route("/meta", web::get().to(meta))
     })
     .bind("0.0.0.0:8000")?
@@ -0,0 +1,246 @@
+// ================================================================
+//  Employee Management System (EMS)
+//  Developed by: Sam Ranjith Paul
+//  GitHub: https://github.com/samranjithpaul
+//  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+//  Unauthorized removal of this header is prohibited.
+// ================================================================
+
+// Background upkeep of the monthly-partitioned audit_logs table: create
+// partitions ahead of time, roll up daily action counts, and archive/drop
+// partitions older than the retention window. Also deletes payslip blobs
+// that no payslip references any more.
+
+use diesel::prelude::*;
+use diesel::sql_types::{BigInt, Bool, Integer, Text};
+use flate2::write::GzEncoder;
+use flate2::Compression;
+use std::env;
+use std::fs::{self, File};
+use std::io::{BufWriter, Write};
+use std::path::Path;
+use std::thread;
+use std::time::Duration;
+
+use crate::blob_store;
+use crate::db::DbPool;
+use crate::models::AuditLog;
+use crate::routes::audit::AuditLogRow;
+
+// Arbitrary key so only one API instance runs maintenance at a time
+const MAINTENANCE_LOCK_KEY: i64 = 0x454d_535f_4155_4454;
+const ARCHIVE_CHUNK_ROWS: i64 = 5000;
+
+struct MaintenanceConfig {
+    interval: Duration,
+    partitions_ahead: i32,
+    // 0 keeps every partition
+    retention_months: i32,
+    archive_dir: Option<String>,
+}
+
+impl MaintenanceConfig {
+    fn from_env() -> Self {
+        fn parse<T: std::str::FromStr>(name: &str, default: T) -> T {
+            env::var(name).ok().and_then(|v| v.parse().ok()).unwrap_or(default)
+        }
+
+        MaintenanceConfig {
+            interval: Duration::from_secs(parse("AUDIT_MAINTENANCE_INTERVAL_SECS", 3600)),
+            partitions_ahead: parse("AUDIT_PARTITIONS_AHEAD", 2),
+            retention_months: parse("AUDIT_RETENTION_MONTHS", 0),
+            archive_dir: env::var("AUDIT_ARCHIVE_DIR").ok().filter(|dir| !dir.is_empty()),
+        }
+    }
+}
+
+#[derive(QueryableByName)]
+struct LockRow {
+    #[diesel(sql_type = Bool)]
+    locked: bool,
+}
+
+#[derive(QueryableByName)]
+struct PartitionRow {
+    #[diesel(sql_type = Text)]
+    name: String,
+}
+
+// Run maintenance now and then every AUDIT_MAINTENANCE_INTERVAL_SECS on a
+// dedicated thread (all of it is blocking database and file I/O)
+pub fn spawn_audit_maintenance(pool: DbPool) {
+    let config = MaintenanceConfig::from_env();
+    eprintln!(
+        "Audit maintenance every {}s (retention: {} months, archive: {})",
+        config.interval.as_secs(),
+        config.retention_months,
+        config.archive_dir.as_deref().unwrap_or("off")
+    );
+
+    thread::spawn(move || loop {
+        run_audit_maintenance(&pool, &config);
+        thread::sleep(config.interval);
+    });
+}
+
+fn run_audit_maintenance(pool: &DbPool, config: &MaintenanceConfig) {
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Audit maintenance: database connection error: {}", e);
+            return;
+        }
+    };
+
+    let locked = diesel::sql_query("SELECT pg_try_advisory_lock($1) AS locked")
+        .bind::<BigInt, _>(MAINTENANCE_LOCK_KEY)
+        .get_result::<LockRow>(&mut conn)
+        .map(|row| row.locked);
+    match locked {
+        Ok(true) => {}
+        Ok(false) => return,
+        Err(e) => {
+            eprintln!("Audit maintenance: failed to take lock: {}", e);
+            return;
+        }
+    }
+
+    if let Err(e) = ensure_partitions(&mut conn, config.partitions_ahead) {
+        eprintln!("Audit maintenance: failed to create partitions: {}", e);
+    }
+    // Roll up before retention so dropped months keep their daily counts
+    if let Err(e) = rollup_daily_counts(&mut conn) {
+        eprintln!("Audit maintenance: failed to roll up daily counts: {}", e);
+    } else if config.retention_months > 0 {
+        apply_retention(&mut conn, config);
+    }
+
+    match blob_store::collect_unreferenced_blobs(&mut conn) {
+        Ok(0) => {}
+        Ok(removed) => eprintln!("Maintenance: removed {} unreferenced payslip blobs", removed),
+        Err(e) => eprintln!("Maintenance: failed to collect payslip blobs: {}", e),
+    }
+
+    if let Err(e) = diesel::sql_query("SELECT pg_advisory_unlock($1)")
+        .bind::<BigInt, _>(MAINTENANCE_LOCK_KEY)
+        .execute(&mut conn)
+    {
+        eprintln!("Audit maintenance: failed to release lock: {}", e);
+    }
+}
+
+fn ensure_partitions(conn: &mut PgConnection, months_ahead: i32) -> QueryResult<usize> {
+    diesel::sql_query(
+        "SELECT ensure_audit_log_partition((date_trunc('month', NOW()) + n * INTERVAL '1 month')::date) \
+         FROM generate_series(0, $1) AS n",
+    )
+    .bind::<Integer, _>(months_ahead)
+    .execute(conn)
+}
+
+// Recompute counts from the newest rolled-up day (possibly partial last run)
+// through today. The first run rolls up everything already logged.
+fn rollup_daily_counts(conn: &mut PgConnection) -> QueryResult<usize> {
+    diesel::sql_query(
+        "SELECT rollup_audit_log_counts( \
+            COALESCE( \
+                (SELECT MAX(day) FROM audit_log_daily_counts), \
+                (SELECT MIN(timestamp)::date FROM audit_logs), \
+                CURRENT_DATE \
+            ), \
+            CURRENT_DATE + 1 \
+        )",
+    )
+    .execute(conn)
+}
+
+fn apply_retention(conn: &mut PgConnection, config: &MaintenanceConfig) {
+    // Monthly partitions that end on or before the first day of the oldest kept month
+    let expired: QueryResult<Vec<PartitionRow>> = diesel::sql_query(
+        "SELECT c.relname::text AS name \
+         FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid \
+         WHERE i.inhparent = 'audit_logs'::regclass \
+            AND c.relname ~ '^audit_logs_p[0-9]{6}$' \
+            AND to_date(substring(c.relname from 13), 'YYYYMM') \
+                < date_trunc('month', NOW()) - make_interval(months => $1) \
+         ORDER BY c.relname",
+    )
+    .bind::<Integer, _>(config.retention_months)
+    .load(conn);
+
+    let expired = match expired {
+        Ok(rows) => rows,
+        Err(e) => {
+            eprintln!("Audit maintenance: failed to list partitions: {}", e);
+            return;
+        }
+    };
+
+    for partition in expired {
+        if let Some(dir) = &config.archive_dir {
+            if let Err(e) = archive_partition(conn, &partition.name, Path::new(dir)) {
+                // Keep the partition so nothing is lost; retried next run
+                eprintln!("Audit maintenance: failed to archive {}: {}", partition.name, e);
+                continue;
+            }
+        }
+
+        match diesel::sql_query(format!("DROP TABLE \"{}\"", partition.name)).execute(conn) {
+            Ok(_) => eprintln!("Audit maintenance: dropped partition {}", partition.name),
+            Err(e) => eprintln!("Audit maintenance: failed to drop {}: {}", partition.name, e),
+        }
+    }
+}
+
+// Write every row of a partition to <dir>/<partition>.ndjson.gz, reading it
+// in log_id order one chunk at a time
+fn archive_partition(conn: &mut PgConnection, partition: &str, dir: &Path) -> Result<(), String> {
+    fs::create_dir_all(dir).map_err(|e| e.to_string())?;
+    let final_path = dir.join(format!("{}.ndjson.gz", partition));
+    let partial_path = dir.join(format!("{}.ndjson.gz.partial", partition));
+
+    let file = File::create(&partial_path).map_err(|e| e.to_string())?;
+    let mut writer = GzEncoder::new(BufWriter::new(file), Compression::default());
+    let query = format!(
+        "SELECT log_id, admin_id, emp_id, action, details, timestamp FROM \"{}\" \
+         WHERE log_id > $1 ORDER BY log_id LIMIT $2",
+        partition
+    );
+
+    let mut after = 0;
+    let mut rows_written = 0;
+    loop {
+        let rows: Vec<AuditLogRow> = diesel::sql_query(&query)
+            .bind::<Integer, _>(after)
+            .bind::<BigInt, _>(ARCHIVE_CHUNK_ROWS)
+            .load(conn)
+            .map_err(|e| e.to_string())?;
+        let done = (rows.len() as i64) < ARCHIVE_CHUNK_ROWS;
+
+        for row in rows {
+            let log = AuditLog::from(row);
+            after = log.log_id;
+            serde_json::to_writer(&mut writer, &log).map_err(|e| e.to_string())?;
+            writer.write_all(b"\n").map_err(|e| e.to_string())?;
+            rows_written += 1;
+        }
+        if done {
+            break;
+        }
+    }
+
+    let file = writer
+        .finish()
+        .and_then(|buffered| buffered.into_inner().map_err(|e| e.into_error()))
+        .map_err(|e| e.to_string())?;
+    file.sync_all().map_err(|e| e.to_string())?;
+    fs::rename(&partial_path, &final_path).map_err(|e| e.to_string())?;
+
+    eprintln!(
+        "Audit maintenance: archived {} rows of {} to {}",
+        rows_written,
+        partition,
+        final_path.display()
+    );
+    Ok(())
+}
@@ -62,6 +62,83 @@ pub struct EmployeeCreate {
     pub status: Option<String>,
 }
 
+#[derive(Debug, Serialize)]
+pub struct BulkInserted {
+    pub index: usize,
+    pub emp_id: i32,
+}
+
+#[derive(Debug, Serialize)]
+pub struct BulkRowError {
+    pub index: usize,
+    pub error: String,
+}
+
+#[derive(Debug, Serialize)]
+pub struct BulkCreateResult {
+    pub inserted: Vec<BulkInserted>,
+    pub errors: Vec<BulkRowError>,
+}
+
+#[derive(Debug, Deserialize, Default)]
+pub struct EmployeeQuery {
+    pub limit: Option<i64>,
+    pub offset: Option<i64>,
+    pub after: Option<i32>,
+    pub department: Option<String>,
+    pub designation: Option<String>,
+    pub status: Option<String>,
+    pub q: Option<String>,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct EmployeeSearchQuery {
+    pub q: Option<String>,
+    pub limit: Option<i64>,
+    pub department: Option<String>,
+    pub designation: Option<String>,
+    pub status: Option<String>,
+}
+
+#[derive(Debug, Serialize)]
+pub struct EmployeeStats {
+    pub total: i64,
+    pub active: i64,
+    pub departments: Vec<String>,
+    pub designations: Vec<String>,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct ChangesQuery {
+    pub since: Option<NaiveDateTime>,
+}
+
+#[derive(Debug, Serialize)]
+pub struct EmployeeChanges {
+    pub as_of: NaiveDateTime,
+    pub upserts: Vec<Employee>,
+    pub deleted: Vec<i32>,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct EmployeeBatchRequest {
+    pub ids: Vec<i32>,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct BatchQuery {
+    // Comma-separated related data to embed; currently only "history"
+    pub include: Option<String>,
+}
+
+#[derive(Debug, Serialize)]
+pub struct EmployeeWithHistory {
+    #[serde(flatten)]
+    pub employee: Employee,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub history: Option<Vec<EmploymentHistory>>,
+}
+
 #[derive(Debug, Serialize, Deserialize)]
 pub struct EmployeeUpdate {
     pub first_name: Option<String>,
@@ -86,6 +163,30 @@ pub struct EmploymentHistory {
     pub created_at: NaiveDateTime,
 }
 
+#[derive(Debug, Serialize)]
+pub struct PriorJobsBucket {
+    // Number of prior employers (the last bucket is "this many or more")
+    pub jobs: i64,
+    pub employees: i64,
+}
+
+#[derive(Debug, Serialize)]
+pub struct PriorCompany {
+    pub company_name: String,
+    pub employees: i64,
+}
+
+#[derive(Debug, Serialize)]
+pub struct EmploymentHistoryStats {
+    pub employees_with_history: i64,
+    pub records: i64,
+    pub avg_prior_jobs: Option<f64>,
+    // Over records with both dates
+    pub avg_prior_tenure_months: Option<f64>,
+    pub prior_jobs: Vec<PriorJobsBucket>,
+    pub top_companies: Vec<PriorCompany>,
+}
+
 #[derive(Debug, Serialize, Deserialize)]
 pub struct EmploymentHistoryCreate {
     pub company_name: String,
@@ -94,6 +195,55 @@ pub struct EmploymentHistoryCreate {
     pub role: Option<String>,
 }
 
+#[derive(Debug, Serialize, Deserialize)]
+pub struct Payslip {
+    pub payslip_id: i32,
+    pub emp_id: i32,
+    pub filename: String,
+    pub original_filename: Option<String>,
+    pub size: i64,
+    pub mime_type: String,
+    // SHA-256 of the file contents, hex encoded
+    pub checksum: String,
+    // First day of the month the payslip covers
+    pub pay_period: Option<NaiveDate>,
+    pub uploaded_at: NaiveDateTime,
+    pub path: String,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct PayslipQuery {
+    pub emp_id: Option<i32>,
+    // Pay period month ("YYYY-MM" or any date in the month)
+    pub period: Option<String>,
+    // Pay period range: from <= pay_period <= to (months, as above)
+    pub from: Option<String>,
+    pub to: Option<String>,
+    // SHA-256 of the contents, to find copies of a file
+    pub checksum: Option<String>,
+    pub limit: Option<i64>,
+    // Keyset cursor from X-Next-Cursor: "<uploaded_at>|<payslip_id>" of the last row seen
+    pub cursor: Option<String>,
+}
+
+#[derive(Debug, Serialize, Deserialize)]
+pub struct PayslipUploadCreate {
+    pub filename: String,
+    // Total size in bytes
+    pub size: u64,
+    pub pay_period: Option<String>,
+}
+
+#[derive(Debug, Serialize, Deserialize)]
+pub struct PayslipUploadStatus {
+    pub upload_id: String,
+    pub emp_id: i32,
+    pub filename: String,
+    pub size: u64,
+    // Bytes received so far; the next chunk must start here
+    pub offset: u64,
+}
+
 #[derive(Debug, Serialize, Deserialize, Clone)]
 pub struct AuditLog {
     pub log_id: i32,
@@ -104,6 +254,34 @@ pub struct AuditLog {
     pub timestamp: NaiveDateTime,
 }
 
+#[derive(Debug, Deserialize)]
+pub struct AuditLogQuery {
+    pub limit: Option<i64>,
+    // Keyset cursor from X-Next-Cursor: "<timestamp>|<log_id>" of the last row seen
+    pub cursor: Option<String>,
+    pub admin_id: Option<i32>,
+    pub emp_id: Option<i32>,
+    pub action: Option<String>,
+    // Time range: from <= timestamp < to
+    pub from: Option<NaiveDateTime>,
+    pub to: Option<NaiveDateTime>,
+}
+
+#[derive(Debug, Serialize, Deserialize)]
+pub struct AuditDailyCount {
+    pub day: NaiveDate,
+    pub action: String,
+    pub count: i64,
+}
+
+#[derive(Debug, Deserialize)]
+pub struct AuditCountQuery {
+    pub action: Option<String>,
+    // Day range: from <= day < to
+    pub from: Option<NaiveDate>,
+    pub to: Option<NaiveDate>,
+}
+
 #[derive(Debug, Serialize, Deserialize)]
 pub struct ApiResponse<T> {
     pub status: String,
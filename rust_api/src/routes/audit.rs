@@ -0,0 +1,265 @@
+// ================================================================
+//  Employee Management System (EMS)
+//  Developed by: Sam Ranjith Paul
+//  GitHub: https://github.com/samranjithpaul
+//  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+//  Unauthorized removal of this header is prohibited.
+// ================================================================
+
+use actix_web::{web, HttpRequest, HttpResponse};
+use chrono::{NaiveDate, NaiveDateTime};
+use diesel::prelude::*;
+use diesel::sql_types::{BigInt, Date, Integer, Nullable, Text, Timestamp};
+
+use crate::db::DbPool;
+use crate::models::*;
+use crate::routes::{
+    format_timestamp_cursor, ndjson_stream, parse_timestamp_cursor, wants_ndjson, TimestampCursor,
+    STREAM_CHUNK_ROWS,
+};
+
+#[derive(QueryableByName)]
+pub(crate) struct AuditLogRow {
+    #[diesel(sql_type = Integer)]
+    log_id: i32,
+    #[diesel(sql_type = Nullable<Integer>)]
+    admin_id: Option<i32>,
+    #[diesel(sql_type = Nullable<Integer>)]
+    emp_id: Option<i32>,
+    #[diesel(sql_type = Text)]
+    action: String,
+    #[diesel(sql_type = Nullable<Text>)]
+    details: Option<String>,
+    #[diesel(sql_type = Timestamp)]
+    timestamp: NaiveDateTime,
+}
+
+impl From<AuditLogRow> for AuditLog {
+    fn from(row: AuditLogRow) -> Self {
+        AuditLog {
+            log_id: row.log_id,
+            admin_id: row.admin_id,
+            emp_id: row.emp_id,
+            action: row.action,
+            details: row.details,
+            timestamp: row.timestamp,
+        }
+    }
+}
+
+// Filters shared by the paged and streamed listings. Unset parameters are
+// bound as NULL so one prepared statement covers every combination.
+const AUDIT_FILTER: &str = "WHERE ($1::int IS NULL OR admin_id = $1) \
+    AND ($2::int IS NULL OR emp_id = $2) \
+    AND ($3::text IS NULL OR action = $3) \
+    AND ($4::timestamp IS NULL OR timestamp >= $4) \
+    AND ($5::timestamp IS NULL OR timestamp < $5)";
+
+// Keyset page, newest first. The plain `timestamp <= $6` bound lets Postgres
+// range-scan idx_audit_logs_timestamp; the row comparison breaks ties on log_id.
+const AUDIT_PAGE: &str = "AND ($6::timestamp IS NULL OR (timestamp <= $6 AND (timestamp, log_id) < ($6, $7))) \
+    ORDER BY timestamp DESC, log_id DESC LIMIT $8";
+
+const DEFAULT_PAGE_SIZE: i64 = 100;
+const MAX_PAGE_SIZE: i64 = 1000;
+
+type AuditCursor = TimestampCursor;
+
+fn format_cursor(row: &AuditLogRow) -> String {
+    format_timestamp_cursor(&row.timestamp, row.log_id)
+}
+
+#[derive(Clone)]
+struct AuditFilter {
+    admin_id: Option<i32>,
+    emp_id: Option<i32>,
+    action: Option<String>,
+    from: Option<NaiveDateTime>,
+    to: Option<NaiveDateTime>,
+}
+
+impl AuditFilter {
+    fn from_query(query: &AuditLogQuery) -> Self {
+        AuditFilter {
+            admin_id: query.admin_id,
+            emp_id: query.emp_id,
+            action: query.action.clone().filter(|a| !a.is_empty()),
+            from: query.from,
+            to: query.to,
+        }
+    }
+
+    fn load_page(
+        &self,
+        conn: &mut PgConnection,
+        after: Option<AuditCursor>,
+        limit: i64,
+    ) -> QueryResult<Vec<AuditLogRow>> {
+        let (before_ts, before_id) = match after {
+            Some((ts, id)) => (Some(ts), Some(id)),
+            None => (None, None),
+        };
+
+        diesel::sql_query(format!(
+            "SELECT log_id, admin_id, emp_id, action, details, timestamp FROM audit_logs {} {}",
+            AUDIT_FILTER, AUDIT_PAGE
+        ))
+        .bind::<Nullable<Integer>, _>(&self.admin_id)
+        .bind::<Nullable<Integer>, _>(&self.emp_id)
+        .bind::<Nullable<Text>, _>(&self.action)
+        .bind::<Nullable<Timestamp>, _>(&self.from)
+        .bind::<Nullable<Timestamp>, _>(&self.to)
+        .bind::<Nullable<Timestamp>, _>(&before_ts)
+        .bind::<Nullable<Integer>, _>(&before_id)
+        .bind::<BigInt, _>(limit)
+        .load(conn)
+    }
+}
+
+// Stream every matching audit entry as NDJSON, newest first, one keyset page at a time
+fn stream_audit_logs(pool: web::Data<DbPool>, filter: AuditFilter, after: Option<AuditCursor>) -> HttpResponse {
+    ndjson_stream(pool, after, move |conn, after: &Option<AuditCursor>| {
+        let rows = filter.load_page(conn, *after, STREAM_CHUNK_ROWS)?;
+        let next = if rows.len() as i64 == STREAM_CHUNK_ROWS {
+            rows.last().map(|row| Some((row.timestamp, row.log_id)))
+        } else {
+            None
+        };
+        Ok((rows.into_iter().map(AuditLog::from).collect::<Vec<_>>(), next))
+    })
+}
+
+pub async fn get_audit_logs(
+    req: HttpRequest,
+    pool: web::Data<DbPool>,
+    query: web::Query<AuditLogQuery>,
+) -> HttpResponse {
+    let after = match query.cursor.as_deref().filter(|c| !c.is_empty()) {
+        Some(cursor) => match parse_timestamp_cursor(cursor) {
+            Some(after) => Some(after),
+            None => {
+                return HttpResponse::BadRequest().json(ApiResponse::<()>::error(
+                    "Invalid cursor".to_string(),
+                ));
+            }
+        },
+        None => None,
+    };
+    let filter = AuditFilter::from_query(&query);
+
+    // Accept: application/x-ndjson streams every matching entry instead of one page
+    if wants_ndjson(&req) {
+        return stream_audit_logs(pool, filter, after);
+    }
+
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    let limit = query.limit.unwrap_or(DEFAULT_PAGE_SIZE).clamp(1, MAX_PAGE_SIZE);
+
+    match filter.load_page(&mut conn, after, limit) {
+        Ok(rows) => {
+            let mut response = HttpResponse::Ok();
+            if rows.len() as i64 == limit {
+                if let Some(last) = rows.last() {
+                    response.insert_header(("X-Next-Cursor", format_cursor(last)));
+                }
+            }
+            let logs: Vec<AuditLog> = rows.into_iter().map(AuditLog::from).collect();
+
+            response.json(ApiResponse::success(
+                "Audit logs retrieved successfully".to_string(),
+                logs,
+            ))
+        }
+        Err(e) => {
+            eprintln!("Error fetching audit logs: {}", e);
+            HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch audit logs".to_string(),
+            ))
+        }
+    }
+}
+
+#[derive(QueryableByName)]
+struct AuditDailyCountRow {
+    #[diesel(sql_type = Date)]
+    day: NaiveDate,
+    #[diesel(sql_type = Text)]
+    action: String,
+    #[diesel(sql_type = BigInt)]
+    count: i64,
+}
+
+// Days before the newest rolled-up day come from audit_log_daily_counts; the
+// maintenance task re-rolls from that day onwards, so it and anything later
+// are counted live from the (pruned) recent audit_logs partitions.
+const AUDIT_DAILY_COUNTS: &str = "WITH rolled AS ( \
+        SELECT COALESCE(MAX(day), '-infinity'::date) AS upto FROM audit_log_daily_counts \
+    ) \
+    SELECT day, action, count FROM audit_log_daily_counts \
+    WHERE day < (SELECT upto FROM rolled) \
+        AND ($1::text IS NULL OR action = $1) \
+        AND ($2::date IS NULL OR day >= $2) \
+        AND ($3::date IS NULL OR day < $3) \
+    UNION ALL \
+    SELECT timestamp::date AS day, action, COUNT(*) AS count FROM audit_logs \
+    WHERE timestamp >= (SELECT upto FROM rolled) \
+        AND ($1::text IS NULL OR action = $1) \
+        AND ($2::date IS NULL OR timestamp >= $2) \
+        AND ($3::date IS NULL OR timestamp < $3) \
+    GROUP BY 1, 2 \
+    ORDER BY day, action";
+
+pub async fn get_audit_daily_counts(
+    pool: web::Data<DbPool>,
+    query: web::Query<AuditCountQuery>,
+) -> HttpResponse {
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    let action = query.action.clone().filter(|a| !a.is_empty());
+    let result: QueryResult<Vec<AuditDailyCountRow>> = diesel::sql_query(AUDIT_DAILY_COUNTS)
+        .bind::<Nullable<Text>, _>(&action)
+        .bind::<Nullable<Date>, _>(&query.from)
+        .bind::<Nullable<Date>, _>(&query.to)
+        .load(&mut conn);
+
+    match result {
+        Ok(rows) => {
+            let counts: Vec<AuditDailyCount> = rows
+                .into_iter()
+                .map(|row| AuditDailyCount {
+                    day: row.day,
+                    action: row.action,
+                    count: row.count,
+                })
+                .collect();
+
+            HttpResponse::Ok().json(ApiResponse::success(
+                "Audit log counts retrieved successfully".to_string(),
+                counts,
+            ))
+        }
+        Err(e) => {
+            eprintln!("Error fetching audit log counts: {}", e);
+            HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch audit log counts".to_string(),
+            ))
+        }
+    }
+}
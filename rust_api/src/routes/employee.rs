@@ -6,15 +6,15 @@
 //  Unauthorized removal of this header is prohibited.
 // ================================================================
 
-use actix_web::{web, HttpResponse};
+use actix_web::{web, HttpRequest, HttpResponse};
 use chrono::{NaiveDate, NaiveDateTime};
 use diesel::prelude::*;
-use diesel::sql_types::{Integer, Text, Nullable, Date, Timestamp};
+use diesel::sql_types::{Array, BigInt, Integer, Text, Nullable, Date, Timestamp};
 use serde_json::json;
 
 use crate::db::DbPool;
 use crate::models::*;
-use crate::routes::create_audit_log;
+use crate::routes::{create_audit_log, json_with_etag, ndjson_stream, wants_ndjson, STREAM_CHUNK_ROWS};
 
 #[derive(QueryableByName)]
 struct EmployeeRow {
@@ -60,7 +60,91 @@ impl From<EmployeeRow> for Employee {
     }
 }
 
-pub async fn get_employees(pool: web::Data<DbPool>) -> HttpResponse {
+// Filters shared by the list and count queries. Unset parameters are bound
+// as NULL so one prepared statement covers every filter combination.
+const EMPLOYEE_FILTER: &str = "WHERE ($1::text IS NULL OR department = $1) \
+    AND ($2::text IS NULL OR designation = $2) \
+    AND ($3::text IS NULL OR status = $3) \
+    AND ($4::text IS NULL OR first_name ILIKE $4 OR last_name ILIKE $4 OR email ILIKE $4 OR phone ILIKE $4)";
+
+const MAX_PAGE_SIZE: i64 = 1000;
+
+// Search matches this expression, which idx_employees_search (pg_trgm GIN) indexes
+const SEARCH_TEXT: &str = "employee_search_text(first_name, last_name, email, phone, designation)";
+const DEFAULT_SEARCH_LIMIT: i64 = 20;
+const MAX_SEARCH_LIMIT: i64 = 100;
+// Minimum word similarity for a fuzzy match; pg_trgm's default of 0.6 misses
+// most single-letter typos in short names ("jonh" vs "john" scores 0.4)
+const SEARCH_SIMILARITY_THRESHOLD: &str = "0.4";
+
+// Turn a free-text search term into an ILIKE pattern, escaping wildcards
+fn search_pattern(q: &Option<String>) -> Option<String> {
+    q.as_deref()
+        .map(str::trim)
+        .filter(|q| !q.is_empty())
+        .map(|q| {
+            let escaped = q.replace('\\', "\\\\").replace('%', "\\%").replace('_', "\\_");
+            format!("%{}%", escaped)
+        })
+}
+
+// Substring pattern for /employees/search. A query that looks like a phone
+// number matches its digits, since the search text also holds phones as digits only.
+fn search_text_pattern(q: &str) -> String {
+    let digits: String = q.chars().filter(char::is_ascii_digit).collect();
+    let phone_like = q.chars().all(|c| c.is_ascii_digit() || " +-().".contains(c));
+    if phone_like && digits.len() >= 3 {
+        format!("%{}%", digits)
+    } else {
+        search_pattern(&Some(q.to_string())).unwrap_or_default()
+    }
+}
+
+// Treat empty filter values the same as absent ones
+fn non_empty(value: &Option<String>) -> Option<&str> {
+    value.as_deref().filter(|v| !v.is_empty())
+}
+
+// Stream every employee matching the filters as NDJSON, one keyset page at a time
+fn stream_employees(pool: web::Data<DbPool>, query: EmployeeQuery) -> HttpResponse {
+    let department = non_empty(&query.department).map(str::to_string);
+    let designation = non_empty(&query.designation).map(str::to_string);
+    let status = non_empty(&query.status).map(str::to_string);
+    let pattern = search_pattern(&query.q);
+    let sql = format!(
+        "SELECT emp_id, first_name, last_name, email, phone, department, designation, joining_date, status, created_at, updated_at FROM employees {} AND ($5::int IS NULL OR emp_id > $5) ORDER BY emp_id LIMIT $6",
+        EMPLOYEE_FILTER
+    );
+
+    ndjson_stream(pool, query.after, move |conn, after: &Option<i32>| {
+        let rows: Vec<EmployeeRow> = diesel::sql_query(sql.as_str())
+            .bind::<Nullable<Text>, _>(&department)
+            .bind::<Nullable<Text>, _>(&designation)
+            .bind::<Nullable<Text>, _>(&status)
+            .bind::<Nullable<Text>, _>(&pattern)
+            .bind::<Nullable<Integer>, _>(after)
+            .bind::<BigInt, _>(STREAM_CHUNK_ROWS)
+            .load(conn)?;
+
+        let next = if rows.len() as i64 == STREAM_CHUNK_ROWS {
+            rows.last().map(|row| Some(row.emp_id))
+        } else {
+            None
+        };
+        Ok((rows.into_iter().map(Employee::from).collect::<Vec<_>>(), next))
+    })
+}
+
+pub async fn get_employees(
+    req: HttpRequest,
+    pool: web::Data<DbPool>,
+    query: web::Query<EmployeeQuery>,
+) -> HttpResponse {
+    // Accept: application/x-ndjson streams the whole filtered listing instead
+    if wants_ndjson(&req) {
+        return stream_employees(pool, query.into_inner());
+    }
+
     let mut conn = match pool.get() {
         Ok(conn) => conn,
         Err(e) => {
@@ -71,21 +155,402 @@ pub async fn get_employees(pool: web::Data<DbPool>) -> HttpResponse {
         }
     };
 
-    let result: Result<Vec<EmployeeRow>, _> = diesel::sql_query(
-        "SELECT emp_id, first_name, last_name, email, phone, department, designation, joining_date, status, created_at, updated_at FROM employees ORDER BY emp_id"
-    )
+    let department = non_empty(&query.department);
+    let designation = non_empty(&query.designation);
+    let status = non_empty(&query.status);
+    let pattern = search_pattern(&query.q);
+    // No limit keeps the original "whole table" behaviour for existing callers
+    let limit = query.limit.map(|l| l.clamp(1, MAX_PAGE_SIZE));
+    let offset = query.offset.unwrap_or(0).max(0);
+
+    let result: Result<Vec<EmployeeRow>, _> = diesel::sql_query(format!(
+        "SELECT emp_id, first_name, last_name, email, phone, department, designation, joining_date, status, created_at, updated_at FROM employees {} AND ($5::int IS NULL OR emp_id > $5) ORDER BY emp_id LIMIT $6 OFFSET $7",
+        EMPLOYEE_FILTER
+    ))
+    .bind::<Nullable<Text>, _>(department)
+    .bind::<Nullable<Text>, _>(designation)
+    .bind::<Nullable<Text>, _>(status)
+    .bind::<Nullable<Text>, _>(&pattern)
+    .bind::<Nullable<Integer>, _>(&query.after)
+    .bind::<Nullable<BigInt>, _>(&limit)
+    .bind::<BigInt, _>(&offset)
     .load(&mut conn);
 
+    let rows = match result {
+        Ok(rows) => rows,
+        Err(e) => {
+            eprintln!("Error fetching employees: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch employees".to_string(),
+            ));
+        }
+    };
+
+    let mut response = HttpResponse::Ok();
+
+    // Paged requests also report the filtered total and the keyset cursor
+    if let Some(limit) = limit {
+        #[derive(QueryableByName)]
+        struct Count {
+            #[diesel(sql_type = BigInt)]
+            count: i64,
+        }
+
+        let total: Result<Count, _> = diesel::sql_query(format!(
+            "SELECT COUNT(*) AS count FROM employees {}",
+            EMPLOYEE_FILTER
+        ))
+        .bind::<Nullable<Text>, _>(department)
+        .bind::<Nullable<Text>, _>(designation)
+        .bind::<Nullable<Text>, _>(status)
+        .bind::<Nullable<Text>, _>(&pattern)
+        .get_result(&mut conn);
+
+        match total {
+            Ok(total) => {
+                response.insert_header(("X-Total-Count", total.count.to_string()));
+            }
+            Err(e) => eprintln!("Error counting employees: {}", e),
+        }
+        if rows.len() as i64 == limit {
+            if let Some(last) = rows.last() {
+                response.insert_header(("X-Next-Cursor", last.emp_id.to_string()));
+            }
+        }
+    }
+
+    let employees: Vec<Employee> = rows.into_iter().map(Employee::from).collect();
+    json_with_etag(&req, response, &ApiResponse::success(
+        "Employees retrieved successfully".to_string(),
+        employees,
+    ))
+}
+
+// Ranked free-text lookup over name, email, phone and designation. A row
+// matches if the query is a substring of its search text or is similar to a
+// run of words in it (typos); exact field matches rank first, then similarity.
+pub async fn search_employees(
+    req: HttpRequest,
+    pool: web::Data<DbPool>,
+    query: web::Query<EmployeeSearchQuery>,
+) -> HttpResponse {
+    let q = match query.q.as_deref().map(str::trim).filter(|q| !q.is_empty()) {
+        Some(q) => q.to_string(),
+        None => {
+            return HttpResponse::BadRequest().json(ApiResponse::<()>::error(
+                "Search query (q) is required".to_string(),
+            ));
+        }
+    };
+    let pattern = search_text_pattern(&q);
+    let limit = query.limit.unwrap_or(DEFAULT_SEARCH_LIMIT).clamp(1, MAX_SEARCH_LIMIT);
+
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    let sql = format!(
+        "SELECT emp_id, first_name, last_name, email, phone, department, designation, joining_date, status, created_at, updated_at \
+         FROM employees \
+         WHERE ({text} ILIKE $2 OR $1 <% {text}) \
+           AND ($3::text IS NULL OR department = $3) \
+           AND ($4::text IS NULL OR designation = $4) \
+           AND ($5::text IS NULL OR status = $5) \
+         ORDER BY lower($1) IN (lower(first_name), lower(last_name), lower(first_name || ' ' || last_name), \
+                                lower(COALESCE(email, '')), COALESCE(phone, '')) DESC, \
+                  word_similarity($1, {text}) DESC, \
+                  emp_id \
+         LIMIT $6",
+        text = SEARCH_TEXT
+    );
+
+    // The threshold is scoped to this transaction, leaving pooled connections untouched
+    let result = conn.transaction::<Vec<EmployeeRow>, diesel::result::Error, _>(|conn| {
+        diesel::sql_query("SELECT set_config('pg_trgm.word_similarity_threshold', $1, true)")
+            .bind::<Text, _>(SEARCH_SIMILARITY_THRESHOLD)
+            .execute(conn)?;
+        diesel::sql_query(sql.as_str())
+            .bind::<Text, _>(&q)
+            .bind::<Text, _>(&pattern)
+            .bind::<Nullable<Text>, _>(non_empty(&query.department))
+            .bind::<Nullable<Text>, _>(non_empty(&query.designation))
+            .bind::<Nullable<Text>, _>(non_empty(&query.status))
+            .bind::<BigInt, _>(limit)
+            .load(conn)
+    });
+
     match result {
         Ok(rows) => {
             let employees: Vec<Employee> = rows.into_iter().map(Employee::from).collect();
-            HttpResponse::Ok().json(ApiResponse::success(
-                "Employees retrieved successfully".to_string(),
+            json_with_etag(&req, HttpResponse::Ok(), &ApiResponse::success(
+                "Employees found".to_string(),
                 employees,
             ))
         }
         Err(e) => {
-            eprintln!("Error fetching employees: {}", e);
+            eprintln!("Error searching employees: {}", e);
+            HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to search employees".to_string(),
+            ))
+        }
+    }
+}
+
+pub async fn get_employee_stats(req: HttpRequest, pool: web::Data<DbPool>) -> HttpResponse {
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    #[derive(QueryableByName)]
+    struct Counts {
+        #[diesel(sql_type = BigInt)]
+        total: i64,
+        #[diesel(sql_type = BigInt)]
+        active: i64,
+    }
+
+    #[derive(QueryableByName)]
+    struct Value {
+        #[diesel(sql_type = Text)]
+        value: String,
+    }
+
+    let counts: Result<Counts, _> = diesel::sql_query(
+        "SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE status = 'Active') AS active FROM employees"
+    )
+    .get_result(&mut conn);
+
+    let departments: Result<Vec<Value>, _> = diesel::sql_query(
+        "SELECT DISTINCT department AS value FROM employees WHERE department IS NOT NULL AND department <> '' ORDER BY 1"
+    )
+    .load(&mut conn);
+
+    let designations: Result<Vec<Value>, _> = diesel::sql_query(
+        "SELECT DISTINCT designation AS value FROM employees WHERE designation IS NOT NULL AND designation <> '' ORDER BY 1"
+    )
+    .load(&mut conn);
+
+    match (counts, departments, designations) {
+        (Ok(counts), Ok(departments), Ok(designations)) => {
+            json_with_etag(&req, HttpResponse::Ok(), &ApiResponse::success(
+                "Employee stats retrieved successfully".to_string(),
+                EmployeeStats {
+                    total: counts.total,
+                    active: counts.active,
+                    departments: departments.into_iter().map(|v| v.value).collect(),
+                    designations: designations.into_iter().map(|v| v.value).collect(),
+                },
+            ))
+        }
+        (Err(e), _, _) | (_, Err(e), _) | (_, _, Err(e)) => {
+            eprintln!("Error fetching employee stats: {}", e);
+            HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch employee stats".to_string(),
+            ))
+        }
+    }
+}
+
+pub async fn get_employee_changes(
+    pool: web::Data<DbPool>,
+    query: web::Query<ChangesQuery>,
+) -> HttpResponse {
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    #[derive(QueryableByName)]
+    struct AsOf {
+        #[diesel(sql_type = Timestamp)]
+        as_of: NaiveDateTime,
+    }
+
+    #[derive(QueryableByName)]
+    struct Tombstone {
+        #[diesel(sql_type = Integer)]
+        emp_id: i32,
+    }
+
+    // Every change up to `as_of` is included; clients pass it back as `since`
+    let as_of: Result<AsOf, _> = diesel::sql_query("SELECT NOW()::timestamp AS as_of")
+        .get_result(&mut conn);
+
+    let as_of = match as_of {
+        Ok(row) => row.as_of,
+        Err(e) => {
+            eprintln!("Error reading database clock: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch employee changes".to_string(),
+            ));
+        }
+    };
+
+    // Without `since` this is a full snapshot for the client's initial load
+    let upserts: Result<Vec<EmployeeRow>, _> = diesel::sql_query(
+        "SELECT emp_id, first_name, last_name, email, phone, department, designation, joining_date, status, created_at, updated_at FROM employees WHERE ($1::timestamp IS NULL OR updated_at > $1) AND updated_at <= $2 ORDER BY emp_id"
+    )
+    .bind::<Nullable<Timestamp>, _>(&query.since)
+    .bind::<Timestamp, _>(&as_of)
+    .load(&mut conn);
+
+    let deleted: Result<Vec<Tombstone>, _> = match query.since {
+        Some(since) => diesel::sql_query(
+            "SELECT emp_id FROM employee_tombstones WHERE deleted_at > $1 AND deleted_at <= $2 ORDER BY emp_id"
+        )
+        .bind::<Timestamp, _>(&since)
+        .bind::<Timestamp, _>(&as_of)
+        .load(&mut conn),
+        None => Ok(Vec::new()),
+    };
+
+    match (upserts, deleted) {
+        (Ok(upserts), Ok(deleted)) => {
+            HttpResponse::Ok().json(ApiResponse::success(
+                "Employee changes retrieved successfully".to_string(),
+                EmployeeChanges {
+                    as_of,
+                    upserts: upserts.into_iter().map(Employee::from).collect(),
+                    deleted: deleted.into_iter().map(|t| t.emp_id).collect(),
+                },
+            ))
+        }
+        (Err(e), _) | (_, Err(e)) => {
+            eprintln!("Error fetching employee changes: {}", e);
+            HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch employee changes".to_string(),
+            ))
+        }
+    }
+}
+
+// One row per (employee, history entry); history columns are NULL for
+// employees without history
+#[derive(QueryableByName)]
+struct EmployeeHistoryJoinRow {
+    #[diesel(embed)]
+    employee: EmployeeRow,
+    #[diesel(sql_type = Nullable<Integer>)]
+    history_id: Option<i32>,
+    #[diesel(sql_type = Nullable<Text>)]
+    company_name: Option<String>,
+    #[diesel(sql_type = Nullable<Date>)]
+    start_date: Option<NaiveDate>,
+    #[diesel(sql_type = Nullable<Date>)]
+    end_date: Option<NaiveDate>,
+    #[diesel(sql_type = Nullable<Text>)]
+    position: Option<String>,
+    #[diesel(sql_type = Nullable<Timestamp>)]
+    history_created_at: Option<NaiveDateTime>,
+}
+
+const MAX_BATCH_IDS: usize = 1000;
+
+pub async fn get_employees_batch(
+    pool: web::Data<DbPool>,
+    query: web::Query<BatchQuery>,
+    body: web::Json<EmployeeBatchRequest>,
+) -> HttpResponse {
+    let mut ids = body.into_inner().ids;
+    ids.sort_unstable();
+    ids.dedup();
+    if ids.len() > MAX_BATCH_IDS {
+        return HttpResponse::PayloadTooLarge().json(ApiResponse::<()>::error(
+            format!("At most {} ids per batch", MAX_BATCH_IDS),
+        ));
+    }
+
+    let include_history = query
+        .include
+        .as_deref()
+        .map(|include| include.split(',').any(|part| part.trim() == "history"))
+        .unwrap_or(false);
+
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    let result: Result<Vec<EmployeeWithHistory>, _> = if include_history {
+        // A single join over the emp_id index replaces one history request per employee
+        diesel::sql_query(
+            "SELECT e.emp_id, e.first_name, e.last_name, e.email, e.phone, e.department, e.designation, e.joining_date, e.status, e.created_at, e.updated_at, \
+             h.history_id, h.company_name, h.start_date, h.end_date, h.position, h.created_at AS history_created_at \
+             FROM employees e LEFT JOIN employment_history h ON h.emp_id = e.emp_id \
+             WHERE e.emp_id = ANY($1) \
+             ORDER BY e.emp_id, h.start_date DESC"
+        )
+        .bind::<Array<Integer>, _>(&ids)
+        .load::<EmployeeHistoryJoinRow>(&mut conn)
+        .map(|rows| {
+            let mut employees: Vec<EmployeeWithHistory> = Vec::new();
+            for row in rows {
+                if employees.last().map(|e| e.employee.emp_id) != Some(row.employee.emp_id) {
+                    employees.push(EmployeeWithHistory {
+                        employee: Employee::from(row.employee),
+                        history: Some(Vec::new()),
+                    });
+                }
+                let current = employees.last_mut().expect("pushed above");
+                if let (Some(history_id), Some(company_name), Some(created_at)) =
+                    (row.history_id, row.company_name, row.history_created_at)
+                {
+                    current.history.get_or_insert_with(Vec::new).push(EmploymentHistory {
+                        history_id,
+                        emp_id: current.employee.emp_id,
+                        company_name,
+                        start_date: row.start_date,
+                        end_date: row.end_date,
+                        role: row.position, // Map position (DB) to role (API)
+                        payslip_pdf_path: None,
+                        created_at,
+                    });
+                }
+            }
+            employees
+        })
+    } else {
+        diesel::sql_query(
+            "SELECT emp_id, first_name, last_name, email, phone, department, designation, joining_date, status, created_at, updated_at FROM employees WHERE emp_id = ANY($1) ORDER BY emp_id"
+        )
+        .bind::<Array<Integer>, _>(&ids)
+        .load::<EmployeeRow>(&mut conn)
+        .map(|rows| {
+            rows.into_iter()
+                .map(|row| EmployeeWithHistory { employee: Employee::from(row), history: None })
+                .collect()
+        })
+    };
+
+    match result {
+        Ok(employees) => HttpResponse::Ok().json(ApiResponse::success(
+            "Employees retrieved successfully".to_string(),
+            employees,
+        )),
+        Err(e) => {
+            eprintln!("Error fetching employee batch: {}", e);
             HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
                 "Failed to fetch employees".to_string(),
             ))
@@ -94,6 +559,7 @@ pub async fn get_employees(pool: web::Data<DbPool>) -> HttpResponse {
 }
 
 pub async fn get_employee(
+    req: HttpRequest,
     pool: web::Data<DbPool>,
     path: web::Path<i32>,
 ) -> HttpResponse {
@@ -117,7 +583,7 @@ pub async fn get_employee(
     match result {
         Ok(row) => {
             let employee = Employee::from(row);
-            HttpResponse::Ok().json(ApiResponse::success(
+            json_with_etag(&req, HttpResponse::Ok(), &ApiResponse::success(
                 "Employee retrieved successfully".to_string(),
                 employee,
             ))
@@ -194,6 +660,187 @@ pub async fn create_employee(
     }
 }
 
+const MAX_BULK_ROWS: usize = 1000;
+
+pub async fn bulk_create_employees(
+    pool: web::Data<DbPool>,
+    employees: web::Json<Vec<EmployeeCreate>>,
+    admin_id: i32,
+) -> HttpResponse {
+    let employees = employees.into_inner();
+    if employees.len() > MAX_BULK_ROWS {
+        return HttpResponse::PayloadTooLarge().json(ApiResponse::<()>::error(
+            format!("At most {} employees per batch", MAX_BULK_ROWS),
+        ));
+    }
+
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    // Validate every row up front; bad rows are reported, good rows still go in
+    let mut errors = Vec::new();
+    let mut indices = Vec::new();
+    let mut first_names = Vec::new();
+    let mut last_names = Vec::new();
+    let mut emails = Vec::new();
+    let mut phones = Vec::new();
+    let mut departments = Vec::new();
+    let mut designations = Vec::new();
+    let mut joining_dates = Vec::new();
+    let mut statuses = Vec::new();
+
+    for (index, emp) in employees.into_iter().enumerate() {
+        if emp.first_name.trim().is_empty() || emp.last_name.trim().is_empty() {
+            errors.push(BulkRowError { index, error: "First name and last name are required".to_string() });
+            continue;
+        }
+        let joining_date = match emp.joining_date.as_deref().filter(|d| !d.is_empty()) {
+            Some(d) => match NaiveDate::parse_from_str(d, "%Y-%m-%d") {
+                Ok(date) => Some(date),
+                Err(_) => {
+                    errors.push(BulkRowError { index, error: format!("Invalid joining date: {}", d) });
+                    continue;
+                }
+            },
+            None => None,
+        };
+
+        indices.push(index);
+        first_names.push(emp.first_name);
+        last_names.push(emp.last_name);
+        emails.push(emp.email);
+        phones.push(emp.phone);
+        departments.push(emp.department);
+        designations.push(emp.designation);
+        joining_dates.push(joining_date);
+        statuses.push(emp.status.filter(|s| !s.is_empty()).unwrap_or_else(|| "Active".to_string()));
+    }
+
+    #[derive(QueryableByName)]
+    struct InsertedRow {
+        #[diesel(sql_type = Integer)]
+        ord: i32,
+        #[diesel(sql_type = Integer)]
+        emp_id: i32,
+    }
+
+    #[derive(QueryableByName)]
+    struct EmpId {
+        #[diesel(sql_type = Integer)]
+        emp_id: i32,
+    }
+
+    let mut inserted = Vec::new();
+    if !indices.is_empty() {
+        let result = conn.transaction::<(Vec<BulkInserted>, Vec<BulkRowError>), diesel::result::Error, _>(|conn| {
+            // One multi-row INSERT for the whole batch, under a savepoint. Ids
+            // are drawn per input ordinal before inserting, so each one maps
+            // back to its row whatever order the rows are written in.
+            let batch = conn.transaction::<Vec<InsertedRow>, diesel::result::Error, _>(|conn| {
+                diesel::sql_query(
+                    "WITH input AS ( \
+                         SELECT nextval(pg_get_serial_sequence('employees', 'emp_id'))::int AS emp_id, t.* \
+                         FROM UNNEST($1::text[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[], $7::date[], $8::text[]) \
+                         WITH ORDINALITY AS t(first_name, last_name, email, phone, department, designation, joining_date, status, ord) \
+                     ), ins AS ( \
+                         INSERT INTO employees (emp_id, first_name, last_name, email, phone, department, designation, joining_date, status) \
+                         SELECT emp_id, first_name, last_name, email, phone, department, designation, joining_date, status FROM input \
+                         RETURNING emp_id \
+                     ) \
+                     SELECT input.ord::int AS ord, ins.emp_id FROM ins JOIN input USING (emp_id)"
+                )
+                .bind::<Array<Text>, _>(&first_names)
+                .bind::<Array<Text>, _>(&last_names)
+                .bind::<Array<Nullable<Text>>, _>(&emails)
+                .bind::<Array<Nullable<Text>>, _>(&phones)
+                .bind::<Array<Nullable<Text>>, _>(&departments)
+                .bind::<Array<Nullable<Text>>, _>(&designations)
+                .bind::<Array<Nullable<Date>>, _>(&joining_dates)
+                .bind::<Array<Text>, _>(&statuses)
+                .load(conn)
+            });
+
+            let mut batch_inserted = Vec::new();
+            let mut row_errors = Vec::new();
+            match batch {
+                Ok(rows) => {
+                    batch_inserted = rows
+                        .into_iter()
+                        .map(|row| BulkInserted { index: indices[row.ord as usize - 1], emp_id: row.emp_id })
+                        .collect();
+                }
+                Err(diesel::result::Error::DatabaseError(_, _)) => {
+                    // Some row violates a constraint: insert row by row, each
+                    // under its own savepoint, so failures map to their input row
+                    for (i, &index) in indices.iter().enumerate() {
+                        let row = conn.transaction::<EmpId, diesel::result::Error, _>(|conn| {
+                            diesel::sql_query(
+                                "INSERT INTO employees (first_name, last_name, email, phone, department, designation, joining_date, status) VALUES ($1, $2, $3, $4, $5, $6, $7, $8) RETURNING emp_id"
+                            )
+                            .bind::<Text, _>(&first_names[i])
+                            .bind::<Text, _>(&last_names[i])
+                            .bind::<Nullable<Text>, _>(&emails[i])
+                            .bind::<Nullable<Text>, _>(&phones[i])
+                            .bind::<Nullable<Text>, _>(&departments[i])
+                            .bind::<Nullable<Text>, _>(&designations[i])
+                            .bind::<Nullable<Date>, _>(&joining_dates[i])
+                            .bind::<Text, _>(&statuses[i])
+                            .get_result(conn)
+                        });
+                        match row {
+                            Ok(id) => batch_inserted.push(BulkInserted { index, emp_id: id.emp_id }),
+                            Err(diesel::result::Error::DatabaseError(_, info)) => {
+                                row_errors.push(BulkRowError { index, error: info.message().to_string() });
+                            }
+                            Err(e) => return Err(e),
+                        }
+                    }
+                }
+                Err(e) => return Err(e),
+            }
+
+            // A single audit entry for the whole batch
+            if !batch_inserted.is_empty() {
+                create_audit_log(
+                    conn,
+                    admin_id,
+                    None,
+                    "BULK_CREATE_EMPLOYEES",
+                    Some(&format!("Bulk imported {} employees", batch_inserted.len())),
+                )?;
+            }
+            Ok((batch_inserted, row_errors))
+        });
+
+        match result {
+            Ok((mut batch_inserted, row_errors)) => {
+                batch_inserted.sort_by_key(|row| row.index);
+                inserted = batch_inserted;
+                errors.extend(row_errors);
+                errors.sort_by_key(|row| row.index);
+            }
+            Err(e) => {
+                eprintln!("Error bulk creating employees: {}", e);
+                return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                    "Failed to create employees".to_string(),
+                ));
+            }
+        }
+    }
+
+    HttpResponse::Ok().json(ApiResponse::success(
+        format!("Created {} employees, {} rows rejected", inserted.len(), errors.len()),
+        BulkCreateResult { inserted, errors },
+    ))
+}
+
 pub async fn update_employee(
     pool: web::Data<DbPool>,
     path: web::Path<i32>,
@@ -315,11 +962,24 @@ pub async fn delete_employee(
     .bind::<Integer, _>(&emp_id)
     .get_result(&mut conn);
 
-    let result = diesel::sql_query(
-        "DELETE FROM employees WHERE emp_id = $1"
-    )
-    .bind::<Integer, _>(&emp_id)
-    .execute(&mut conn);
+    // Delete and record the tombstone atomically so the change feed never
+    // misses a deletion
+    let result = conn.transaction::<usize, diesel::result::Error, _>(|conn| {
+        let rows_affected = diesel::sql_query(
+            "DELETE FROM employees WHERE emp_id = $1"
+        )
+        .bind::<Integer, _>(&emp_id)
+        .execute(conn)?;
+
+        if rows_affected > 0 {
+            diesel::sql_query(
+                "INSERT INTO employee_tombstones (emp_id) VALUES ($1) ON CONFLICT (emp_id) DO UPDATE SET deleted_at = NOW()"
+            )
+            .bind::<Integer, _>(&emp_id)
+            .execute(conn)?;
+        }
+        Ok(rows_affected)
+    });
 
     match result {
         Ok(rows_affected) => {
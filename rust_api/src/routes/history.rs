@@ -6,14 +6,14 @@
 //  Unauthorized removal of this header is prohibited.
 // ================================================================
 
-use actix_web::{web, HttpResponse};
+use actix_web::{web, HttpRequest, HttpResponse};
 use chrono::NaiveDate;
 use diesel::prelude::*;
-use diesel::sql_types::{Integer, Text, Nullable, Date, Timestamp};
+use diesel::sql_types::{BigInt, Double, Integer, Text, Nullable, Date, Timestamp};
 
 use crate::db::DbPool;
 use crate::models::*;
-use crate::routes::create_audit_log;
+use crate::routes::{create_audit_log, json_with_etag};
 
 #[derive(QueryableByName)]
 struct EmploymentHistoryRow {
@@ -49,6 +49,7 @@ impl From<EmploymentHistoryRow> for EmploymentHistory {
 }
 
 pub async fn get_employment_history(
+    req: HttpRequest,
     pool: web::Data<DbPool>,
     path: web::Path<i32>,
 ) -> HttpResponse {
@@ -72,7 +73,7 @@ pub async fn get_employment_history(
     match result {
         Ok(rows) => {
             let history: Vec<EmploymentHistory> = rows.into_iter().map(EmploymentHistory::from).collect();
-            HttpResponse::Ok().json(ApiResponse::success(
+            json_with_etag(&req, HttpResponse::Ok(), &ApiResponse::success(
                 "Employment history retrieved successfully".to_string(),
                 history,
             ))
@@ -86,6 +87,104 @@ pub async fn get_employment_history(
     }
 }
 
+// Employees with more prior employers than this are counted in the last bucket
+const PRIOR_JOBS_BUCKETS: i64 = 5;
+const TOP_PRIOR_COMPANIES: i64 = 10;
+
+// Prior-employment aggregates over the whole employment_history table
+pub async fn get_employment_history_stats(req: HttpRequest, pool: web::Data<DbPool>) -> HttpResponse {
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    #[derive(QueryableByName)]
+    struct Totals {
+        #[diesel(sql_type = BigInt)]
+        employees_with_history: i64,
+        #[diesel(sql_type = BigInt)]
+        records: i64,
+        #[diesel(sql_type = Nullable<Double>)]
+        avg_prior_tenure_months: Option<f64>,
+    }
+
+    #[derive(QueryableByName)]
+    struct Bucket {
+        #[diesel(sql_type = BigInt)]
+        jobs: i64,
+        #[diesel(sql_type = BigInt)]
+        employees: i64,
+    }
+
+    #[derive(QueryableByName)]
+    struct Company {
+        #[diesel(sql_type = Text)]
+        company_name: String,
+        #[diesel(sql_type = BigInt)]
+        employees: i64,
+    }
+
+    let totals: Result<Totals, _> = diesel::sql_query(
+        "SELECT COUNT(DISTINCT emp_id) AS employees_with_history, COUNT(*) AS records, \
+            (AVG(end_date - start_date) FILTER (WHERE end_date >= start_date) / 30.4375)::float8 AS avg_prior_tenure_months \
+         FROM employment_history"
+    )
+    .get_result(&mut conn);
+
+    let buckets: Result<Vec<Bucket>, _> = diesel::sql_query(
+        "SELECT LEAST(jobs, $1) AS jobs, COUNT(*) AS employees \
+         FROM (SELECT COUNT(*) AS jobs FROM employment_history GROUP BY emp_id) per_employee \
+         GROUP BY 1 ORDER BY 1"
+    )
+    .bind::<BigInt, _>(PRIOR_JOBS_BUCKETS)
+    .load(&mut conn);
+
+    let companies: Result<Vec<Company>, _> = diesel::sql_query(
+        "SELECT company_name, COUNT(DISTINCT emp_id) AS employees FROM employment_history \
+         GROUP BY company_name ORDER BY 2 DESC, 1 LIMIT $1"
+    )
+    .bind::<BigInt, _>(TOP_PRIOR_COMPANIES)
+    .load(&mut conn);
+
+    match (totals, buckets, companies) {
+        (Ok(totals), Ok(buckets), Ok(companies)) => {
+            let avg_prior_jobs = if totals.employees_with_history > 0 {
+                Some(totals.records as f64 / totals.employees_with_history as f64)
+            } else {
+                None
+            };
+            json_with_etag(&req, HttpResponse::Ok(), &ApiResponse::success(
+                "Employment history stats retrieved successfully".to_string(),
+                EmploymentHistoryStats {
+                    employees_with_history: totals.employees_with_history,
+                    records: totals.records,
+                    avg_prior_jobs,
+                    avg_prior_tenure_months: totals.avg_prior_tenure_months,
+                    prior_jobs: buckets
+                        .into_iter()
+                        .map(|b| PriorJobsBucket { jobs: b.jobs, employees: b.employees })
+                        .collect(),
+                    top_companies: companies
+                        .into_iter()
+                        .map(|c| PriorCompany { company_name: c.company_name, employees: c.employees })
+                        .collect(),
+                },
+            ))
+        }
+        (Err(e), _, _) | (_, Err(e), _) | (_, _, Err(e)) => {
+            eprintln!("Error fetching employment history stats: {}", e);
+            HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch employment history stats".to_string(),
+            ))
+        }
+    }
+}
+
 pub async fn add_employment_history(
     pool: web::Data<DbPool>,
     path: web::Path<i32>,
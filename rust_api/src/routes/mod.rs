@@ -6,16 +6,22 @@
 //  Unauthorized removal of this header is prohibited.
 // ================================================================
 
+pub mod audit;
 pub mod auth;
 pub mod employee;
 pub mod history;
 pub mod payslip;
 
-use actix_web::web;
+use actix_web::http::header::{ACCEPT, ETAG, IF_NONE_MATCH};
+use actix_web::{web, HttpRequest, HttpResponse, HttpResponseBuilder};
 use crate::db::DbPool;
 use crate::models::*;
 use chrono::NaiveDateTime;
 use diesel::prelude::*;
+use serde::Serialize;
+use std::collections::hash_map::DefaultHasher;
+use std::hash::{Hash, Hasher};
+use std::sync::Arc;
 
 // Helper function to create audit log
 pub fn create_audit_log(
@@ -36,3 +42,124 @@ pub fn create_audit_log(
     Ok(())
 }
 
+
+// Whether the request's If-None-Match lists `etag` (weak comparison) or "*"
+pub fn if_none_match(req: &HttpRequest, etag: &str) -> bool {
+    req.headers()
+        .get(IF_NONE_MATCH)
+        .and_then(|value| value.to_str().ok())
+        .map(|value| value.split(',').any(|tag| {
+            let tag = tag.trim();
+            tag == "*" || tag.trim_start_matches("W/") == etag.trim_start_matches("W/")
+        }))
+        .unwrap_or(false)
+}
+
+// Helper to send a JSON body with an ETag, answering 304 Not Modified when the
+// client's If-None-Match already matches so unchanged data is not re-sent
+pub fn json_with_etag<T: Serialize>(
+    req: &HttpRequest,
+    mut builder: HttpResponseBuilder,
+    body: &T,
+) -> HttpResponse {
+    let bytes = match serde_json::to_vec(body) {
+        Ok(bytes) => bytes,
+        Err(e) => {
+            eprintln!("Error serializing response: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to serialize response".to_string(),
+            ));
+        }
+    };
+
+    let mut hasher = DefaultHasher::new();
+    bytes.hash(&mut hasher);
+    let etag = format!("\"{:016x}-{:x}\"", hasher.finish(), bytes.len());
+
+    if if_none_match(req, &etag) {
+        return HttpResponse::NotModified()
+            .insert_header((ETAG, etag))
+            .finish();
+    }
+
+    builder
+        .insert_header((ETAG, etag))
+        .content_type("application/json")
+        .body(bytes)
+}
+
+
+// Keyset cursor for listings ordered by (timestamp, id) descending, sent to
+// clients as "<timestamp>|<id>" of the last row seen
+pub type TimestampCursor = (NaiveDateTime, i32);
+
+pub fn parse_timestamp_cursor(cursor: &str) -> Option<TimestampCursor> {
+    let (timestamp, id) = cursor.split_once('|')?;
+    let timestamp = NaiveDateTime::parse_from_str(timestamp, "%Y-%m-%dT%H:%M:%S%.f").ok()?;
+    Some((timestamp, id.parse().ok()?))
+}
+
+pub fn format_timestamp_cursor(timestamp: &NaiveDateTime, id: i32) -> String {
+    format!("{}|{}", timestamp.format("%Y-%m-%dT%H:%M:%S%.f"), id)
+}
+
+
+pub const NDJSON_CONTENT_TYPE: &str = "application/x-ndjson";
+
+// Rows fetched from the database per streamed chunk
+pub const STREAM_CHUNK_ROWS: i64 = 500;
+
+// True when the client asked for newline-delimited JSON instead of one JSON document
+pub fn wants_ndjson(req: &HttpRequest) -> bool {
+    req.headers()
+        .get(ACCEPT)
+        .and_then(|value| value.to_str().ok())
+        .map(|value| value.contains(NDJSON_CONTENT_TYPE))
+        .unwrap_or(false)
+}
+
+// Helper to stream a listing as NDJSON (one JSON object per line). `fetch` loads
+// one keyset page after `cursor` and returns the rows plus the next cursor (None
+// when done), so only one page is ever held in memory. Each page runs on the
+// blocking thread pool with its own pooled connection.
+pub fn ndjson_stream<T, C, F>(pool: web::Data<DbPool>, first: C, fetch: F) -> HttpResponse
+where
+    T: Serialize + 'static,
+    C: Send + 'static,
+    F: Fn(&mut PgConnection, &C) -> QueryResult<(Vec<T>, Option<C>)> + Send + Sync + 'static,
+{
+    let fetch = Arc::new(fetch);
+    let stream = futures_util::stream::unfold(Some(first), move |cursor| {
+        let pool = pool.clone();
+        let fetch = fetch.clone();
+        async move {
+            let cursor = cursor?;
+            let page = web::block(move || -> Result<(Vec<u8>, Option<C>), String> {
+                let mut conn = pool.get().map_err(|e| e.to_string())?;
+                let (rows, next) = fetch(&mut conn, &cursor).map_err(|e| e.to_string())?;
+                let mut chunk = Vec::new();
+                for row in &rows {
+                    serde_json::to_writer(&mut chunk, row).map_err(|e| e.to_string())?;
+                    chunk.push(b'\n');
+                }
+                Ok((chunk, next))
+            })
+            .await
+            .map_err(|e| e.to_string())
+            .and_then(|page| page);
+
+            match page {
+                Ok((chunk, next)) => Some((Ok(web::Bytes::from(chunk)), next)),
+                Err(e) => {
+                    // Abort the response so the client sees a broken stream, not a short one
+                    eprintln!("Error streaming rows: {}", e);
+                    Some((Err(std::io::Error::new(std::io::ErrorKind::Other, e)), None))
+                }
+            }
+        }
+    });
+
+    HttpResponse::Ok()
+        .content_type(NDJSON_CONTENT_TYPE)
+        .streaming(stream)
+}
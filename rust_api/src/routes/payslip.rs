@@ -6,17 +6,355 @@
 //  Unauthorized removal of this header is prohibited.
 // ================================================================
 
-use actix_web::{web, HttpResponse, Result};
+use actix_web::http::header::{
+    ACCEPT_ENCODING, ACCEPT_RANGES, CONTENT_ENCODING, CONTENT_RANGE, ETAG, IF_RANGE, RANGE, VARY,
+};
+use actix_web::{web, HttpRequest, HttpResponse, Result};
 use actix_multipart::Multipart;
+use chrono::{Datelike, Months, NaiveDate, NaiveDateTime, Utc};
+use diesel::prelude::*;
+use diesel::sql_types::{BigInt, Date, Integer, Nullable, Text, Timestamp};
 use futures_util::TryStreamExt;
-use std::fs;
-use std::io::Write;
-use std::path::Path;
+use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
+use std::collections::{BTreeSet, HashSet};
+use std::fs::{self, File, OpenOptions};
+use std::io::{self, Read, Write};
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
 use uuid::Uuid;
 
+use crate::blob_store::{self, StoredBlob};
 use crate::db::DbPool;
-use crate::models::ApiResponse;
-use crate::routes::create_audit_log;
+use crate::models::{ApiResponse, Payslip, PayslipQuery, PayslipUploadCreate, PayslipUploadStatus};
+use crate::routes::{
+    create_audit_log, format_timestamp_cursor, if_none_match, parse_timestamp_cursor,
+    TimestampCursor,
+};
+
+// Per-employee payslip files from before the blob store (moved into it at startup)
+const PAYSLIP_DIR: &str = "./uploads/payslips";
+// Uploads in progress: <uuid>.upload for multipart uploads; resumable upload
+// sessions as <upload_id>.json (metadata) and <upload_id>.part (bytes so far)
+const INCOMING_DIR: &str = "./uploads/payslips/.incoming";
+const ALLOWED_EXTENSIONS: [&str; 5] = ["pdf", "xlsx", "xls", "docx", "doc"];
+// Abandoned resumable uploads are removed at startup after this many days
+const UPLOAD_SESSION_MAX_AGE_DAYS: i64 = 7;
+// Bytes read per chunk when streaming or hashing files
+const FILE_CHUNK_BYTES: usize = 64 * 1024;
+const DEFAULT_PAGE_SIZE: i64 = 100;
+const MAX_PAGE_SIZE: i64 = 1000;
+
+#[derive(QueryableByName)]
+struct PayslipRow {
+    #[diesel(sql_type = Integer)]
+    payslip_id: i32,
+    #[diesel(sql_type = Integer)]
+    emp_id: i32,
+    #[diesel(sql_type = Text)]
+    filename: String,
+    #[diesel(sql_type = Nullable<Text>)]
+    original_filename: Option<String>,
+    #[diesel(sql_type = BigInt)]
+    size_bytes: i64,
+    #[diesel(sql_type = Text)]
+    mime_type: String,
+    #[diesel(sql_type = Text)]
+    checksum: String,
+    #[diesel(sql_type = Nullable<Date>)]
+    pay_period: Option<NaiveDate>,
+    #[diesel(sql_type = Timestamp)]
+    uploaded_at: NaiveDateTime,
+}
+
+impl From<PayslipRow> for Payslip {
+    fn from(row: PayslipRow) -> Self {
+        Payslip {
+            path: format!("/payslip/{}", row.filename),
+            payslip_id: row.payslip_id,
+            emp_id: row.emp_id,
+            filename: row.filename,
+            original_filename: row.original_filename,
+            size: row.size_bytes,
+            mime_type: row.mime_type,
+            checksum: row.checksum,
+            pay_period: row.pay_period,
+            uploaded_at: row.uploaded_at,
+        }
+    }
+}
+
+#[derive(QueryableByName)]
+struct PayslipEmpRow {
+    #[diesel(sql_type = Integer)]
+    emp_id: i32,
+}
+
+#[derive(QueryableByName)]
+struct PayslipBlobRow {
+    #[diesel(sql_type = Integer)]
+    emp_id: i32,
+    #[diesel(sql_type = Text)]
+    checksum: String,
+    #[diesel(sql_type = Nullable<Text>)]
+    encoding: Option<String>,
+    #[diesel(sql_type = BigInt)]
+    size_bytes: i64,
+}
+
+#[derive(QueryableByName)]
+struct PayslipFilenameRow {
+    #[diesel(sql_type = Text)]
+    filename: String,
+}
+
+// Determine content type based on file extension
+fn payslip_content_type(filename: &str) -> &'static str {
+    match Path::new(filename)
+        .extension()
+        .and_then(|e| e.to_str())
+        .map(|e| e.to_lowercase())
+        .as_deref()
+    {
+        Some("pdf") => "application/pdf",
+        Some("xlsx") => "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        Some("xls") => "application/vnd.ms-excel",
+        Some("docx") => "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        Some("doc") => "application/msword",
+        _ => "application/octet-stream",
+    }
+}
+
+// Parse a pay period given as "YYYY-MM" or "YYYY-MM-DD" into the first day of its month
+fn parse_pay_period(value: &str) -> Option<NaiveDate> {
+    let value = value.trim();
+    let date = NaiveDate::parse_from_str(value, "%Y-%m-%d")
+        .or_else(|_| NaiveDate::parse_from_str(&format!("{}-01", value), "%Y-%m-%d"))
+        .ok()?;
+    date.with_day(1)
+}
+
+fn insert_payslip(
+    conn: &mut PgConnection,
+    emp_id: i32,
+    filename: &str,
+    original_filename: Option<&str>,
+    size: i64,
+    checksum: &str,
+    pay_period: Option<NaiveDate>,
+    uploaded_at: Option<NaiveDateTime>,
+) -> QueryResult<PayslipRow> {
+    diesel::sql_query(
+        "INSERT INTO payslips (emp_id, filename, original_filename, size_bytes, mime_type, checksum, pay_period, uploaded_at) \
+         VALUES ($1, $2, $3, $4, $5, $6, $7, COALESCE($8, NOW())) \
+         RETURNING payslip_id, emp_id, filename, original_filename, size_bytes, mime_type, checksum, pay_period, uploaded_at",
+    )
+    .bind::<Integer, _>(emp_id)
+    .bind::<Text, _>(filename)
+    .bind::<Nullable<Text>, _>(original_filename)
+    .bind::<BigInt, _>(size)
+    .bind::<Text, _>(payslip_content_type(filename))
+    .bind::<Text, _>(checksum)
+    .bind::<Nullable<Date>, _>(pay_period)
+    .bind::<Nullable<Timestamp>, _>(uploaded_at)
+    .get_result(conn)
+}
+
+// Move payslip files stored per employee (uploads/payslips/<emp_id>/) before
+// the blob store existed into it, adding metadata rows for files that were
+// never indexed. Runs at startup; a source file is only removed once its blob
+// and row are recorded, so an interrupted run is simply repeated.
+pub fn migrate_legacy_payslips(pool: &DbPool) {
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Payslip migration: database connection error: {}", e);
+            return;
+        }
+    };
+
+    let indexed: HashSet<String> = match diesel::sql_query("SELECT filename FROM payslips")
+        .load::<PayslipFilenameRow>(&mut conn)
+    {
+        Ok(rows) => rows.into_iter().map(|row| row.filename).collect(),
+        Err(e) => {
+            eprintln!("Payslip migration: failed to load payslips: {}", e);
+            return;
+        }
+    };
+
+    let (mut moved, mut added) = (0, 0);
+    for dir in fs::read_dir(PAYSLIP_DIR).into_iter().flatten().flatten() {
+        let emp_id: i32 = match dir.file_name().to_str().and_then(|name| name.parse().ok()) {
+            Some(emp_id) => emp_id,
+            None => continue,
+        };
+        for entry in fs::read_dir(dir.path()).into_iter().flatten().flatten() {
+            let filename = match entry.file_name().to_str() {
+                Some(name) if !name.ends_with(".partial") => name.to_string(),
+                _ => continue,
+            };
+            let metadata = match entry.metadata() {
+                Ok(metadata) if metadata.is_file() => metadata,
+                _ => continue,
+            };
+            let blob = match file_checksum(&entry.path()).and_then(|checksum| {
+                blob_store::store_blob(&entry.path(), &checksum, metadata.len(), &file_extension(&filename), false)
+            }) {
+                Ok(blob) => blob,
+                Err(e) => {
+                    eprintln!("Payslip migration: skipped {}: {}", filename, e);
+                    continue;
+                }
+            };
+
+            let recorded = if indexed.contains(&filename) {
+                blob_store::upsert_blob(&mut conn, &blob).map(|_| false)
+            } else {
+                let uploaded_at = metadata
+                    .modified()
+                    .ok()
+                    .map(|time| chrono::DateTime::<Utc>::from(time).naive_utc());
+                conn.transaction::<_, diesel::result::Error, _>(|conn| {
+                    blob_store::upsert_blob(conn, &blob)?;
+                    insert_payslip(conn, emp_id, &filename, None, blob.size as i64, &blob.checksum, None, uploaded_at)
+                })
+                .map(|_| true)
+            };
+
+            match recorded {
+                Ok(new_row) => {
+                    let _ = fs::remove_file(entry.path());
+                    moved += 1;
+                    if new_row {
+                        added += 1;
+                    }
+                }
+                // Fails for files of deleted employees; those stay where they are
+                Err(e) => eprintln!("Payslip migration: skipped {}: {}", filename, e),
+            }
+        }
+        let _ = fs::remove_dir(dir.path());
+    }
+
+    if moved > 0 {
+        // Rows recorded before their blob was registered were never counted
+        if let Err(e) = blob_store::reconcile_ref_counts(&mut conn) {
+            eprintln!("Payslip migration: failed to recount blob references: {}", e);
+        }
+        eprintln!("Payslip migration: moved {} files into the blob store ({} newly indexed)", moved, added);
+    }
+}
+
+// Lowercase extension of an uploaded file name (files without one are treated as PDF)
+fn file_extension(filename: &str) -> String {
+    Path::new(filename)
+        .extension()
+        .and_then(|ext| ext.to_str())
+        .map(|ext| ext.to_lowercase())
+        .unwrap_or_else(|| "pdf".to_string())
+}
+
+fn unsupported_file_type() -> HttpResponse {
+    HttpResponse::BadRequest().json(ApiResponse::<()>::error(
+        "Unsupported file type. Allowed: PDF, Excel (.xlsx, .xls), Word (.docx, .doc)".to_string(),
+    ))
+}
+
+// SHA-256 of a file on disk, read in chunks
+fn file_checksum(path: &Path) -> io::Result<String> {
+    let mut file = File::open(path)?;
+    let mut hasher = Sha256::new();
+    let mut buffer = vec![0; FILE_CHUNK_BYTES];
+    loop {
+        let read = file.read(&mut buffer)?;
+        if read == 0 {
+            break;
+        }
+        hasher.update(&buffer[..read]);
+    }
+    Ok(format!("{:x}", hasher.finalize()))
+}
+
+// Insert a payslip pointing at `blob` and its audit entry in one transaction.
+// The blob row is registered first; the payslips trigger counts the reference.
+fn record_payslip(
+    conn: &mut PgConnection,
+    admin_id: i32,
+    emp_id: i32,
+    filename: &str,
+    original_filename: Option<&str>,
+    blob: &StoredBlob,
+    pay_period: Option<NaiveDate>,
+) -> QueryResult<PayslipRow> {
+    conn.transaction(|conn| {
+        blob_store::upsert_blob(conn, blob)?;
+        // The blob was reused just as it was being collected
+        if !blob_store::blob_exists(blob) {
+            return Err(diesel::result::Error::NotFound);
+        }
+        let row = insert_payslip(conn, emp_id, filename, original_filename, blob.size as i64, &blob.checksum, pay_period, None)?;
+        create_audit_log(
+            conn,
+            admin_id,
+            Some(emp_id),
+            "UPLOAD_PAYSLIP",
+            Some(&format!("Uploaded payslip: {}", filename)),
+        )?;
+        Ok(row)
+    })
+}
+
+// Put a blob this request created, but could not record, on the collection
+// list instead of deleting it (a concurrent upload may already be reusing it)
+fn release_unrecorded_blob(conn: &mut PgConnection, blob: &StoredBlob) {
+    if blob.created {
+        if let Err(e) = blob_store::upsert_blob(conn, blob) {
+            eprintln!("Error releasing blob {}: {}", blob.checksum, e);
+        }
+    }
+}
+
+// Move a fully received upload into the blob store and record the payslip.
+// Runs on the blocking thread pool (compression and database I/O); errors are
+// the message for the client.
+async fn store_payslip(
+    pool: web::Data<DbPool>,
+    admin_id: i32,
+    emp_id: i32,
+    source: PathBuf,
+    original_filename: String,
+    size: u64,
+    checksum: String,
+    pay_period: Option<NaiveDate>,
+    move_source: bool,
+) -> std::result::Result<PayslipRow, &'static str> {
+    let stored = web::block(move || {
+        let extension = file_extension(&original_filename);
+        let blob = blob_store::store_blob(&source, &checksum, size, &extension, move_source).map_err(|e| {
+            eprintln!("Error storing payslip: {}", e);
+            "Failed to store file"
+        })?;
+
+        let mut conn = pool.get().map_err(|e| {
+            eprintln!("Database connection error: {}", e);
+            "Database connection failed"
+        })?;
+
+        let fname = format!("{}.{}", Uuid::new_v4(), extension);
+        record_payslip(&mut conn, admin_id, emp_id, &fname, Some(&original_filename), &blob, pay_period).map_err(|e| {
+            eprintln!("Error recording payslip: {}", e);
+            release_unrecorded_blob(&mut conn, &blob);
+            "Failed to record payslip"
+        })
+    })
+    .await;
+
+    stored.unwrap_or_else(|e| {
+        eprintln!("Error storing payslip: {}", e);
+        Err("Failed to store file")
+    })
+}
 
 pub async fn upload_payslip(
     pool: web::Data<DbPool>,
@@ -26,179 +364,790 @@ pub async fn upload_payslip(
 ) -> Result<HttpResponse> {
     let emp_id = path.into_inner();
     
-    // Create directory for employee payslips
-    let upload_dir = format!("./uploads/payslips/{}", emp_id);
-    fs::create_dir_all(&upload_dir).map_err(|e| {
+    // Files are received into the staging directory, then moved into the blob store
+    fs::create_dir_all(INCOMING_DIR).map_err(|e| {
         eprintln!("Error creating directory: {}", e);
         actix_web::error::ErrorInternalServerError("Failed to create upload directory")
     })?;
 
-    let mut filename = None;
-    let mut file_data = Vec::new();
+    // (staging path, original filename, size, checksum) of the received file
+    let mut received: Option<(PathBuf, String, u64, String)> = None;
+    let mut pay_period_text = String::new();
 
     // Process multipart form data
     while let Some(mut field) = payload.try_next().await? {
         let content_disposition = field.content_disposition();
         
         if let Some(name) = content_disposition.get_name() {
-            if name == "file" {
+            if name == "pay_period" {
+                while let Some(chunk) = field.try_next().await? {
+                    pay_period_text.push_str(&String::from_utf8_lossy(&chunk));
+                }
+            } else if name == "file" && received.is_none() {
                 if let Some(original_filename) = content_disposition.get_filename() {
-                    // Get file extension and validate it's a supported format
-                    let file_extension = Path::new(original_filename)
-                        .extension()
-                        .and_then(|ext| ext.to_str())
-                        .map(|ext| ext.to_lowercase())
-                        .unwrap_or_else(|| "pdf".to_string());
-                    
                     // Validate file type (PDF, Excel, Word)
-                    let allowed_extensions = ["pdf", "xlsx", "xls", "docx", "doc"];
-                    if !allowed_extensions.contains(&file_extension.as_str()) {
-                        return Ok(HttpResponse::BadRequest().json(ApiResponse::<()>::error(
-                            format!("Unsupported file type. Allowed: PDF, Excel (.xlsx, .xls), Word (.docx, .doc)").to_string(),
-                        )));
+                    let file_extension = file_extension(original_filename);
+                    if !ALLOWED_EXTENSIONS.contains(&file_extension.as_str()) {
+                        return Ok(unsupported_file_type());
                     }
                     
-                    let unique_filename = format!("{}.{}", Uuid::new_v4(), file_extension);
-                    filename = Some(unique_filename.clone());
+                    let original_filename = original_filename.to_string();
+                    let staging_path = Path::new(INCOMING_DIR).join(format!("{}.upload", Uuid::new_v4()));
+                    let mut file = File::create(&staging_path).map_err(|e| {
+                        eprintln!("Error creating file: {}", e);
+                        actix_web::error::ErrorInternalServerError("Failed to create file")
+                    })?;
                     
-                    // Read file data
-                    while let Some(chunk) = field.try_next().await? {
-                        file_data.extend_from_slice(&chunk);
+                    // Write chunks to disk as they arrive instead of buffering the file
+                    let mut hasher = Sha256::new();
+                    let mut size = 0u64;
+                    loop {
+                        let chunk = match field.try_next().await {
+                            Ok(Some(chunk)) => chunk,
+                            Ok(None) => break,
+                            Err(e) => {
+                                let _ = fs::remove_file(&staging_path);
+                                return Err(e.into());
+                            }
+                        };
+                        hasher.update(&chunk);
+                        size += chunk.len() as u64;
+                        if let Err(e) = file.write_all(&chunk) {
+                            eprintln!("Error writing file: {}", e);
+                            let _ = fs::remove_file(&staging_path);
+                            return Err(actix_web::error::ErrorInternalServerError("Failed to write file"));
+                        }
                     }
+                    received = Some((staging_path, original_filename, size, format!("{:x}", hasher.finalize())));
                 }
             }
         }
     }
 
-    if let Some(ref fname) = filename {
-        let file_path = format!("{}/{}", upload_dir, fname);
-        
-        // Write file to disk
-        let mut file = fs::File::create(&file_path).map_err(|e| {
-            eprintln!("Error creating file: {}", e);
-            actix_web::error::ErrorInternalServerError("Failed to create file")
-        })?;
-        
-        file.write_all(&file_data).map_err(|e| {
-            eprintln!("Error writing file: {}", e);
-            actix_web::error::ErrorInternalServerError("Failed to write file")
-        })?;
+    let (staging_path, original_filename, size, checksum) = match received {
+        Some(received) => received,
+        None => {
+            return Ok(HttpResponse::BadRequest().json(ApiResponse::<()>::error(
+                "No file provided".to_string(),
+            )));
+        }
+    };
 
-        // Update database with file path
-        let mut conn = pool.get().map_err(|e| {
-            eprintln!("Database connection error: {}", e);
-            actix_web::error::ErrorInternalServerError("Database connection failed")
-        })?;
+    let pay_period = if pay_period_text.trim().is_empty() {
+        None
+    } else {
+        match parse_pay_period(&pay_period_text) {
+            Some(period) => Some(period),
+            None => {
+                let _ = fs::remove_file(&staging_path);
+                return Ok(HttpResponse::BadRequest().json(ApiResponse::<()>::error(
+                    "Invalid pay_period. Use YYYY-MM".to_string(),
+                )));
+            }
+        }
+    };
 
-        // Store file path in employment_history or create a separate record
-        // For simplicity, we'll store it in a new table or update existing history
-        // Here we'll just log it in audit and return success
-        
-        // Create audit log
-        let _ = create_audit_log(
-            &mut conn,
-            admin_id,
-            Some(emp_id),
-            "UPLOAD_PAYSLIP",
-            Some(&format!("Uploaded payslip: {}", fname)),
-        );
+    let stored = store_payslip(
+        pool, admin_id, emp_id, staging_path.clone(), original_filename, size, checksum, pay_period, true,
+    )
+    .await;
+    // Still there when the blob was compressed or already stored
+    let _ = fs::remove_file(&staging_path);
 
-        Ok(HttpResponse::Ok().json(ApiResponse::success(
+    match stored {
+        Ok(row) => Ok(HttpResponse::Ok().json(ApiResponse::success(
             "Payslip uploaded successfully".to_string(),
-            serde_json::json!({
-                "filename": fname,
-                "path": file_path,
-                "size": file_data.len()
-            }),
-        )))
+            Payslip::from(row),
+        ))),
+        Err(message) => Ok(HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+            message.to_string(),
+        ))),
+    }
+}
+
+// ---- Resumable uploads ----
+//
+// POST /employees/{id}/payslip/uploads opens a session for a file of known
+// size. The client then PUTs consecutive chunks to /payslip_uploads/{id} with
+// an Upload-Offset header; after a dropped connection it asks GET for the
+// offset the server has and continues from there. The payslip is recorded
+// when the last byte arrives.
+
+#[derive(Serialize, Deserialize)]
+struct UploadSession {
+    emp_id: i32,
+    filename: String,
+    size: u64,
+    pay_period: Option<NaiveDate>,
+    created_at: NaiveDateTime,
+}
+
+// Metadata and data paths of a session. Only ids we issued (UUIDs) are
+// accepted, so an id can never point outside INCOMING_DIR.
+fn session_paths(upload_id: &str) -> Option<(PathBuf, PathBuf)> {
+    let id = Uuid::parse_str(upload_id).ok()?;
+    let dir = Path::new(INCOMING_DIR);
+    Some((dir.join(format!("{}.json", id)), dir.join(format!("{}.part", id))))
+}
+
+fn load_session(upload_id: &str) -> Option<(UploadSession, PathBuf, PathBuf)> {
+    let (meta_path, part_path) = session_paths(upload_id)?;
+    let session = serde_json::from_slice(&fs::read(&meta_path).ok()?).ok()?;
+    Some((session, meta_path, part_path))
+}
+
+fn upload_status(upload_id: &str, session: &UploadSession, offset: u64) -> PayslipUploadStatus {
+    PayslipUploadStatus {
+        upload_id: upload_id.to_string(),
+        emp_id: session.emp_id,
+        filename: session.filename.clone(),
+        size: session.size,
+        offset,
+    }
+}
+
+fn upload_not_found() -> HttpResponse {
+    HttpResponse::NotFound().json(ApiResponse::<()>::error("Upload not found".to_string()))
+}
+
+// Sessions (by .part path) with a request appending to them. The offset
+// check and the append happen under this lock, so a retried chunk sent while
+// the first request is still streaming cannot append the same bytes twice.
+static ACTIVE_UPLOADS: Mutex<BTreeSet<PathBuf>> = Mutex::new(BTreeSet::new());
+
+// Exclusive claim on one session, released when dropped
+struct UploadLock(PathBuf);
+
+impl UploadLock {
+    fn acquire(part_path: &Path) -> Option<UploadLock> {
+        let mut active = ACTIVE_UPLOADS.lock().unwrap_or_else(|e| e.into_inner());
+        if active.insert(part_path.to_path_buf()) {
+            Some(UploadLock(part_path.to_path_buf()))
+        } else {
+            None
+        }
+    }
+}
+
+impl Drop for UploadLock {
+    fn drop(&mut self) {
+        ACTIVE_UPLOADS.lock().unwrap_or_else(|e| e.into_inner()).remove(&self.0);
+    }
+}
+
+fn upload_busy(upload_id: &str, session: &UploadSession, part_path: &Path) -> HttpResponse {
+    let offset = fs::metadata(part_path).map(|m| m.len()).unwrap_or(0);
+    HttpResponse::Conflict().json(ApiResponse {
+        status: "error".to_string(),
+        message: "Another request is writing to this upload".to_string(),
+        data: Some(upload_status(upload_id, session, offset)),
+    })
+}
+
+// Remove resumable uploads abandoned for longer than UPLOAD_SESSION_MAX_AGE_DAYS
+// and multipart uploads left behind by an interrupted server
+pub fn remove_stale_uploads() {
+    let cutoff = Utc::now().naive_utc() - chrono::Duration::days(UPLOAD_SESSION_MAX_AGE_DAYS);
+    for entry in fs::read_dir(INCOMING_DIR).into_iter().flatten().flatten() {
+        let name = entry.file_name().to_string_lossy().to_string();
+        if name.ends_with(".upload") {
+            let _ = fs::remove_file(entry.path());
+        } else if let Some(upload_id) = name.strip_suffix(".json") {
+            match load_session(upload_id) {
+                Some((session, meta_path, part_path)) if session.created_at < cutoff => {
+                    let _ = fs::remove_file(part_path);
+                    let _ = fs::remove_file(meta_path);
+                }
+                _ => {}
+            }
+        }
+    }
+}
+
+pub async fn create_payslip_upload(
+    pool: web::Data<DbPool>,
+    path: web::Path<i32>,
+    body: web::Json<PayslipUploadCreate>,
+) -> HttpResponse {
+    let emp_id = path.into_inner();
+
+    if !ALLOWED_EXTENSIONS.contains(&file_extension(&body.filename).as_str()) {
+        return unsupported_file_type();
+    }
+    let pay_period = match body.pay_period.as_deref().map(str::trim).filter(|p| !p.is_empty()) {
+        Some(text) => match parse_pay_period(text) {
+            Some(period) => Some(period),
+            None => return bad_request("Invalid pay_period. Use YYYY-MM"),
+        },
+        None => None,
+    };
+    if body.size == 0 {
+        return bad_request("Upload size must be greater than zero");
+    }
+
+    // Refuse before any bytes are sent rather than when recording the payslip
+    let exists = pool.get().ok().map(|mut conn| {
+        diesel::sql_query("SELECT emp_id FROM employees WHERE emp_id = $1")
+            .bind::<Integer, _>(emp_id)
+            .get_result::<PayslipEmpRow>(&mut conn)
+            .optional()
+    });
+    match exists {
+        Some(Ok(Some(_))) => {}
+        Some(Ok(None)) => {
+            return HttpResponse::NotFound().json(ApiResponse::<()>::error(
+                "Employee not found".to_string(),
+            ));
+        }
+        _ => {
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to check employee".to_string(),
+            ));
+        }
+    }
+
+    let upload_id = Uuid::new_v4().to_string();
+    let session = UploadSession {
+        emp_id,
+        filename: body.filename.clone(),
+        size: body.size,
+        pay_period,
+        created_at: Utc::now().naive_utc(),
+    };
+    let (meta_path, part_path) = match session_paths(&upload_id) {
+        Some(paths) => paths,
+        None => return upload_not_found(),
+    };
+
+    let created = fs::create_dir_all(INCOMING_DIR)
+        .and_then(|_| File::create(&part_path))
+        .and_then(|_| {
+            let meta = serde_json::to_vec(&session).map_err(std::io::Error::from)?;
+            fs::write(&meta_path, meta)
+        });
+    if let Err(e) = created {
+        eprintln!("Error creating upload session: {}", e);
+        let _ = fs::remove_file(&part_path);
+        return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+            "Failed to create upload".to_string(),
+        ));
+    }
+
+    HttpResponse::Ok().json(ApiResponse::success(
+        "Upload created".to_string(),
+        upload_status(&upload_id, &session, 0),
+    ))
+}
+
+pub async fn get_payslip_upload(path: web::Path<String>) -> HttpResponse {
+    let upload_id = path.into_inner();
+    match load_session(&upload_id) {
+        Some((session, _, part_path)) => {
+            let offset = fs::metadata(&part_path).map(|m| m.len()).unwrap_or(0);
+            HttpResponse::Ok().json(ApiResponse::success(
+                "Upload status".to_string(),
+                upload_status(&upload_id, &session, offset),
+            ))
+        }
+        None => upload_not_found(),
+    }
+}
+
+pub async fn append_payslip_upload(
+    req: HttpRequest,
+    pool: web::Data<DbPool>,
+    path: web::Path<String>,
+    mut body: web::Payload,
+    admin_id: i32,
+) -> Result<HttpResponse> {
+    let upload_id = path.into_inner();
+    let (session, meta_path, part_path) = match load_session(&upload_id) {
+        Some(found) => found,
+        None => return Ok(upload_not_found()),
+    };
+    // Held until the response is built, including storing the finished file
+    let _lock = match UploadLock::acquire(&part_path) {
+        Some(lock) => lock,
+        None => return Ok(upload_busy(&upload_id, &session, &part_path)),
+    };
+    // The request that held the lock may have just finished the upload
+    if !meta_path.exists() {
+        return Ok(upload_not_found());
+    }
+
+    let mut offset = fs::metadata(&part_path).map(|m| m.len()).unwrap_or(0);
+    let client_offset = req
+        .headers()
+        .get("Upload-Offset")
+        .and_then(|value| value.to_str().ok())
+        .and_then(|value| value.trim().parse::<u64>().ok());
+    if client_offset != Some(offset) {
+        // The client is out of sync (e.g. a retried chunk); tell it where to resume
+        return Ok(HttpResponse::Conflict().json(ApiResponse {
+            status: "error".to_string(),
+            message: "Upload-Offset does not match the received size".to_string(),
+            data: Some(upload_status(&upload_id, &session, offset)),
+        }));
+    }
+
+    let mut file = OpenOptions::new().append(true).open(&part_path).map_err(|e| {
+        eprintln!("Error opening upload: {}", e);
+        actix_web::error::ErrorInternalServerError("Failed to open upload")
+    })?;
+
+    // Bytes are appended as they arrive; whatever was written before a dropped
+    // connection stays and is reported as the resume offset
+    while let Some(chunk) = body.try_next().await? {
+        if offset + chunk.len() as u64 > session.size {
+            return Ok(bad_request("Chunk exceeds the declared upload size"));
+        }
+        file.write_all(&chunk).map_err(|e| {
+            eprintln!("Error writing upload: {}", e);
+            actix_web::error::ErrorInternalServerError("Failed to write upload")
+        })?;
+        offset += chunk.len() as u64;
+    }
+    drop(file);
+
+    if offset < session.size {
+        return Ok(HttpResponse::Ok().json(ApiResponse::success(
+            "Chunk received".to_string(),
+            upload_status(&upload_id, &session, offset),
+        )));
+    }
+
+    // Last byte received: store the file and record it. The data is copied
+    // rather than moved so an empty PUT at the final offset can retry.
+    let checksum = file_checksum(&part_path).map_err(|e| {
+        eprintln!("Error reading upload: {}", e);
+        actix_web::error::ErrorInternalServerError("Failed to read upload")
+    })?;
+
+    match store_payslip(
+        pool,
+        admin_id,
+        session.emp_id,
+        part_path.clone(),
+        session.filename.clone(),
+        session.size,
+        checksum,
+        session.pay_period,
+        false,
+    )
+    .await
+    {
+        Ok(row) => {
+            let _ = fs::remove_file(&part_path);
+            let _ = fs::remove_file(&meta_path);
+            Ok(HttpResponse::Ok().json(ApiResponse::success(
+                "Payslip uploaded successfully".to_string(),
+                Payslip::from(row),
+            )))
+        }
+        Err(message) => Ok(HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+            message.to_string(),
+        ))),
+    }
+}
+
+pub async fn cancel_payslip_upload(path: web::Path<String>) -> HttpResponse {
+    let upload_id = path.into_inner();
+    match load_session(&upload_id) {
+        Some((session, meta_path, part_path)) => {
+            let _lock = match UploadLock::acquire(&part_path) {
+                Some(lock) => lock,
+                None => return upload_busy(&upload_id, &session, &part_path),
+            };
+            let _ = fs::remove_file(&part_path);
+            let _ = fs::remove_file(meta_path);
+            HttpResponse::Ok().json(ApiResponse::success(
+                "Upload cancelled".to_string(),
+                serde_json::json!({"upload_id": upload_id}),
+            ))
+        }
+        None => upload_not_found(),
+    }
+}
+
+// ---- Downloads ----
+
+// Parse a single "bytes=" Range header against a file of `len` bytes.
+// Ok(None) serves the whole file (no usable range, e.g. multiple ranges);
+// Err(()) means the range lies outside the file.
+fn parse_range(header: &str, len: u64) -> std::result::Result<Option<(u64, u64)>, ()> {
+    let spec = match header.trim().strip_prefix("bytes=") {
+        Some(spec) if !spec.contains(',') => spec.trim(),
+        _ => return Ok(None),
+    };
+    let (start, end) = match spec.split_once('-') {
+        Some(bounds) => bounds,
+        None => return Ok(None),
+    };
+
+    if start.is_empty() {
+        // Suffix range: the last `end` bytes
+        let suffix: u64 = match end.parse() {
+            Ok(suffix) => suffix,
+            Err(_) => return Ok(None),
+        };
+        if suffix == 0 || len == 0 {
+            return Err(());
+        }
+        return Ok(Some((len.saturating_sub(suffix), len - 1)));
+    }
+
+    let start: u64 = match start.parse() {
+        Ok(start) => start,
+        Err(_) => return Ok(None),
+    };
+    let end: u64 = if end.is_empty() {
+        u64::MAX
     } else {
-        Ok(HttpResponse::BadRequest().json(ApiResponse::<()>::error(
-            "No file provided".to_string(),
-        )))
+        match end.parse() {
+            Ok(end) => end,
+            Err(_) => return Ok(None),
+        }
+    };
+    if start >= len || start > end {
+        return Err(());
     }
+    Ok(Some((start, end.min(len - 1))))
+}
+
+// Stream `remaining` bytes from `reader` in FILE_CHUNK_BYTES chunks, each read
+// on the blocking thread pool, so a download never holds the file in memory
+fn reader_stream<R: Read + Send + 'static>(
+    reader: R,
+    remaining: u64,
+) -> impl futures_util::Stream<Item = std::result::Result<web::Bytes, std::io::Error>> {
+    futures_util::stream::unfold(Some((reader, remaining)), |state| async move {
+        let (mut reader, remaining) = state?;
+        if remaining == 0 {
+            return None;
+        }
+        let want = remaining.min(FILE_CHUNK_BYTES as u64) as usize;
+        let read = web::block(move || {
+            let mut buffer = vec![0; want];
+            let read = reader.read(&mut buffer)?;
+            buffer.truncate(read);
+            Ok::<_, std::io::Error>((reader, buffer))
+        })
+        .await;
+
+        match read {
+            Ok(Ok((reader, buffer))) if !buffer.is_empty() => {
+                let left = remaining - buffer.len() as u64;
+                Some((Ok(web::Bytes::from(buffer)), Some((reader, left))))
+            }
+            Ok(Ok(_)) => Some((
+                Err(std::io::Error::new(std::io::ErrorKind::UnexpectedEof, "file ended early")),
+                None,
+            )),
+            Ok(Err(e)) => Some((Err(e), None)),
+            Err(e) => Some((Err(std::io::Error::new(std::io::ErrorKind::Other, e.to_string())), None)),
+        }
+    })
+}
+
+// Per-employee file of a payslip not (yet) moved into the blob store
+fn legacy_payslip_path(filename: &str, emp_id: Option<i32>) -> Option<PathBuf> {
+    if let Some(path) = emp_id
+        .map(|emp_id| Path::new(PAYSLIP_DIR).join(emp_id.to_string()).join(filename))
+        .filter(|path| path.is_file())
+    {
+        return Some(path);
+    }
+
+    // Search in all subdirectories for files that are not indexed
+    fs::read_dir(PAYSLIP_DIR)
+        .ok()?
+        .flatten()
+        .filter(|entry| entry.path().is_dir())
+        .map(|entry| entry.path().join(filename))
+        .find(|path| path.is_file())
+}
+
+// Skip the first `start` bytes of a reader on the blocking thread pool
+// (compressed blobs cannot seek)
+async fn skip_bytes(reader: Box<dyn Read + Send>, start: u64) -> io::Result<Box<dyn Read + Send>> {
+    if start == 0 {
+        return Ok(reader);
+    }
+    web::block(move || {
+        let mut reader = reader;
+        let skipped = io::copy(&mut reader.by_ref().take(start), &mut io::sink())?;
+        if skipped < start {
+            return Err(io::Error::new(io::ErrorKind::UnexpectedEof, "file ended early"));
+        }
+        Ok(reader)
+    })
+    .await
+    .map_err(|e| io::Error::new(io::ErrorKind::Other, e.to_string()))?
+}
+
+// Whether Accept-Encoding allows a gzip response body
+fn accepts_gzip(req: &HttpRequest) -> bool {
+    req.headers()
+        .get(ACCEPT_ENCODING)
+        .and_then(|value| value.to_str().ok())
+        .map_or(false, |value| {
+            value.split(',').any(|coding| {
+                let mut parts = coding.split(';').map(str::trim);
+                parts.next() == Some("gzip")
+                    && parts.all(|param| !matches!(param, "q=0" | "q=0.0" | "q=0.00" | "q=0.000"))
+            })
+        })
 }
 
 pub async fn get_payslip(
+    req: HttpRequest,
+    pool: web::Data<DbPool>,
     path: web::Path<String>,
 ) -> Result<HttpResponse> {
     let filename = path.into_inner();
     
-    // Find file in payslips directory
-    let payslip_dir = "./uploads/payslips";
-    let file_path = format!("{}/{}", payslip_dir, filename);
-    
-    // Search in all subdirectories
-    let mut found_path = None;
-    if let Ok(entries) = fs::read_dir(payslip_dir) {
-        for entry in entries.flatten() {
-            if entry.path().is_dir() {
-                let potential_path = entry.path().join(&filename);
-                if potential_path.exists() {
-                    found_path = Some(potential_path);
-                    break;
-                }
+    // The metadata table points at the payslip's blob
+    let found = pool.get().ok().and_then(|mut conn| {
+        diesel::sql_query(
+            "SELECT p.emp_id, p.checksum, b.encoding, p.size_bytes \
+             FROM payslips p LEFT JOIN payslip_blobs b ON b.checksum = p.checksum \
+             WHERE p.filename = $1",
+        )
+        .bind::<Text, _>(&filename)
+        .get_result::<PayslipBlobRow>(&mut conn)
+        .optional()
+        .unwrap_or(None)
+    });
+
+    let read_error = |e: io::Error| {
+        eprintln!("Error reading file: {}", e);
+        actix_web::error::ErrorInternalServerError("Failed to read file")
+    };
+
+    // (stored file, its encoding, original length); files not yet moved into
+    // the blob store are served from the old per-employee directories
+    let blob = found.as_ref().and_then(|row| {
+        let encoding = match row.encoding.as_deref() {
+            Some(blob_store::GZIP) => blob_store::GZIP,
+            _ => blob_store::IDENTITY,
+        };
+        let path = blob_store::blob_path(&row.checksum, encoding);
+        path.is_file().then(|| (path, encoding, row.size_bytes as u64))
+    });
+    let (stored_path, encoding, len) = match blob {
+        Some(blob) => blob,
+        None => match legacy_payslip_path(&filename, found.as_ref().map(|row| row.emp_id)) {
+            Some(path) => {
+                let len = fs::metadata(&path).map(|m| m.len()).map_err(read_error)?;
+                (path, blob_store::IDENTITY, len)
             }
+            None => {
+                return Ok(HttpResponse::NotFound().json(ApiResponse::<()>::error(
+                    "Payslip not found".to_string(),
+                )));
+            }
+        },
+    };
+
+    // Blobs are immutable, so the checksum is a strong validator of the
+    // original bytes (legacy files without a metadata row get no ETag)
+    let etag = found.as_ref().map(|row| format!("\"{}\"", row.checksum));
+
+    // If-Range: send the range only while the client's partial copy is
+    // current (strong comparison; there is no Last-Modified to match a date)
+    let range_still_valid = req
+        .headers()
+        .get(IF_RANGE)
+        .map_or(true, |value| etag.is_some() && value.to_str().ok().map(str::trim) == etag.as_deref());
+    let range = req
+        .headers()
+        .get(RANGE)
+        .filter(|_| range_still_valid)
+        .and_then(|value| value.to_str().ok())
+        .map(|value| parse_range(value, len))
+        .unwrap_or(Ok(None));
+
+    // The gzip-encoded body is a different representation of the file, so it
+    // gets its own tag; ranges are always served from the decoded bytes
+    let send_gzip = matches!(range, Ok(None)) && encoding == blob_store::GZIP && accepts_gzip(&req);
+    let etag = if send_gzip {
+        found.as_ref().map(|row| format!("\"{}-gzip\"", row.checksum))
+    } else {
+        etag
+    };
+
+    if let Some(etag) = etag.as_deref().filter(|etag| if_none_match(&req, etag)) {
+        let mut not_modified = HttpResponse::NotModified();
+        not_modified.insert_header((ETAG, etag.to_string()));
+        if encoding == blob_store::GZIP {
+            not_modified.insert_header((VARY, "Accept-Encoding"));
         }
+        return Ok(not_modified.finish());
     }
-    
-    if let Some(path) = found_path {
-        let file_data = fs::read(&path).map_err(|e| {
-            eprintln!("Error reading file: {}", e);
-            actix_web::error::ErrorInternalServerError("Failed to read file")
-        })?;
-        
-        // Determine content type based on file extension
-        let content_type = if let Some(ext) = Path::new(&filename).extension().and_then(|e| e.to_str()) {
-            match ext.to_lowercase().as_str() {
-                "pdf" => "application/pdf",
-                "xlsx" => "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                "xls" => "application/vnd.ms-excel",
-                "docx" => "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                "doc" => "application/msword",
-                _ => "application/octet-stream",
+
+    let mut response = match range {
+        Ok(Some(_)) => HttpResponse::PartialContent(),
+        Ok(None) => HttpResponse::Ok(),
+        Err(()) => {
+            return Ok(HttpResponse::RangeNotSatisfiable()
+                .insert_header((CONTENT_RANGE, format!("bytes */{}", len)))
+                .finish());
+        }
+    };
+    response
+        .content_type(payslip_content_type(&filename))
+        .insert_header((ACCEPT_RANGES, "bytes"));
+    if let Some(etag) = etag {
+        response.insert_header((ETAG, etag));
+    }
+    if encoding == blob_store::GZIP {
+        response.insert_header((VARY, "Accept-Encoding"));
+    }
+
+    match range {
+        Ok(Some((start, end))) => {
+            // Ranges address the original bytes, so compressed blobs are decoded
+            let length = end - start + 1;
+            let reader = blob_store::open_blob(&stored_path, encoding).map_err(read_error)?;
+            let reader = skip_bytes(reader, start).await.map_err(read_error)?;
+            Ok(response
+                .insert_header((CONTENT_RANGE, format!("bytes {}-{}/{}", start, end, len)))
+                .no_chunking(length)
+                .streaming(reader_stream(reader, length)))
+        }
+        _ if send_gzip => {
+            // Send the stored bytes as they are and let the client decompress
+            let file = File::open(&stored_path).map_err(read_error)?;
+            let stored_len = file.metadata().map(|m| m.len()).map_err(read_error)?;
+            Ok(response
+                .insert_header((CONTENT_ENCODING, "gzip"))
+                .no_chunking(stored_len)
+                .streaming(reader_stream(file, stored_len)))
+        }
+        _ => {
+            let reader = blob_store::open_blob(&stored_path, encoding).map_err(read_error)?;
+            Ok(response.no_chunking(len).streaming(reader_stream(reader, len)))
+        }
+    }
+}
+
+// One keyset page of payslip metadata, newest upload first. Unset filters are
+// bound as NULL so one prepared statement covers every combination.
+fn load_payslips(
+    conn: &mut PgConnection,
+    emp_id: Option<i32>,
+    period_from: Option<NaiveDate>,
+    period_to: Option<NaiveDate>,
+    checksum: Option<&str>,
+    after: Option<TimestampCursor>,
+    limit: i64,
+) -> QueryResult<Vec<PayslipRow>> {
+    let (before_ts, before_id) = match after {
+        Some((ts, id)) => (Some(ts), Some(id)),
+        None => (None, None),
+    };
+
+    diesel::sql_query(
+        "SELECT payslip_id, emp_id, filename, original_filename, size_bytes, mime_type, checksum, pay_period, uploaded_at \
+         FROM payslips \
+         WHERE ($1::int IS NULL OR emp_id = $1) \
+            AND ($2::date IS NULL OR pay_period >= $2) \
+            AND ($3::date IS NULL OR pay_period < $3) \
+            AND ($4::timestamp IS NULL OR (uploaded_at <= $4 AND (uploaded_at, payslip_id) < ($4, $5))) \
+            AND ($7::text IS NULL OR checksum = $7) \
+         ORDER BY uploaded_at DESC, payslip_id DESC LIMIT $6",
+    )
+    .bind::<Nullable<Integer>, _>(emp_id)
+    .bind::<Nullable<Date>, _>(period_from)
+    .bind::<Nullable<Date>, _>(period_to)
+    .bind::<Nullable<Timestamp>, _>(before_ts)
+    .bind::<Nullable<Integer>, _>(before_id)
+    .bind::<BigInt, _>(limit)
+    .bind::<Nullable<Text>, _>(checksum)
+    .load(conn)
+}
+
+fn bad_request(message: &str) -> HttpResponse {
+    HttpResponse::BadRequest().json(ApiResponse::<()>::error(message.to_string()))
+}
+
+async fn payslip_listing(pool: web::Data<DbPool>, emp_id: Option<i32>, query: &PayslipQuery) -> HttpResponse {
+    // Periods are months: `period` is shorthand for from = to = period, and
+    // the inclusive `to` month becomes an exclusive bound on the next month
+    let parse = |value: &Option<String>| -> std::result::Result<Option<NaiveDate>, ()> {
+        match value.as_deref().map(str::trim).filter(|v| !v.is_empty()) {
+            Some(text) => parse_pay_period(text).map(Some).ok_or(()),
+            None => Ok(None),
+        }
+    };
+    let (period_from, period_to) = match (parse(&query.period), parse(&query.from), parse(&query.to)) {
+        (Ok(Some(period)), _, _) => (Some(period), Some(period)),
+        (Ok(None), Ok(from), Ok(to)) => (from, to),
+        _ => return bad_request("Invalid pay period. Use YYYY-MM"),
+    };
+    let period_end = period_to.and_then(|to| to.checked_add_months(Months::new(1)));
+
+    let after = match query.cursor.as_deref().filter(|c| !c.is_empty()) {
+        Some(cursor) => match parse_timestamp_cursor(cursor) {
+            Some(after) => Some(after),
+            None => return bad_request("Invalid cursor"),
+        },
+        None => None,
+    };
+
+    let mut conn = match pool.get() {
+        Ok(conn) => conn,
+        Err(e) => {
+            eprintln!("Database connection error: {}", e);
+            return HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Database connection failed".to_string(),
+            ));
+        }
+    };
+
+    let limit = query.limit.unwrap_or(DEFAULT_PAGE_SIZE).clamp(1, MAX_PAGE_SIZE);
+
+    let checksum = query.checksum.as_deref().map(str::trim).filter(|c| !c.is_empty());
+
+    match load_payslips(&mut conn, emp_id, period_from, period_end, checksum, after, limit) {
+        Ok(rows) => {
+            let mut response = HttpResponse::Ok();
+            if rows.len() as i64 == limit {
+                if let Some(last) = rows.last() {
+                    response.insert_header((
+                        "X-Next-Cursor",
+                        format_timestamp_cursor(&last.uploaded_at, last.payslip_id),
+                    ));
+                }
             }
-        } else {
-            "application/octet-stream"
-        };
-        
-        Ok(HttpResponse::Ok()
-            .content_type(content_type)
-            .body(file_data))
-    } else {
-        Ok(HttpResponse::NotFound().json(ApiResponse::<()>::error(
-            "Payslip not found".to_string(),
-        )))
+            let payslips: Vec<Payslip> = rows.into_iter().map(Payslip::from).collect();
+
+            response.json(ApiResponse::success(
+                "Payslips retrieved successfully".to_string(),
+                payslips,
+            ))
+        }
+        Err(e) => {
+            eprintln!("Error fetching payslips: {}", e);
+            HttpResponse::InternalServerError().json(ApiResponse::<()>::error(
+                "Failed to fetch payslips".to_string(),
+            ))
+        }
     }
 }
 
 pub async fn list_payslips(
     pool: web::Data<DbPool>,
     path: web::Path<i32>,
+    query: web::Query<PayslipQuery>,
 ) -> HttpResponse {
-    let emp_id = path.into_inner();
-    let payslip_dir = format!("./uploads/payslips/{}", emp_id);
-    
-    let mut payslips = Vec::new();
-    
-    if let Ok(entries) = fs::read_dir(&payslip_dir) {
-        for entry in entries.flatten() {
-            if let Ok(metadata) = entry.metadata() {
-                if metadata.is_file() {
-                    if let Some(file_name) = entry.file_name().to_str() {
-                        payslips.push(serde_json::json!({
-                            "filename": file_name,
-                            "size": metadata.len(),
-                            "path": format!("/payslip/{}", file_name)
-                        }));
-                    }
-                }
-            }
-        }
-    }
-    
-    HttpResponse::Ok().json(crate::models::ApiResponse::success(
-        "Payslips retrieved successfully".to_string(),
-        payslips,
-    ))
+    payslip_listing(pool, Some(path.into_inner()), &query).await
 }
 
+// Payslips across employees, e.g. every payslip for one pay period
+pub async fn search_payslips(
+    pool: web::Data<DbPool>,
+    query: web::Query<PayslipQuery>,
+) -> HttpResponse {
+    payslip_listing(pool, query.emp_id, &query).await
+}
@@ -0,0 +1,76 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Benchmark: Excel export engines
+
+Compares the constant-memory xlsxwriter path against the original
+openpyxl path on a synthetic roster. Reports wall time and peak Python
+heap (tracemalloc) for each engine.
+
+Usage:
+    python benchmarks/bench_excel_export.py [rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.export_utils import EXCEL_WRITERS, _employees_to_frame
+
+DEPARTMENTS = ["Engineering", "Sales", "Marketing", "Finance", "HR", "Operations"]
+DESIGNATIONS = ["Engineer", "Senior Engineer", "Manager", "Analyst", "Director"]
+
+
+def make_employees(count: int):
+    """Generate `count` synthetic employee rows shaped like the API output"""
+    return [
+        {
+            "emp_id": i,
+            "first_name": f"First{i}",
+            "last_name": f"Last{i}",
+            "email": f"employee{i}@company.com",
+            "phone": f"+1555{i:07d}",
+            "department": DEPARTMENTS[i % len(DEPARTMENTS)],
+            "designation": DESIGNATIONS[i % len(DESIGNATIONS)],
+            "joining_date": f"20{10 + i % 15}-0{1 + i % 9}-1{i % 10}",
+            "status": "Active" if i % 7 else "Inactive",
+            "created_at": "2025-01-01T09:00:00",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def run(engine: str, employees, out_dir: str):
+    """Build the frame and write it with `engine`; return (seconds, peak MiB, bytes)"""
+    filepath = os.path.join(out_dir, f"bench_{engine}.xlsx")
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = _employees_to_frame(employees)
+    EXCEL_WRITERS[engine](df, filepath)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), os.path.getsize(filepath)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 50_000]
+    print(f"{'rows':>8} {'engine':>11} {'seconds':>9} {'peak MiB':>9} {'file KiB':>9}")
+    with tempfile.TemporaryDirectory() as out_dir:
+        for size in sizes:
+            employees = make_employees(size)
+            for engine in ("openpyxl", "xlsxwriter"):
+                elapsed, peak_mib, size_bytes = run(engine, employees, out_dir)
+                print(f"{size:>8} {engine:>11} {elapsed:>9.2f} {peak_mib:>9.1f} {size_bytes / 1024:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Benchmark: roster DataFrame from JSON records vs the columnar snapshot
+
+For a synthetic roster, compares building a pandas DataFrame straight
+from the API records (object columns) with the snapshot layer: the first
+build that writes the Arrow file, a warm load that memory-maps a file
+another worker already wrote, and the pandas conversion. Reports seconds
+and the frame's deep memory usage.
+
+Usage:
+    python benchmarks/bench_roster_snapshot.py [rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from bench_excel_export import make_employees
+from utils import roster_snapshot
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    print(f"{'rows':>8} {'step':>22} {'seconds':>9} {'frame MiB':>10}")
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        roster_snapshot.ROSTER_SNAPSHOT_DIR = snapshot_dir
+        for size in sizes:
+            employees = make_employees(size)
+            for emp in employees:
+                emp["updated_at"] = emp["created_at"]
+
+            plain, elapsed = timed(lambda: pd.DataFrame(employees))
+            mib = plain.memory_usage(deep=True).sum() / (1024 * 1024)
+            print(f"{size:>8} {'DataFrame(records)':>22} {elapsed:>9.3f} {mib:>10.1f}")
+
+            _, elapsed = timed(lambda: roster_snapshot.load_roster_snapshot(employees))
+            print(f"{size:>8} {'snapshot build':>22} {elapsed:>9.3f}")
+
+            snapshot, elapsed = timed(lambda: roster_snapshot.load_roster_snapshot(employees))
+            print(f"{size:>8} {'snapshot mmap load':>22} {elapsed:>9.3f}")
+
+            frame, elapsed = timed(lambda: snapshot.frame)
+            mib = frame.memory_usage(deep=True).sum() / (1024 * 1024)
+            print(f"{size:>8} {'snapshot to pandas':>22} {elapsed:>9.3f} {mib:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Benchmark: cold start of the Streamlit app and its pages
+
+For each target (app.py and every page by default) the module-level
+imports of the script are run in a fresh interpreter under
+`python -X importtime`, the way a new container or a first page visit
+pays for them. Reports median wall time over RUNS interpreter starts
+(minus a bare interpreter), the total import time, which heavy
+libraries were loaded, and the slowest top-level imports. Also times
+the credit check app.py runs on every script run.
+
+Usage:
+    python benchmarks/bench_startup.py [pages/<page>.py | app.py ...]
+
+Set IMPORTTIME_LOG_DIR to keep each target's raw -X importtime output
+(e.g. for tuna or another import-time viewer).
+"""
+import ast
+import glob
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(APP_DIR)
+
+RUNS = int(os.getenv("STARTUP_BENCH_RUNS", "5"))
+TOP_IMPORTS = 6
+HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "docx", "fpdf", "openpyxl", "xlsxwriter"]
+
+
+def import_snippet(script: str) -> str:
+    """Module-level import statements of a page script (the part that runs before any UI)"""
+    with open(os.path.join(APP_DIR, script), encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join([f"import sys; sys.path.insert(0, {APP_DIR!r})"] + [ast.unparse(node) for node in imports])
+
+
+def run_python(args):
+    """Run a fresh interpreter in APP_DIR; return (seconds, stderr)"""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, *args], cwd=APP_DIR, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return elapsed, result.stderr
+
+
+def parse_importtime(log: str):
+    """(module, self us, cumulative us, depth) per line of -X importtime output"""
+    rows = []
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def bench_target(script: str, baseline: float, startup_modules):
+    """
+    Median wall ms above a bare interpreter, plus the top-level imports
+    (excluding interpreter startup) and all module names of the last run
+    """
+    snippet = import_snippet(script)
+    walls, log = [], ""
+    for _ in range(RUNS):
+        elapsed, log = run_python(["-X", "importtime", "-c", snippet])
+        walls.append(elapsed)
+
+    log_dir = os.getenv("IMPORTTIME_LOG_DIR")
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+        name = os.path.splitext(script.replace(os.sep, "_"))[0]
+        with open(os.path.join(log_dir, f"{name}.importtime.log"), "w") as f:
+            f.write(log)
+
+    rows = parse_importtime(log)
+    top_level = [row for row in rows if row[3] == 0 and row[0] not in startup_modules]
+    return (statistics.median(walls) - baseline) * 1000, top_level, {row[0] for row in rows}
+
+
+def bench_credit_check():
+    """(first call ms, later call ms) of verify_signature in this process"""
+    from utils.credit_lock import verify_signature
+
+    start = time.perf_counter()
+    verify_signature()
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(100):
+        verify_signature()
+    later = (time.perf_counter() - start) / 100
+    return first * 1000, later * 1000
+
+
+def main():
+    targets = sys.argv[1:] or ["app.py"] + sorted(
+        os.path.relpath(path, APP_DIR) for path in glob.glob(os.path.join(APP_DIR, "pages", "*.py"))
+    )
+    baseline = statistics.median(run_python(["-c", "pass"])[0] for _ in range(RUNS))
+    startup_modules = {row[0] for row in parse_importtime(run_python(["-X", "importtime", "-c", "pass"])[1])}
+    print(f"Bare interpreter: {baseline * 1000:.0f} ms (median of {RUNS}, subtracted below)\n")
+
+    print(f"{'target':<28} {'wall ms':>8} {'import ms':>10}  heavy modules loaded")
+    reports = []
+    for script in targets:
+        wall_ms, top_level, loaded = bench_target(script, baseline, startup_modules)
+        heavy = [module for module in HEAVY_MODULES if module in loaded]
+        import_ms = sum(cumulative for _, _, cumulative, _ in top_level) / 1000
+        print(f"{script:<28} {wall_ms:>8.0f} {import_ms:>10.0f}  {', '.join(heavy) or '-'}")
+        reports.append((script, top_level))
+
+    print("\nSlowest top-level imports (cumulative ms):")
+    for script, top_level in reports:
+        slowest = sorted(top_level, key=lambda row: row[2], reverse=True)[:TOP_IMPORTS]
+        print(f"  {script}: " + ", ".join(f"{name} {cumulative / 1000:.0f}" for name, _, cumulative, _ in slowest))
+
+    first_ms, later_ms = bench_credit_check()
+    print(f"\nverify_signature(): first call {first_ms:.2f} ms, later calls {later_ms * 1000:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
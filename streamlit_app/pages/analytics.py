@@ -0,0 +1,123 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Analytics Page - Headcount, hiring, tenure and prior employment
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.api_client import get_employment_history_stats
+from utils.auth import require_login, get_token
+from utils.roster_snapshot import get_roster_snapshot
+from utils.workforce_analytics import get_workforce_analytics
+from utils.footer import footer, sidebar_branding
+
+st.set_page_config(page_title="Analytics - EMS", page_icon="📈", layout="wide")
+
+# The API counts employees with this many prior jobs or more together
+PRIOR_JOBS_BUCKETS = 5
+
+require_login()
+
+# Add sidebar branding
+sidebar_branding()
+
+st.title("📈 Workforce Analytics")
+st.markdown("---")
+
+col1, col2 = st.columns([5, 1])
+with col2:
+    if st.button("← Dashboard", type="secondary", use_container_width=True):
+        st.switch_page("pages/dashboard.py")
+
+token = get_token()
+
+# Typed roster shared by all sessions; aggregates are cached per data version
+snapshot = get_roster_snapshot(token)
+if snapshot is None:
+    st.error("❌ Could not load employees. Please try again.")
+    footer()
+    st.stop()
+if not len(snapshot):
+    st.info("No employees found. Add your first employee!")
+    footer()
+    st.stop()
+
+analytics = get_workforce_analytics(snapshot)
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    st.metric("Total Employees", analytics["total"])
+with col2:
+    st.metric("Active Employees", analytics["active"])
+with col3:
+    median_tenure = analytics["median_tenure_years"]
+    st.metric("Median Tenure (Active)", f"{median_tenure:.1f} yrs" if median_tenure is not None else "N/A")
+with col4:
+    st.metric("Hires (Last 12 Months)", analytics["hires_last_12_months"])
+
+# Headcount
+st.markdown("### 👥 Headcount")
+tab_department, tab_designation, tab_status = st.tabs(["By Department", "By Designation", "By Status"])
+with tab_department:
+    st.bar_chart(analytics["by_department"], height=320)
+with tab_designation:
+    st.bar_chart(analytics["by_designation"], height=320)
+with tab_status:
+    st.bar_chart(analytics["by_status"], height=320)
+
+# Hiring and tenure
+col1, col2 = st.columns(2)
+with col1:
+    st.markdown("### 📅 Hires per Month")
+    hires = analytics["hires_per_month"]
+    if hires.empty:
+        st.caption("No joining dates recorded.")
+    else:
+        st.bar_chart(hires, height=280)
+with col2:
+    st.markdown("### ⏳ Tenure of Active Employees")
+    if not analytics["tenure"].sum():
+        st.caption("No active employees with a joining date.")
+    else:
+        st.bar_chart(analytics["tenure"], height=280)
+
+# Prior employment (aggregated in the database)
+st.markdown("### 🏢 Prior Employment")
+history = get_employment_history_stats(token)
+if not history["records"]:
+    st.caption("No employment history recorded.")
+else:
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Employees with Prior Jobs", history["employees_with_history"])
+    with col2:
+        st.metric("Avg Prior Jobs", f"{history['avg_prior_jobs']:.1f}")
+    with col3:
+        avg_months = history["avg_prior_tenure_months"]
+        st.metric("Avg Prior Job Length", f"{avg_months:.0f} months" if avg_months is not None else "N/A")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        buckets = pd.DataFrame(history["prior_jobs"])
+        if not buckets.empty:
+            buckets["Prior Jobs"] = buckets["jobs"].astype(str)
+            buckets.loc[buckets["jobs"] >= PRIOR_JOBS_BUCKETS, "Prior Jobs"] = f"{PRIOR_JOBS_BUCKETS}+"
+            st.bar_chart(buckets.set_index("Prior Jobs")["employees"], height=260)
+    with col2:
+        companies = pd.DataFrame(history["top_companies"])
+        if not companies.empty:
+            companies.columns = ["Previous Company", "Employees"]
+            st.dataframe(companies, hide_index=True, use_container_width=True)
+
+footer()
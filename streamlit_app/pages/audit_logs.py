@@ -0,0 +1,145 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Audit Log Page - Browse, filter and export admin actions
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+from datetime import datetime, time, timedelta
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.api_client import get_audit_log_daily_counts, get_audit_logs_page
+from utils.auth import require_login, get_token
+from utils.export_utils import export_audit_logs_to_csv
+from utils.footer import footer, sidebar_branding
+
+st.set_page_config(page_title="Audit Logs - EMS", page_icon="📝", layout="wide")
+
+PAGE_SIZES = [25, 50, 100, 250]
+AUDIT_ACTIONS = [
+    "CREATE_EMPLOYEE",
+    "BULK_CREATE_EMPLOYEES",
+    "UPDATE_EMPLOYEE",
+    "DELETE_EMPLOYEE",
+    "ADD_EMPLOYMENT_HISTORY",
+    "UPLOAD_PAYSLIP",
+]
+
+require_login()
+
+# Add sidebar branding
+sidebar_branding()
+
+st.title("📝 Audit Logs")
+st.markdown("---")
+
+token = get_token()
+
+# Sidebar filters
+st.sidebar.header("🔍 Filters")
+today = datetime.now().date()
+date_range = st.sidebar.date_input(
+    "Date range",
+    value=(today - timedelta(days=7), today),
+    max_value=today
+)
+action = st.sidebar.selectbox("Action", ["All"] + AUDIT_ACTIONS)
+admin_id = st.sidebar.number_input("Admin ID", min_value=0, value=0, step=1, help="0 = any admin")
+emp_id = st.sidebar.number_input("Employee ID", min_value=0, value=0, step=1, help="0 = any employee")
+page_size = st.sidebar.selectbox("Rows per page", PAGE_SIZES, index=1)
+
+# The range is inclusive of both picked days: [start 00:00, day after end 00:00)
+start_date, end_date = (date_range if len(date_range) == 2 else (date_range[0], date_range[0]))
+filters = {
+    "admin_id": int(admin_id) or None,
+    "emp_id": int(emp_id) or None,
+    "action": None if action == "All" else action,
+    "start": datetime.combine(start_date, time.min),
+    "end": datetime.combine(end_date + timedelta(days=1), time.min),
+}
+
+# Keyset pagination: remember the cursor that opened each visited page
+filter_key = (tuple(filters.items()), page_size)
+if st.session_state.get("audit_filter_key") != filter_key:
+    st.session_state.audit_filter_key = filter_key
+    st.session_state.audit_cursors = [None]
+cursors = st.session_state.audit_cursors
+
+# Activity per day from the pre-aggregated daily counts (not affected by id filters)
+counts = get_audit_log_daily_counts(
+    token,
+    action=filters["action"],
+    start=start_date,
+    end=end_date + timedelta(days=1)
+)
+if counts:
+    counts_df = pd.DataFrame(counts).pivot_table(
+        index="day", columns="action", values="count", aggfunc="sum", fill_value=0
+    )
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.metric("Entries in Range", int(counts_df.to_numpy().sum()))
+    with col2:
+        st.bar_chart(counts_df, height=220)
+
+page = get_audit_logs_page(token, limit=page_size, cursor=cursors[-1], **filters)
+
+if page["items"]:
+    logs_df = pd.DataFrame(page["items"]).reindex(
+        columns=["timestamp", "action", "admin_id", "emp_id", "details", "log_id"]
+    )
+    logs_df["timestamp"] = pd.to_datetime(logs_df["timestamp"]).dt.strftime("%Y-%m-%d %H:%M:%S")
+    logs_df.columns = ["Timestamp", "Action", "Admin ID", "Employee ID", "Details", "Log ID"]
+    st.dataframe(logs_df, hide_index=True, use_container_width=True)
+else:
+    st.info("No audit log entries match these filters.")
+
+# Pagination
+col1, col2, col3 = st.columns([1, 2, 1])
+with col1:
+    if st.button("← Newer", disabled=len(cursors) == 1, use_container_width=True):
+        cursors.pop()
+        st.rerun()
+with col2:
+    st.markdown(
+        f"<div style='text-align: center'>Page {len(cursors)}</div>",
+        unsafe_allow_html=True
+    )
+with col3:
+    if st.button("Older →", disabled=not page["next_cursor"], use_container_width=True):
+        cursors.append(page["next_cursor"])
+        st.rerun()
+
+# Export the whole filtered range, not just the visible page
+st.markdown("---")
+st.markdown("### Export")
+st.caption("Exports every entry matching the filters above, streamed straight to a CSV file.")
+if st.button("⬇️ Generate CSV Export", type="primary"):
+    with st.spinner("Exporting audit logs..."):
+        filepath = export_audit_logs_to_csv(token, **filters)
+    if filepath and os.path.exists(filepath):
+        with open(filepath, "rb") as f:
+            st.download_button(
+                "⬇️ Download Audit Logs (CSV)",
+                f,
+                file_name=os.path.basename(filepath),
+                mime="text/csv"
+            )
+        st.success(f"✅ CSV export generated successfully! ({os.path.getsize(filepath)} bytes)")
+    else:
+        st.error("❌ Failed to export audit logs. Please try again.")
+
+if st.button("← Back to Dashboard"):
+    st.switch_page("pages/dashboard.py")
+
+# Display footer
+footer()
@@ -11,18 +11,22 @@ Dashboard Page - View and manage all employees
 import streamlit as st
 import sys
 import os
+import math
 import pandas as pd
 from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils.api_client import get_employees, delete_employee
+from utils.api_client import get_employees_page, get_employee_stats, delete_employee
 from utils.auth import require_login, logout, get_token
+from utils.search_index import get_search_index
 from utils.footer import footer, sidebar_branding
 
 st.set_page_config(page_title="Dashboard - EMS", page_icon="📊", layout="wide")
 
+PAGE_SIZES = [10, 25, 50, 100]
+
 require_login()
 
 # Add sidebar branding
@@ -32,38 +36,43 @@ st.title("📊 Employee Dashboard")
 st.markdown("---")
 
 # Header with navigation
-col1, col2, col3 = st.columns([4, 1, 1])
+col1, col2, col3, col4, col5 = st.columns([2, 1, 1, 1, 1])
 with col1:
     st.write(f"Welcome, **{st.session_state.get('email', 'Admin')}**")
 with col2:
+    if st.button("📈 Analytics", type="secondary", use_container_width=True):
+        st.switch_page("pages/analytics.py")
+with col3:
     if st.button("📤 Export Data", type="secondary", use_container_width=True):
         st.switch_page("pages/export_data.py")
-with col3:
+with col4:
+    if st.button("📝 Audit Logs", type="secondary", use_container_width=True):
+        st.switch_page("pages/audit_logs.py")
+with col5:
     if st.button("Logout", type="secondary", use_container_width=True):
         logout()
         st.rerun()
 
-# Get all employees
+# Get headcount totals and filter options (cheap aggregate query)
 token = get_token()
-employees = get_employees(token)
+stats = get_employee_stats(token)
 
-if not employees:
+if not stats["total"]:
     st.info("No employees found. Add your first employee!")
     if st.button("Add Employee", type="primary"):
         st.switch_page("pages/add_employee.py")
+    if st.button("📥 Import Employees", type="secondary"):
+        st.switch_page("pages/import_employees.py")
 else:
-    # Convert to DataFrame
-    df = pd.DataFrame(employees)
-    
     # Sidebar filters
     st.sidebar.header("🔍 Filters")
     
     # Department filter
-    departments = ["All"] + sorted([d for d in df["department"].dropna().unique() if d])
+    departments = ["All"] + stats["departments"]
     selected_department = st.sidebar.selectbox("Department", departments)
     
     # Designation filter
-    designations = ["All"] + sorted([d for d in df["designation"].dropna().unique() if d])
+    designations = ["All"] + stats["designations"]
     selected_designation = st.sidebar.selectbox("Designation", designations)
     
     # Status filter
@@ -71,47 +80,72 @@ else:
     selected_status = st.sidebar.selectbox("Status", statuses)
     
     # Search bar
-    search_query = st.sidebar.text_input("Search (Name, Email, Phone)")
+    search_query = st.sidebar.text_input("Search (Name, Email, Phone)").strip()
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Page size
+    page_size = st.sidebar.selectbox("Rows per page", PAGE_SIZES, index=1)
     
-    if selected_department != "All":
-        filtered_df = filtered_df[filtered_df["department"] == selected_department]
+    # Go back to the first page whenever the filters change
+    filter_key = (selected_department, selected_designation, selected_status, search_query, page_size)
+    if st.session_state.get("dashboard_filters") != filter_key:
+        st.session_state["dashboard_filters"] = filter_key
+        st.session_state["dashboard_page"] = 1
     
-    if selected_designation != "All":
-        filtered_df = filtered_df[filtered_df["designation"] == selected_designation]
+    page_number = st.session_state.get("dashboard_page", 1)
+    filters = {
+        "department": None if selected_department == "All" else selected_department,
+        "designation": None if selected_designation == "All" else selected_designation,
+        "status": None if selected_status == "All" else selected_status,
+    }
+    offset = (page_number - 1) * page_size
     
-    if selected_status != "All":
-        filtered_df = filtered_df[filtered_df["status"] == selected_status]
-    
-    if search_query:
-        mask = (
-            filtered_df["first_name"].str.contains(search_query, case=False, na=False) |
-            filtered_df["last_name"].str.contains(search_query, case=False, na=False) |
-            filtered_df["email"].str.contains(search_query, case=False, na=False) |
-            filtered_df["phone"].str.contains(search_query, case=False, na=False)
+    # Searches are ranked (and typo tolerant) from the local search index;
+    # without a search, or if the index is unavailable, fetch only the page
+    # being viewed and let the database filter
+    index = get_search_index(token) if search_query else None
+    if index is not None:
+        matches = index.search(search_query, limit=None, **filters)
+        page = {"items": matches[offset:offset + page_size], "total": len(matches)}
+    else:
+        page = get_employees_page(
+            token,
+            limit=page_size,
+            offset=offset,
+            search=search_query or None,
+            **filters,
         )
-        filtered_df = filtered_df[mask]
+    filtered_df = pd.DataFrame(page["items"])
+    total_pages = max(1, math.ceil(page["total"] / page_size))
+    
+    # The last page may have emptied out (e.g. after a delete)
+    if filtered_df.empty and page_number > total_pages:
+        st.session_state["dashboard_page"] = total_pages
+        st.rerun()
     
     # Display statistics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Employees", len(df))
+        st.metric("Total Employees", stats["total"])
     with col2:
-        st.metric("Active Employees", len(df[df["status"] == "Active"]))
+        st.metric("Active Employees", stats["active"])
     with col3:
-        st.metric("Departments", df["department"].nunique())
+        st.metric("Departments", len(stats["departments"]))
     with col4:
-        st.metric("Filtered Results", len(filtered_df))
+        st.metric("Filtered Results", page["total"])
     
     st.markdown("---")
     
     # Action buttons
-    col1, col2 = st.columns([1, 5])
+    col1, col2, col3, col4 = st.columns([1, 1, 1, 3])
     with col1:
         if st.button("➕ Add Employee", type="primary", use_container_width=True):
             st.switch_page("pages/add_employee.py")
+    with col2:
+        if st.button("📥 Import Employees", type="secondary", use_container_width=True):
+            st.switch_page("pages/import_employees.py")
+    with col3:
+        if st.button("📦 Import Payslips", type="secondary", use_container_width=True):
+            st.switch_page("pages/import_payslips.py")
     
     # Display employees table
     if len(filtered_df) > 0:
@@ -122,19 +156,31 @@ else:
         ]].copy()
         display_df.columns = ["ID", "First Name", "Last Name", "Email", "Phone", "Department", "Designation", "Status"]
         
-        # Create action buttons for each row
-        for idx, row in filtered_df.iterrows():
-            with st.expander(f"👤 {row['first_name']} {row['last_name']} - {row.get('designation', 'N/A')}"):
+        # Only the current page is sent to the browser; pick a row to act on it
+        event = st.dataframe(
+            display_df,
+            hide_index=True,
+            use_container_width=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=f"employee_table_{page_number}_{hash(filter_key)}",
+        )
+        
+        selected_rows = event.selection.rows
+        if selected_rows:
+            row = filtered_df.iloc[selected_rows[0]]
+            with st.container(border=True):
+                st.subheader(f"👤 {row['first_name']} {row['last_name']} - {row.get('designation') or 'N/A'}")
                 col1, col2, col3, col4 = st.columns(4)
                 
                 with col1:
                     st.write(f"**ID:** {row['emp_id']}")
-                    st.write(f"**Email:** {row.get('email', 'N/A')}")
-                    st.write(f"**Phone:** {row.get('phone', 'N/A')}")
+                    st.write(f"**Email:** {row.get('email') or 'N/A'}")
+                    st.write(f"**Phone:** {row.get('phone') or 'N/A'}")
                 
                 with col2:
-                    st.write(f"**Department:** {row.get('department', 'N/A')}")
-                    st.write(f"**Designation:** {row.get('designation', 'N/A')}")
+                    st.write(f"**Department:** {row.get('department') or 'N/A'}")
+                    st.write(f"**Designation:** {row.get('designation') or 'N/A'}")
                     st.write(f"**Status:** {row['status']}")
                 
                 with col3:
@@ -144,19 +190,34 @@ else:
                 
                 with col4:
                     if st.button("👁️ View Details", key=f"view_{row['emp_id']}", use_container_width=True):
-                        st.session_state["selected_emp_id"] = row['emp_id']
+                        st.session_state["selected_emp_id"] = int(row['emp_id'])
                         st.switch_page("pages/employee_detail.py")
                     
                     if st.button("✏️ Edit", key=f"edit_{row['emp_id']}", use_container_width=True):
-                        st.session_state["edit_emp_id"] = row['emp_id']
+                        st.session_state["edit_emp_id"] = int(row['emp_id'])
                         st.switch_page("pages/add_employee.py")
                     
                     if st.button("🗑️ Delete", key=f"delete_{row['emp_id']}", use_container_width=True):
-                        if delete_employee(token, row['emp_id']):
+                        if delete_employee(token, int(row['emp_id'])):
                             st.success("Employee deleted successfully!")
                             st.rerun()
                         else:
                             st.error("Failed to delete employee")
+        else:
+            st.caption("Select a row to view, edit or delete that employee.")
+        
+        # Pagination controls
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("← Previous", disabled=page_number <= 1, use_container_width=True):
+                st.session_state["dashboard_page"] = page_number - 1
+                st.rerun()
+        with col2:
+            st.caption(f"Page {page_number} of {total_pages}")
+        with col3:
+            if st.button("Next →", disabled=page_number >= total_pages, use_container_width=True):
+                st.session_state["dashboard_page"] = page_number + 1
+                st.rerun()
     else:
         st.info("No employees match the selected filters.")
 
@@ -11,7 +11,6 @@ Employee Detail Page - View employee details, history, and payslips
 import streamlit as st
 import sys
 import os
-import tempfile
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -195,7 +194,14 @@ with tab2:
                     size_str = f"{size_kb:.2f} KB"
                 else:
                     size_str = f"{file_size} bytes"
-                st.write(f"{icon} **{filename}** ({file_type} - {size_str})")
+                st.write(f"{icon} **{payslip.get('original_filename') or filename}** ({file_type} - {size_str})")
+                details = []
+                if payslip.get('pay_period'):
+                    details.append(f"Pay period: {payslip['pay_period'][:7]}")
+                if payslip.get('uploaded_at'):
+                    details.append(f"Uploaded: {payslip['uploaded_at'][:16].replace('T', ' ')}")
+                if details:
+                    st.caption(" · ".join(details))
             with col2:
                 payslip_url = get_payslip_url(payslip['filename'])
                 st.markdown(f"[⬇️ Download]({payslip_url})")
@@ -210,6 +216,12 @@ with tab2:
         help="Upload employee payslip as PDF, Excel (.xlsx, .xls), or Word (.docx, .doc)"
     )
     
+    pay_period = st.date_input(
+        "Pay Period",
+        value=None,
+        help="Any day in the month this payslip covers (optional)"
+    )
+    
     if uploaded_file is not None:
         # Get file extension from uploaded file name
         file_extension = uploaded_file.name.split('.')[-1].lower() if '.' in uploaded_file.name else 'pdf'
@@ -219,29 +231,26 @@ with tab2:
         if file_extension not in allowed_extensions:
             st.error(f"Unsupported file type. Allowed: PDF, Excel (.xlsx, .xls), Word (.docx, .doc)")
         elif st.button("Upload Payslip", type="primary"):
-            # Save file temporarily with correct extension
-            suffix = f'.{file_extension}'
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                tmp_file.write(uploaded_file.read())
-                tmp_path = tmp_file.name
+            # Stream the uploaded file straight to the API (large files go in resumable chunks)
+            progress_bar = st.progress(0.0, text="Uploading payslip...")
             
-            # Upload to API
-            with st.spinner("Uploading payslip..."):
-                result = upload_payslip(token, emp_id, tmp_path)
-                if result:
-                    st.success("Payslip uploaded successfully!")
-                    # Clean up temp file
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
-                    st.rerun()
-                else:
-                    st.error("Failed to upload payslip")
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
+            def show_progress(sent: int, total: int):
+                progress_bar.progress(sent / total if total else 1.0, text=f"Uploading payslip... {sent // 1024} / {total // 1024} KB")
+            
+            result = upload_payslip(
+                token,
+                emp_id,
+                uploaded_file,
+                pay_period=pay_period,
+                filename=uploaded_file.name,
+                progress=show_progress
+            )
+            progress_bar.empty()
+            if result:
+                st.success("Payslip uploaded successfully!")
+                st.rerun()
+            else:
+                st.error("Failed to upload payslip")
 
 
 # Display footer
@@ -17,19 +17,31 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.auth import require_login, get_token
-from utils.api_client import get_employees
-from utils.export_utils import (
-    export_all_to_excel,
-    export_all_to_pdf,
-    export_employee_to_word,
-    export_employee_to_pdf,
-    export_all_pdfs_to_zip,
-    EXPORTS_DIR
+from utils.replica import get_synced_employees
+from utils.export_utils import EXPORTS_DIR
+from utils.export_jobs import (
+    get_job_manager,
+    JOB_LABELS,
+    ACTIVE_STATUSES,
+    RESUMABLE_STATUSES,
+    DONE,
+    INTERRUPTED
 )
 from utils.footer import footer, sidebar_branding
 
 st.set_page_config(page_title="Data Export - EMS", page_icon="📤", layout="wide")
 
+# Seconds between job status refreshes while exports are running
+EXPORT_JOB_POLL_SECONDS = 2
+EXPORT_JOB_DISPLAY_LIMIT = 20
+
+EXPORT_MIME_TYPES = {
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".pdf": "application/pdf",
+    ".zip": "application/zip",
+}
+
 require_login()
 
 # Add sidebar branding
@@ -55,151 +67,141 @@ export_type = st.sidebar.selectbox(
 
 st.markdown("### Export Employee Data")
 
+jobs = get_job_manager()
+
+
+def submit_export(kind: str, params=None):
+    """Queue an export job; it keeps running if this page is closed"""
+    job_id = jobs.submit(kind, token, params, owner=st.session_state.get("email", ""))
+    st.success(f"✅ Export job `{job_id}` queued. Track it under **Export Jobs** below.")
+
+
+def select_employee():
+    """Employee picker for single-employee exports; returns emp_id or None"""
+    employees = get_synced_employees(token)
+    if not employees:
+        st.warning("No employees found. Please add employees first.")
+        return None
+    
+    # Create a selectbox with employee names
+    employee_options = {
+        f"{emp.get('first_name', '')} {emp.get('last_name', '')} (ID: {emp.get('emp_id')})": emp.get('emp_id')
+        for emp in employees
+    }
+    
+    selected_employee = st.selectbox(
+        "Select Employee:",
+        options=list(employee_options.keys())
+    )
+    
+    return employee_options.get(selected_employee)
+
+
 if export_type == "All Employees (Excel)":
     st.info("📊 Export all employee records to an Excel spreadsheet (.xlsx)")
     
     if st.button("⬇️ Generate Excel Export", type="primary", use_container_width=True):
-        with st.spinner("Generating Excel file..."):
-            filepath = export_all_to_excel(token)
-            
-            if filepath and os.path.exists(filepath):
-                with open(filepath, "rb") as f:
-                    st.download_button(
-                        "⬇️ Download All Employees (Excel)",
-                        f.read(),
-                        file_name=os.path.basename(filepath),
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        use_container_width=True
-                    )
-                st.success(f"✅ Excel file generated successfully! ({os.path.getsize(filepath)} bytes)")
-            else:
-                st.error("❌ Failed to generate Excel file. Please try again.")
+        submit_export("excel")
 
 elif export_type == "All Employees (PDF)":
     st.info("📄 Export all employee records to a single multi-page PDF document")
     
     if st.button("⬇️ Generate PDF Report", type="primary", use_container_width=True):
-        with st.spinner("Generating PDF report..."):
-            filepath = export_all_to_pdf(token)
-            
-            if filepath and os.path.exists(filepath):
-                with open(filepath, "rb") as f:
-                    st.download_button(
-                        "⬇️ Download All Employees (PDF)",
-                        f.read(),
-                        file_name=os.path.basename(filepath),
-                        mime="application/pdf",
-                        use_container_width=True
-                    )
-                st.success(f"✅ PDF report generated successfully! ({os.path.getsize(filepath)} bytes)")
-            else:
-                st.error("❌ Failed to generate PDF report. Please try again.")
+        submit_export("pdf")
 
 elif export_type == "All Employees (ZIP Archive)":
     st.info("📦 Export all employees as individual PDFs bundled in a ZIP archive")
-    st.warning("⚠️ This may take a few moments for large employee lists.")
+    st.caption("Large archives are built in checkpointed chunks; an interrupted job can be resumed below.")
     
     if st.button("⬇️ Generate ZIP Archive", type="primary", use_container_width=True):
-        with st.spinner("Generating ZIP archive with all employee PDFs..."):
-            filepath = export_all_pdfs_to_zip(token)
-            
-            if filepath and os.path.exists(filepath):
-                with open(filepath, "rb") as f:
-                    st.download_button(
-                        "⬇️ Download ZIP Archive",
-                        f.read(),
-                        file_name=os.path.basename(filepath),
-                        mime="application/zip",
-                        use_container_width=True
-                    )
-                st.success(f"✅ ZIP archive generated successfully! ({os.path.getsize(filepath)} bytes)")
-            else:
-                st.error("❌ Failed to generate ZIP archive. Please try again.")
+        submit_export("zip")
 
 elif export_type == "Single Employee (Word)":
     st.info("📝 Export a single employee's profile as a Word document (.docx)")
     
-    # Get list of employees for selection
-    employees = get_employees(token)
-    
-    if employees:
-        # Create a selectbox with employee names
-        employee_options = {
-            f"{emp.get('first_name', '')} {emp.get('last_name', '')} (ID: {emp.get('emp_id')})": emp.get('emp_id')
-            for emp in employees
-        }
-        
-        selected_employee = st.selectbox(
-            "Select Employee:",
-            options=list(employee_options.keys())
-        )
-        
-        emp_id = employee_options.get(selected_employee)
-        
-        if emp_id and st.button("⬇️ Generate Word Document", type="primary", use_container_width=True):
-            with st.spinner("Generating Word document..."):
-                filepath = export_employee_to_word(emp_id, token)
-                
-                if filepath and os.path.exists(filepath):
-                    with open(filepath, "rb") as f:
-                        st.download_button(
-                            "⬇️ Download Word Document",
-                            f.read(),
-                            file_name=os.path.basename(filepath),
-                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            use_container_width=True
-                        )
-                    st.success(f"✅ Word document generated successfully! ({os.path.getsize(filepath)} bytes)")
-                else:
-                    st.error("❌ Failed to generate Word document. Please try again.")
-    else:
-        st.warning("No employees found. Please add employees first.")
+    emp_id = select_employee()
+    if emp_id and st.button("⬇️ Generate Word Document", type="primary", use_container_width=True):
+        submit_export("word", {"emp_id": emp_id})
 
 elif export_type == "Single Employee (PDF)":
     st.info("📄 Export a single employee's profile as a PDF document")
     
-    # Get list of employees for selection
-    employees = get_employees(token)
+    emp_id = select_employee()
+    if emp_id and st.button("⬇️ Generate PDF Document", type="primary", use_container_width=True):
+        submit_export("employee_pdf", {"emp_id": emp_id})
+
+
+def show_export_jobs():
+    """Job list with progress bars, downloads and resume buttons"""
+    job_list = jobs.list_jobs()
+    if not job_list:
+        st.caption("No export jobs yet.")
+        return
     
-    if employees:
-        # Create a selectbox with employee names
-        employee_options = {
-            f"{emp.get('first_name', '')} {emp.get('last_name', '')} (ID: {emp.get('emp_id')})": emp.get('emp_id')
-            for emp in employees
-        }
-        
-        selected_employee = st.selectbox(
-            "Select Employee:",
-            options=list(employee_options.keys())
-        )
-        
-        emp_id = employee_options.get(selected_employee)
-        
-        if emp_id and st.button("⬇️ Generate PDF Document", type="primary", use_container_width=True):
-            with st.spinner("Generating PDF document..."):
-                filepath = export_employee_to_pdf(emp_id, token)
-                
-                if filepath and os.path.exists(filepath):
-                    with open(filepath, "rb") as f:
-                        st.download_button(
-                            "⬇️ Download PDF Document",
-                            f.read(),
-                            file_name=os.path.basename(filepath),
-                            mime="application/pdf",
-                            use_container_width=True
-                        )
-                    st.success(f"✅ PDF document generated successfully! ({os.path.getsize(filepath)} bytes)")
+    for job in job_list[:EXPORT_JOB_DISPLAY_LIMIT]:
+        with st.container(border=True):
+            col1, col2 = st.columns([4, 1])
+            with col1:
+                submitted = datetime.fromtimestamp(job["created_at"]).strftime("%Y-%m-%d %H:%M:%S")
+                st.write(f"**{JOB_LABELS[job['kind']]}** · `{job['job_id']}` · {submitted} · {job['owner'] or 'unknown'}")
+                if job["status"] in ACTIVE_STATUSES:
+                    st.progress(job["progress"], text=job["message"])
+                elif job["status"] == DONE:
+                    st.caption(f"✅ {os.path.basename(job['result_path'])}")
+                elif job["status"] == INTERRUPTED:
+                    st.warning(f"⚠️ {job['message']}")
                 else:
-                    st.error("❌ Failed to generate PDF document. Please try again.")
-    else:
-        st.warning("No employees found. Please add employees first.")
+                    st.error(f"❌ {job['error']}")
+            with col2:
+                result_path = job["result_path"]
+                if job["status"] == DONE and result_path and os.path.exists(result_path):
+                    # download_button needs the whole file in memory, so only the
+                    # artifact the user asked for is read (not every finished job
+                    # on every poll)
+                    if st.session_state.get("export_download_job") != job["job_id"]:
+                        if st.button("📦 Prepare Download", key=f"prepare_{job['job_id']}", use_container_width=True):
+                            st.session_state["export_download_job"] = job["job_id"]
+                            st.rerun()
+                    else:
+                        extension = os.path.splitext(result_path)[1]
+                        with open(result_path, "rb") as f:
+                            data = f.read()
+                        if st.download_button(
+                            "⬇️ Download",
+                            data,
+                            file_name=os.path.basename(result_path),
+                            mime=EXPORT_MIME_TYPES.get(extension, "application/octet-stream"),
+                            key=f"download_{job['job_id']}",
+                            use_container_width=True
+                        ):
+                            st.session_state.pop("export_download_job", None)
+                elif job["status"] in RESUMABLE_STATUSES:
+                    if st.button("🔁 Resume", key=f"resume_{job['job_id']}", use_container_width=True):
+                        jobs.resume(job["job_id"], token)
+                        st.rerun()
+                if job["status"] not in ACTIVE_STATUSES:
+                    if st.button("🗑️ Remove", key=f"remove_{job['job_id']}", use_container_width=True):
+                        jobs.remove(job["job_id"])
+                        st.rerun()
+    
+    # Stop polling once everything has finished
+    if polling and not any(job["status"] in ACTIVE_STATUSES for job in job_list):
+        st.rerun()
+
+
+st.markdown("---")
+st.markdown("### Export Jobs")
+
+# Poll only while a job is queued or running
+polling = any(job["status"] in ACTIVE_STATUSES for job in jobs.list_jobs())
+st.fragment(run_every=EXPORT_JOB_POLL_SECONDS if polling else None)(show_export_jobs)()
 
 # Footer with export directory info
 st.markdown("---")
 with st.expander("ℹ️ Export Information"):
     st.write(f"**Export Directory:** `{EXPORTS_DIR}`")
-    st.write("All generated files are saved in the exports directory and can be downloaded using the buttons above.")
-    st.write("Files are named with timestamps to prevent overwriting.")
+    st.write("Exports run as background jobs, so you can leave this page while they run. Finished files are saved in the exports directory and can be downloaded from the job list above.")
+    st.write("Files are cached by content: repeating an export of unchanged data returns the existing file immediately.")
 
 # Display footer
 footer()
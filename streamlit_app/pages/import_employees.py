@@ -0,0 +1,112 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Bulk Import Page - Create employees from a CSV or Excel file
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.auth import require_login, get_token
+from utils.employee_import import import_employees, IMPORT_COLUMNS, IMPORT_CHUNK_SIZE
+from utils.footer import footer, sidebar_branding
+
+st.set_page_config(page_title="Import Employees - EMS", page_icon="📥", layout="wide")
+
+require_login()
+
+# Add sidebar branding
+sidebar_branding()
+
+st.title("📥 Import Employees")
+st.markdown("---")
+
+token = get_token()
+
+col1, col2 = st.columns([4, 1])
+with col1:
+    st.info(
+        "Upload a .csv or .xlsx file with one employee per row. "
+        "Only **first_name** and **last_name** are required; dates use YYYY-MM-DD "
+        "and status is Active or Inactive (blank means Active)."
+    )
+with col2:
+    template = ",".join(IMPORT_COLUMNS) + "\nJohn,Doe,john.doe@company.com,+1 555 0100,Engineering,Engineer,2024-01-15,Active\n"
+    st.download_button(
+        "⬇️ CSV Template",
+        template,
+        file_name="employee_import_template.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
+
+uploaded_file = st.file_uploader("Employee file", type=["csv", "xlsx"])
+
+with st.expander("⚙️ Advanced"):
+    chunk_size = st.number_input(
+        "Rows per batch",
+        min_value=1,
+        max_value=1000,
+        value=min(IMPORT_CHUNK_SIZE, 1000),
+        help="Rows validated and inserted per API request"
+    )
+
+if uploaded_file and st.button("📥 Import Employees", type="primary", use_container_width=True):
+    status_text = st.empty()
+
+    def show_progress(rows: int):
+        status_text.write(f"Processed {rows} rows...")
+
+    try:
+        with st.spinner("Importing employees..."):
+            report = import_employees(
+                token,
+                uploaded_file,
+                uploaded_file.name,
+                chunk_size=int(chunk_size),
+                progress=show_progress
+            )
+        st.session_state.import_report = report
+    except Exception as e:
+        st.session_state.pop("import_report", None)
+        st.error(f"❌ Import failed: {e}")
+    status_text.empty()
+
+report = st.session_state.get("import_report")
+if report:
+    st.markdown("### Import Summary")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Rows Read", report["rows"])
+    with col2:
+        st.metric("Created", report["inserted"])
+    with col3:
+        st.metric("Rejected", len(report["errors"]))
+
+    if report["errors"]:
+        st.warning("⚠️ Some rows were not imported. Fix them and re-upload only those rows.")
+        errors_df = pd.DataFrame(report["errors"], columns=["row", "error"])
+        st.dataframe(errors_df, hide_index=True, use_container_width=True)
+        st.download_button(
+            "⬇️ Download Error Report",
+            errors_df.to_csv(index=False),
+            file_name="employee_import_errors.csv",
+            mime="text/csv"
+        )
+    elif report["inserted"]:
+        st.success(f"✅ Imported {report['inserted']} employees successfully!")
+
+if st.button("← Back to Dashboard"):
+    st.switch_page("pages/dashboard.py")
+
+# Display footer
+footer()
@@ -0,0 +1,125 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Bulk Payslip Import Page - Upload a ZIP of payslips for many employees
+"""
+import streamlit as st
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.auth import require_login, get_token
+from utils.footer import footer, sidebar_branding
+from utils.payslip_import import (
+    import_payslip_zip, MANIFEST_COLUMNS, PAYSLIP_IMPORT_WORKERS,
+    UPLOADED, DUPLICATE, SKIPPED, FAILED
+)
+
+st.set_page_config(page_title="Import Payslips - EMS", page_icon="📦", layout="wide")
+
+require_login()
+
+# Add sidebar branding
+sidebar_branding()
+
+st.title("📦 Import Payslips")
+st.markdown("---")
+
+token = get_token()
+
+col1, col2 = st.columns([4, 1])
+with col1:
+    st.info(
+        "Upload a .zip of payslips (PDF, Excel or Word). Each file is matched to an employee by "
+        "a folder named after the employee ID (`42/2026-03.pdf`) or a name starting with it "
+        "(`42_2026-03.pdf`); a `YYYY-MM` in the name sets the pay period. Alternatively include "
+        "a **manifest.csv** listing each file with its emp_id or employee email. "
+        "Files an employee already has are skipped, so re-running an import is safe."
+    )
+with col2:
+    template = ",".join(MANIFEST_COLUMNS) + "\n42_march.pdf,42,,2026-03\njane_doe.pdf,,jane.doe@company.com,2026-03\n"
+    st.download_button(
+        "⬇️ Manifest Template",
+        template,
+        file_name="manifest.csv",
+        mime="text/csv",
+        use_container_width=True
+    )
+
+uploaded_file = st.file_uploader("Payslip archive", type=["zip"])
+
+default_period = st.date_input(
+    "Default Pay Period",
+    value=None,
+    help="Used for files whose name or manifest row has no pay period (optional)"
+)
+
+with st.expander("⚙️ Advanced"):
+    workers = st.number_input(
+        "Concurrent uploads",
+        min_value=1,
+        max_value=16,
+        value=PAYSLIP_IMPORT_WORKERS
+    )
+
+if uploaded_file and st.button("📦 Import Payslips", type="primary", use_container_width=True):
+    progress_bar = st.progress(0.0, text="Importing payslips...")
+
+    def show_progress(done: int, total: int):
+        progress_bar.progress(done / total if total else 1.0, text=f"Processed {done} of {total} files...")
+
+    try:
+        st.session_state.payslip_import_report = import_payslip_zip(
+            token,
+            uploaded_file,
+            default_period=default_period,
+            workers=int(workers),
+            progress=show_progress
+        )
+    except Exception as e:
+        st.session_state.pop("payslip_import_report", None)
+        st.error(f"❌ Import failed: {e}")
+    progress_bar.empty()
+
+report = st.session_state.get("payslip_import_report")
+if report is not None:
+    report_df = pd.DataFrame(report, columns=["file", "emp_id", "pay_period", "status", "detail"])
+    counts = report_df["status"].value_counts()
+
+    st.markdown("### Import Summary")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Uploaded", int(counts.get(UPLOADED, 0)))
+    with col2:
+        st.metric("Already Present", int(counts.get(DUPLICATE, 0)))
+    with col3:
+        st.metric("Skipped", int(counts.get(SKIPPED, 0)))
+    with col4:
+        st.metric("Failed", int(counts.get(FAILED, 0)))
+
+    if counts.get(FAILED, 0) or counts.get(SKIPPED, 0):
+        st.warning("⚠️ Some files were not imported. Fix them and re-run the import.")
+    elif len(report_df):
+        st.success("✅ Every payslip in the archive is imported!")
+
+    st.dataframe(report_df, hide_index=True, use_container_width=True)
+    st.download_button(
+        "⬇️ Download Import Report",
+        report_df.to_csv(index=False),
+        file_name="payslip_import_report.csv",
+        mime="text/csv"
+    )
+
+if st.button("← Back to Dashboard"):
+    st.switch_page("pages/dashboard.py")
+
+# Display footer
+footer()
@@ -8,9 +8,14 @@
 """
 API Client for communicating with the Rust backend API
 """
-import requests
+import json
+import mimetypes
 import os
-from typing import Optional, Dict, List, Any
+from datetime import date, datetime
+from typing import Optional, Dict, List, Any, BinaryIO, Callable, Iterable, Iterator, Tuple, Union
+
+from .http_client import ApiSession
+from .read_cache import ReadCache
 
 # Get BASE_URL from environment variable or use default
 # BASE_URL is for server-to-server communication (Docker internal)
@@ -19,6 +24,15 @@ BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
 # PUBLIC_API_URL is for browser-accessible links (must be localhost or public IP)
 PUBLIC_API_URL = os.getenv("PUBLIC_API_URL", "http://localhost:8000")
 
+# Shared keep-alive connection pool used by every call below
+api_session = ApiSession(BASE_URL)
+
+# Shared TTL/ETag cache for employee reads (see utils/read_cache.py)
+read_cache = ReadCache()
+
+# Callbacks told about employee writes made through this module
+_employee_listeners: List[Callable[[int, Optional[Dict[str, Any]]], None]] = []
+
 def login(email: str, password: str) -> Optional[str]:
     """
     Login and get JWT token
@@ -31,8 +45,8 @@ def login(email: str, password: str) -> Optional[str]:
         JWT token if successful, None otherwise
     """
     try:
-        response = requests.post(
-            f"{BASE_URL}/auth/login",
+        response = api_session.post(
+            "/auth/login",
             json={"email": email, "password": password}
         )
         if response.status_code == 200:
@@ -55,8 +69,8 @@ def register(email: str, password: str) -> Optional[str]:
         JWT token if successful, None otherwise
     """
     try:
-        response = requests.post(
-            f"{BASE_URL}/auth/register",
+        response = api_session.post(
+            "/auth/register",
             json={"email": email, "password": password}
         )
         if response.status_code == 200:
@@ -71,11 +85,217 @@ def get_headers(token: str) -> Dict[str, str]:
     """Get headers with authorization token"""
     return {"Authorization": f"Bearer {token}"}
 
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+def _iter_ndjson(token: str, path: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream a listing as NDJSON, yielding one row at a time
+    
+    Only the current network chunk is held in memory. Failing to open the
+    stream (a requests error or RuntimeError on a non-200 response) and a
+    stream that breaks part-way both raise, so a failed or truncated
+    listing is never mistaken for a complete one.
+    """
+    headers = {**get_headers(token), "Accept": NDJSON_CONTENT_TYPE}
+    response = api_session.get(path, params=params, headers=headers, stream=True)
+    
+    with response:
+        if response.status_code != 200:
+            raise RuntimeError(f"Error opening stream {path}: HTTP {response.status_code}")
+        for line in response.iter_lines():
+            if line:
+                yield json.loads(line)
+
+def _cached_get(
+    token: str,
+    endpoint: str,
+    resource: Optional[int],
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    **kwargs: Any
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, str]]:
+    """
+    GET a JSON endpoint through the read cache
+    
+    Fresh entries are served without a request; stale ones are revalidated
+    with If-None-Match so an unchanged body is not downloaded again.
+    Cached bodies are shared between callers and must not be mutated.
+    
+    Returns:
+        (parsed JSON body or None on a non-200 response, response headers)
+    """
+    key = read_cache.make_key(resource, token, params)
+    entry = read_cache.get(endpoint, key)
+    if entry is not None and entry.fresh:
+        return entry.payload, entry.headers
+    
+    headers = get_headers(token)
+    if entry is not None and entry.etag:
+        headers["If-None-Match"] = entry.etag
+    
+    response = api_session.get(path, params=params, headers=headers, **kwargs)
+    if response.status_code == 304 and entry is not None:
+        read_cache.touch(endpoint, key)
+        return entry.payload, entry.headers
+    if response.status_code != 200:
+        return None, {}
+    
+    payload = response.json()
+    kept_headers = {
+        name: response.headers[name]
+        for name in ("X-Total-Count", "X-Next-Cursor")
+        if name in response.headers
+    }
+    read_cache.put(endpoint, key, payload, kept_headers, response.headers.get("ETag"))
+    return payload, kept_headers
+
+def _invalidate_employee_reads(emp_id: Optional[int] = None, deleted: bool = False):
+    """Drop cached reads affected by a create/update/delete of an employee"""
+    read_cache.invalidate("employees")
+    read_cache.invalidate("stats")
+    if emp_id is not None:
+        read_cache.invalidate("employee", emp_id)
+        if deleted:
+            read_cache.invalidate("history", emp_id)
+
+def add_employee_listener(listener: Callable[[int, Optional[Dict[str, Any]]], None]):
+    """
+    Register a callback for employee writes made through this module
+    
+    After a create or update it is called with (emp_id, the fields sent);
+    after a delete with (emp_id, None). Local indexes use this to update in
+    place instead of waiting for the next replica sync.
+    """
+    _employee_listeners.append(listener)
+
+def _notify_employee_listeners(emp_id: int, fields: Optional[Dict[str, Any]]):
+    for listener in _employee_listeners:
+        try:
+            listener(emp_id, fields)
+        except Exception as e:
+            print(f"Error in employee listener: {e}")
+
 def get_employees(token: str) -> List[Dict[str, Any]]:
     """Get all employees"""
     try:
-        response = requests.get(
-            f"{BASE_URL}/employees",
+        data, _ = _cached_get(token, "employees", None, "/employees")
+        if data and data.get("status") == "success" and data.get("data"):
+            return data["data"]
+        return []
+    except Exception as e:
+        print(f"Error fetching employees: {e}")
+        return []
+
+def iter_employees(
+    token: str,
+    department: Optional[str] = None,
+    designation: Optional[str] = None,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    after: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream employees ordered by emp_id with bounded memory
+    
+    Same filters as get_employees_page, but every matching row is yielded
+    as it arrives instead of being collected into one list. Raises if the
+    stream cannot be opened or breaks part-way.
+    """
+    params = {
+        "department": department,
+        "designation": designation,
+        "status": status,
+        "q": search,
+        "after": after,
+    }
+    return _iter_ndjson(token, "/employees", {k: v for k, v in params.items() if v not in (None, "")})
+
+def get_employees_page(
+    token: str,
+    limit: int = 50,
+    offset: int = 0,
+    department: Optional[str] = None,
+    designation: Optional[str] = None,
+    status: Optional[str] = None,
+    search: Optional[str] = None,
+    after: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Get one page of employees, filtered and searched in the database
+    
+    Args:
+        token: JWT authentication token
+        limit: Page size (capped at 1000 by the API)
+        offset: Rows to skip (ignored rows still count toward `total`)
+        department, designation, status: Exact-match filters
+        search: Case-insensitive match on name, email or phone
+        after: Keyset cursor - only return employees with emp_id > after
+        
+    Returns:
+        {"items": [...], "total": filtered row count, "next_cursor": emp_id or None}
+    """
+    params = {
+        "limit": limit,
+        "offset": offset,
+        "department": department,
+        "designation": designation,
+        "status": status,
+        "q": search,
+        "after": after,
+    }
+    page = {"items": [], "total": 0, "next_cursor": None}
+    try:
+        data, headers = _cached_get(
+            token, "employees", None, "/employees",
+            params={k: v for k, v in params.items() if v not in (None, "")}
+        )
+        if data is not None:
+            if data.get("status") == "success" and data.get("data"):
+                page["items"] = data["data"]
+            page["total"] = int(headers.get("X-Total-Count", len(page["items"])))
+            next_cursor = headers.get("X-Next-Cursor")
+            page["next_cursor"] = int(next_cursor) if next_cursor else None
+        return page
+    except Exception as e:
+        print(f"Error fetching employee page: {e}")
+        return page
+
+def search_employees(
+    token: str,
+    query: str,
+    limit: int = 20,
+    department: Optional[str] = None,
+    designation: Optional[str] = None,
+    status: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Ranked employee lookup in the database (GET /employees/search)
+    
+    Matches name, email, phone and designation by substring or with typos
+    through a trigram index, so it stays fast on large tables.
+    
+    Args:
+        token: JWT authentication token
+        query: Free text, e.g. "jane", "jonh smith", "555 0142"
+        limit: Maximum results (capped at 100 by the API)
+        department, designation, status: Exact-match filters
+        
+    Returns:
+        Matching employees, best match first ([] on error or empty query)
+    """
+    if not query or not query.strip():
+        return []
+    params = {
+        "q": query.strip(),
+        "limit": limit,
+        "department": department,
+        "designation": designation,
+        "status": status,
+    }
+    try:
+        response = api_session.get(
+            "/employees/search",
+            params={k: v for k, v in params.items() if v not in (None, "")},
             headers=get_headers(token)
         )
         if response.status_code == 200:
@@ -84,14 +304,37 @@ def get_employees(token: str) -> List[Dict[str, Any]]:
                 return data["data"]
         return []
     except Exception as e:
-        print(f"Error fetching employees: {e}")
+        print(f"Error searching employees: {e}")
         return []
 
-def get_employee(token: str, emp_id: int) -> Optional[Dict[str, Any]]:
-    """Get employee by ID"""
+def get_employee_stats(token: str) -> Dict[str, Any]:
+    """Get headcount totals and the distinct departments/designations"""
+    stats = {"total": 0, "active": 0, "departments": [], "designations": []}
+    try:
+        data, _ = _cached_get(token, "stats", None, "/employees/stats")
+        if data and data.get("status") == "success" and data.get("data"):
+            stats.update(data["data"])
+        return stats
+    except Exception as e:
+        print(f"Error fetching employee stats: {e}")
+        return stats
+
+def get_employee_changes(token: str, since: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Get employees changed since a point in time
+    
+    Args:
+        token: JWT authentication token
+        since: ISO timestamp (a previous `as_of`); None returns a full snapshot
+        
+    Returns:
+        {"as_of": ..., "upserts": [employee, ...], "deleted": [emp_id, ...]}
+        or None if the request failed
+    """
     try:
-        response = requests.get(
-            f"{BASE_URL}/employees/{emp_id}",
+        response = api_session.get(
+            "/employees/changes",
+            params={"since": since} if since else None,
             headers=get_headers(token)
         )
         if response.status_code == 200:
@@ -99,36 +342,164 @@ def get_employee(token: str, emp_id: int) -> Optional[Dict[str, Any]]:
             if data.get("status") == "success" and data.get("data"):
                 return data["data"]
         return None
+    except Exception as e:
+        print(f"Error fetching employee changes: {e}")
+        return None
+
+def get_employee(token: str, emp_id: int) -> Optional[Dict[str, Any]]:
+    """Get employee by ID"""
+    try:
+        data, _ = _cached_get(token, "employee", emp_id, f"/employees/{emp_id}")
+        if data and data.get("status") == "success" and data.get("data"):
+            return data["data"]
+        return None
     except Exception as e:
         print(f"Error fetching employee: {e}")
         return None
 
+def get_employees_with_history(
+    token: str,
+    emp_ids: Iterable[int],
+    include_history: bool = True,
+    chunk_size: int = 500,
+    timeout: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get many employees (and their employment history) through /employees/batch
+    
+    Ids are sent `chunk_size` at a time (the API accepts up to 1000), so a
+    full roster takes a handful of requests instead of one per employee.
+    
+    Args:
+        token: JWT authentication token
+        emp_ids: Employee IDs to fetch; duplicates are ignored
+        include_history: Embed each employee's history under "history"
+        chunk_size: Ids per request
+        timeout: Optional per-request timeout in seconds
+        
+    Returns:
+        Employee dicts ordered by emp_id; ids that do not exist are missing
+        from the result
+        
+    Raises:
+        RuntimeError (or a requests error) if any chunk fails, so a failed
+        chunk is never mistaken for employees without history
+    """
+    ids = sorted(set(emp_id for emp_id in emp_ids if emp_id))
+    params = {"include": "history"} if include_history else {}
+    kwargs = {"timeout": timeout} if timeout else {}
+    employees: List[Dict[str, Any]] = []
+    
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        response = api_session.post(
+            "/employees/batch",
+            params=params,
+            json={"ids": chunk},
+            headers=get_headers(token),
+            **kwargs
+        )
+        data = response.json() if response.status_code == 200 else {}
+        if data.get("status") != "success":
+            raise RuntimeError(
+                f"Employee batch of {len(chunk)} ids starting at {chunk[0]} failed (HTTP {response.status_code})"
+            )
+        employees.extend(data.get("data") or [])
+    
+    return employees
+
 def create_employee(token: str, employee_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Create a new employee"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/employees",
+        response = api_session.post(
+            "/employees",
             json=employee_data,
             headers=get_headers(token)
         )
         if response.status_code == 200:
+            _invalidate_employee_reads()
             data = response.json()
             if data.get("status") == "success":
-                return data.get("data")
+                created = data.get("data")
+                if created and created.get("emp_id") is not None:
+                    _notify_employee_listeners(created["emp_id"], {**employee_data, **created})
+                return created
         return None
     except Exception as e:
         print(f"Error creating employee: {e}")
         return None
 
+def bulk_create_employees(
+    token: str,
+    employees: Iterable[Dict[str, Any]],
+    chunk_size: int = 500
+) -> Dict[str, Any]:
+    """
+    Create many employees through the batched /employees/bulk endpoint
+    
+    Rows are sent `chunk_size` at a time (the API accepts up to 1000); each
+    chunk is one multi-row INSERT with a single audit entry. Invalid rows
+    are reported without aborting the rest of the batch.
+    
+    Args:
+        token: JWT authentication token
+        employees: Employee dicts in the create_employee format
+        chunk_size: Rows per request
+        
+    Returns:
+        {"inserted": [{"index", "emp_id"}], "errors": [{"index", "error"}]}
+        with indices counted across the whole `employees` iterable
+    """
+    result = {"inserted": [], "errors": []}
+    chunk: List[Dict[str, Any]] = []
+    offset = 0
+    
+    def send(rows: List[Dict[str, Any]], start: int):
+        try:
+            response = api_session.post(
+                "/employees/bulk",
+                json=rows,
+                headers=get_headers(token)
+            )
+            data = response.json() if response.status_code == 200 else {}
+            if data.get("status") == "success" and data.get("data"):
+                for row in data["data"]["inserted"]:
+                    result["inserted"].append({"index": start + row["index"], "emp_id": row["emp_id"]})
+                for row in data["data"]["errors"]:
+                    result["errors"].append({"index": start + row["index"], "error": row["error"]})
+                return
+            message = f"Batch rejected by API (HTTP {response.status_code})"
+        except Exception as e:
+            print(f"Error bulk creating employees: {e}")
+            message = f"Batch failed: {e}"
+        result["errors"].extend({"index": start + i, "error": message} for i in range(len(rows)))
+    
+    for employee in employees:
+        chunk.append(employee)
+        if len(chunk) >= chunk_size:
+            send(chunk, offset)
+            offset += len(chunk)
+            chunk = []
+    if chunk:
+        send(chunk, offset)
+    
+    if result["inserted"]:
+        _invalidate_employee_reads()
+    return result
+
 def update_employee(token: str, emp_id: int, employee_data: Dict[str, Any]) -> bool:
     """Update an employee"""
     try:
-        response = requests.put(
-            f"{BASE_URL}/employees/{emp_id}",
+        response = api_session.put(
+            f"/employees/{emp_id}",
             json=employee_data,
             headers=get_headers(token)
         )
-        return response.status_code == 200
+        if response.status_code == 200:
+            _invalidate_employee_reads(emp_id)
+            _notify_employee_listeners(emp_id, dict(employee_data))
+            return True
+        return False
     except Exception as e:
         print(f"Error updating employee: {e}")
         return False
@@ -136,88 +507,445 @@ def update_employee(token: str, emp_id: int, employee_data: Dict[str, Any]) -> b
 def delete_employee(token: str, emp_id: int) -> bool:
     """Delete an employee"""
     try:
-        response = requests.delete(
-            f"{BASE_URL}/employees/{emp_id}",
+        response = api_session.delete(
+            f"/employees/{emp_id}",
             headers=get_headers(token)
         )
-        return response.status_code == 200
+        if response.status_code == 200:
+            _invalidate_employee_reads(emp_id, deleted=True)
+            _notify_employee_listeners(emp_id, None)
+            return True
+        return False
     except Exception as e:
         print(f"Error deleting employee: {e}")
         return False
 
-def get_employment_history(token: str, emp_id: int) -> List[Dict[str, Any]]:
-    """Get employment history for an employee"""
+def get_employment_history(token: str, emp_id: int, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+    """Get employment history for an employee (optional per-request timeout in seconds)"""
     try:
-        response = requests.get(
-            f"{BASE_URL}/employees/{emp_id}/history",
-            headers=get_headers(token)
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if data.get("status") == "success" and data.get("data"):
-                return data["data"]
+        kwargs = {"timeout": timeout} if timeout else {}
+        data, _ = _cached_get(token, "history", emp_id, f"/employees/{emp_id}/history", **kwargs)
+        if data and data.get("status") == "success" and data.get("data"):
+            return data["data"]
         return []
     except Exception as e:
         print(f"Error fetching employment history: {e}")
         return []
 
+def get_employment_history_stats(token: str) -> Dict[str, Any]:
+    """
+    Get prior-employment aggregates computed in the database
+    
+    Returns:
+        {"employees_with_history", "records", "avg_prior_jobs",
+         "avg_prior_tenure_months", "prior_jobs": [{"jobs", "employees"}],
+         "top_companies": [{"company_name", "employees"}]}
+    """
+    stats = {
+        "employees_with_history": 0,
+        "records": 0,
+        "avg_prior_jobs": None,
+        "avg_prior_tenure_months": None,
+        "prior_jobs": [],
+        "top_companies": [],
+    }
+    try:
+        data, _ = _cached_get(token, "stats", "history", "/employees/history/stats")
+        if data and data.get("status") == "success" and data.get("data"):
+            stats.update(data["data"])
+        return stats
+    except Exception as e:
+        print(f"Error fetching employment history stats: {e}")
+        return stats
+
 def add_employment_history(token: str, emp_id: int, history_data: Dict[str, Any]) -> bool:
     """Add employment history for an employee"""
     try:
-        response = requests.post(
-            f"{BASE_URL}/employees/{emp_id}/history",
+        response = api_session.post(
+            f"/employees/{emp_id}/history",
             json=history_data,
             headers=get_headers(token)
         )
-        return response.status_code == 200
+        if response.status_code == 200:
+            read_cache.invalidate("history", emp_id)
+            read_cache.invalidate("stats", "history")
+            return True
+        return False
     except Exception as e:
         print(f"Error adding employment history: {e}")
         return False
 
-def upload_payslip(token: str, emp_id: int, file_path: str) -> Optional[Dict[str, Any]]:
-    """Upload a payslip PDF for an employee"""
+# Payslips larger than this use the resumable chunked upload API
+PAYSLIP_RESUMABLE_THRESHOLD = int(float(os.getenv("PAYSLIP_RESUMABLE_THRESHOLD_MB", "8")) * 1024 * 1024)
+PAYSLIP_CHUNK_SIZE = int(float(os.getenv("PAYSLIP_CHUNK_MB", "4")) * 1024 * 1024)
+# Consecutive failed chunks tolerated before a resumable upload gives up
+PAYSLIP_UPLOAD_RETRIES = int(os.getenv("PAYSLIP_UPLOAD_RETRIES", "5"))
+
+def get_payslip_upload(token: str, upload_id: str) -> Optional[Dict[str, Any]]:
+    """Get a resumable upload's status ({"upload_id", "size", "offset", ...}), or None if unknown"""
     try:
-        with open(file_path, 'rb') as f:
-            files = {'file': (file_path.split('/')[-1], f, 'application/pdf')}
-            response = requests.post(
-                f"{BASE_URL}/employees/{emp_id}/payslip",
-                files=files,
-                headers=get_headers(token)
-            )
-            if response.status_code == 200:
-                data = response.json()
-                if data.get("status") == "success":
-                    return data.get("data")
+        response = api_session.get(
+            f"/payslip_uploads/{upload_id}",
+            headers=get_headers(token)
+        )
+        if response.status_code == 200:
+            return response.json().get("data")
+        return None
+    except Exception as e:
+        print(f"Error fetching payslip upload: {e}")
+        return None
+
+def _upload_payslip_resumable(
+    token: str,
+    emp_id: int,
+    file: BinaryIO,
+    filename: str,
+    size: int,
+    pay_period: Optional[date],
+    progress: Optional[Callable[[int, int], None]],
+    upload_id: Optional[str],
+) -> Optional[Dict[str, Any]]:
+    """Send a file in PAYSLIP_CHUNK_SIZE pieces, resuming from the server's offset after failures"""
+    status = get_payslip_upload(token, upload_id) if upload_id else None
+    if not status or status.get("size") != size:
+        response = api_session.post(
+            f"/employees/{emp_id}/payslip/uploads",
+            json={
+                "filename": filename,
+                "size": size,
+                "pay_period": pay_period.strftime("%Y-%m") if pay_period else None,
+            },
+            headers=get_headers(token)
+        )
+        if response.status_code != 200:
+            return None
+        status = response.json()["data"]
+
+    upload_id = status["upload_id"]
+    offset = status["offset"]
+    failures = 0
+    while True:
+        file.seek(offset)
+        chunk = file.read(PAYSLIP_CHUNK_SIZE)
+        headers = get_headers(token)
+        headers["Upload-Offset"] = str(offset)
+        headers["Content-Type"] = "application/offset+octet-stream"
+        try:
+            response = api_session.put(f"/payslip_uploads/{upload_id}", data=chunk, headers=headers)
+            data = response.json().get("data") or {}
+        except Exception as e:
+            print(f"Error uploading payslip chunk at {offset}: {e}")
+            response, data = None, {}
+
+        if response is not None and response.status_code == 200:
+            if "payslip_id" in data:
+                if progress:
+                    progress(size, size)
+                return data
+            offset = data["offset"]
+            failures = 0
+            if progress:
+                progress(offset, size)
+            continue
+
+        if response is not None and response.status_code == 409:
+            # Out of sync (e.g. a chunk applied before its response was lost)
+            offset = data["offset"]
+        elif response is not None and response.status_code < 500:
+            return None
+        else:
+            status = get_payslip_upload(token, upload_id)
+            if status:
+                offset = status["offset"]
+
+        failures += 1
+        if failures > PAYSLIP_UPLOAD_RETRIES:
+            print(f"Giving up on payslip upload {upload_id} at byte {offset} of {size}")
+            return None
+
+def upload_payslip(
+    token: str,
+    emp_id: int,
+    file: Union[str, BinaryIO],
+    pay_period: Optional[date] = None,
+    filename: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    upload_id: Optional[str] = None,
+    size: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Upload a payslip (PDF, Excel or Word) for an employee
+    
+    The file is streamed from its path or file object; no temporary copy is
+    made. Files over PAYSLIP_RESUMABLE_THRESHOLD are sent in chunks through
+    the resumable upload API, which picks up where it stopped after a
+    dropped connection.
+    
+    Args:
+        token: JWT authentication token
+        emp_id: Employee ID
+        file: File path or seekable binary file object (e.g. a Streamlit UploadedFile)
+        pay_period: Any date in the month the payslip covers
+        filename: Name sent to the API (default: the file's own name)
+        progress: Called with (bytes sent, total bytes) after each chunk
+        upload_id: Resume this earlier resumable upload of the same file
+        size: File size in bytes, if known; saves seeking to the end of
+            streams where that is expensive (e.g. ZIP entries)
+        
+    Returns:
+        Payslip metadata if successful, None otherwise
+    """
+    try:
+        if isinstance(file, str):
+            with open(file, 'rb') as f:
+                return upload_payslip(token, emp_id, f, pay_period, filename or os.path.basename(file), progress, upload_id)
+
+        filename = filename or os.path.basename(getattr(file, "name", "") or "payslip.pdf")
+        if size is None:
+            file.seek(0, os.SEEK_END)
+            size = file.tell()
+            file.seek(0)
+
+        if size > PAYSLIP_RESUMABLE_THRESHOLD or upload_id:
+            return _upload_payslip_resumable(token, emp_id, file, filename, size, pay_period, progress, upload_id)
+
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        files = {'file': (filename, file, content_type)}
+        form = {'pay_period': pay_period.strftime("%Y-%m")} if pay_period else None
+        response = api_session.post(
+            f"/employees/{emp_id}/payslip",
+            files=files,
+            data=form,
+            headers=get_headers(token)
+        )
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("status") == "success":
+                if progress:
+                    progress(size, size)
+                return data.get("data")
         return None
     except Exception as e:
         print(f"Error uploading payslip: {e}")
         return None
 
-def list_payslips(token: str, emp_id: int) -> List[Dict[str, Any]]:
-    """List all payslips for an employee"""
+def _payslip_params(
+    period: Optional[date] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    checksum: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Query params for the payslip filters (pay period months, start <= period <= end)"""
+    params = {
+        "period": period.strftime("%Y-%m") if period else None,
+        "from": start.strftime("%Y-%m") if start else None,
+        "to": end.strftime("%Y-%m") if end else None,
+        "checksum": checksum,
+    }
+    return {k: v for k, v in params.items() if v}
+
+def get_payslips_page(
+    token: str,
+    emp_id: Optional[int] = None,
+    period: Optional[date] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    checksum: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Get one page of payslip metadata, newest upload first
+    
+    Args:
+        token: JWT authentication token
+        emp_id: Only this employee's payslips (None = all employees)
+        period: Pay period month (any date in the month)
+        start, end: Pay period month range, start <= period <= end
+        limit: Page size (capped at 1000 by the API)
+        cursor: Keyset cursor (`next_cursor` of the previous page)
+        checksum: Only payslips with this SHA-256 (copies of one file)
+        
+    Returns:
+        {"items": [...], "next_cursor": cursor for the next page or None}
+    """
+    page = {"items": [], "next_cursor": None}
+    params = _payslip_params(period, start, end, checksum)
+    params["limit"] = limit
+    if cursor:
+        params["cursor"] = cursor
+    path = f"/employees/{emp_id}/payslips" if emp_id is not None else "/payslips"
     try:
-        response = requests.get(
-            f"{BASE_URL}/employees/{emp_id}/payslips",
+        response = api_session.get(
+            path,
+            params=params,
             headers=get_headers(token)
         )
         if response.status_code == 200:
             data = response.json()
             if data.get("status") == "success" and data.get("data"):
-                return data["data"]
-        return []
+                page["items"] = data["data"]
+            page["next_cursor"] = response.headers.get("X-Next-Cursor")
+        return page
     except Exception as e:
         print(f"Error listing payslips: {e}")
-        return []
+        return page
+
+def list_payslips(
+    token: str,
+    emp_id: Optional[int] = None,
+    period: Optional[date] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    limit: Optional[int] = None,
+    checksum: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    List payslips, newest upload first
+    
+    Args:
+        token: JWT authentication token
+        emp_id: Only this employee's payslips (None = all employees)
+        period: Pay period month (any date in the month)
+        start, end: Pay period month range, start <= period <= end
+        limit: Maximum number of payslips (None = all)
+        checksum: Only payslips with this SHA-256 (copies of one file)
+        
+    Returns:
+        List of payslip metadata dicts
+    """
+    payslips = []
+    cursor = None
+    while True:
+        page_size = min(1000, limit - len(payslips)) if limit else 1000
+        page = get_payslips_page(token, emp_id, period, start, end, limit=page_size, cursor=cursor, checksum=checksum)
+        payslips.extend(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor or (limit and len(payslips) >= limit):
+            return payslips
 
 def get_payslip_url(filename: str) -> str:
     """Get URL for downloading a payslip (browser-accessible)"""
     return f"{PUBLIC_API_URL}/payslip/{filename}"
 
+def _audit_log_params(
+    admin_id: Optional[int] = None,
+    emp_id: Optional[int] = None,
+    action: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Query params for the audit log filters (time range is start <= timestamp < end)"""
+    params = {
+        "admin_id": admin_id,
+        "emp_id": emp_id,
+        "action": action,
+        "from": start.isoformat() if start else None,
+        "to": end.isoformat() if end else None,
+    }
+    return {k: v for k, v in params.items() if v not in (None, "")}
+
+def get_audit_logs_page(
+    token: str,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    admin_id: Optional[int] = None,
+    emp_id: Optional[int] = None,
+    action: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """
+    Get one page of audit logs, newest first
+    
+    Args:
+        token: JWT authentication token
+        limit: Page size (capped at 1000 by the API)
+        cursor: Keyset cursor (`next_cursor` of the previous page)
+        admin_id, emp_id, action: Exact-match filters
+        start, end: Time range, start <= timestamp < end
+        
+    Returns:
+        {"items": [...], "next_cursor": cursor for the next page or None}
+    """
+    page = {"items": [], "next_cursor": None}
+    params = _audit_log_params(admin_id, emp_id, action, start, end)
+    params["limit"] = limit
+    if cursor:
+        params["cursor"] = cursor
+    try:
+        response = api_session.get(
+            "/audit_logs",
+            params=params,
+            headers=get_headers(token)
+        )
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("status") == "success" and data.get("data"):
+                page["items"] = data["data"]
+            page["next_cursor"] = response.headers.get("X-Next-Cursor")
+        return page
+    except Exception as e:
+        print(f"Error fetching audit logs: {e}")
+        return page
+
+def iter_audit_logs(
+    token: str,
+    admin_id: Optional[int] = None,
+    emp_id: Optional[int] = None,
+    action: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream every matching audit entry, newest first, with bounded memory
+    
+    Raises if the stream cannot be opened or breaks part-way.
+    """
+    return _iter_ndjson(token, "/audit_logs", _audit_log_params(admin_id, emp_id, action, start, end))
+
+def get_audit_log_daily_counts(
+    token: str,
+    action: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Get the number of audit entries per day and action
+    
+    Args:
+        token: JWT authentication token
+        action: Only count this action
+        start, end: Day range, start <= day < end
+        
+    Returns:
+        [{"day": "YYYY-MM-DD", "action": ..., "count": ...}] ordered by day
+    """
+    params = {
+        "action": action,
+        "from": start.isoformat() if start else None,
+        "to": end.isoformat() if end else None,
+    }
+    try:
+        response = api_session.get(
+            "/audit_logs/daily_counts",
+            params={k: v for k, v in params.items() if v},
+            headers=get_headers(token)
+        )
+        if response.status_code == 200:
+            data = response.json()
+            if data.get("status") == "success" and data.get("data"):
+                return data["data"]
+        return []
+    except Exception as e:
+        print(f"Error fetching audit log counts: {e}")
+        return []
+
 def get_audit_logs(token: str) -> List[Dict[str, Any]]:
     """Get audit logs"""
     try:
-        response = requests.get(
-            f"{BASE_URL}/audit_logs",
+        response = api_session.get(
+            "/audit_logs",
             headers=get_headers(token)
         )
         if response.status_code == 200:
@@ -19,11 +19,26 @@ REQUIRED_FILES = [
     "app.py"
 ]
 
+# Result of the first check; the files cannot change under a running process
+_verified = None
+
+
 def verify_signature():
     """
     Verify that developer signature exists in critical files.
     If signature is missing, the application will not start.
+    
+    The files are read once per process; later calls (every Streamlit
+    script run) return the first result.
     """
+    global _verified
+    if _verified is None:
+        _verified = _check_signature()
+    return _verified
+
+
+def _check_signature():
+    """Read REQUIRED_FILES and report whether enough of them carry the signature"""
     project_path = os.path.dirname(os.path.dirname(__file__))
     found_count = 0
     
@@ -0,0 +1,187 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Bulk employee import from CSV or Excel files
+
+Files are read in chunks, validated column-wise with pandas, and each
+chunk's valid rows are sent to the batched /employees/bulk endpoint.
+Bad rows are collected into a per-row error report; they never abort
+the rest of the file.
+"""
+import os
+from datetime import date, datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from .api_client import bulk_create_employees
+
+IMPORT_COLUMNS = [
+    "first_name", "last_name", "email", "phone",
+    "department", "designation", "joining_date", "status",
+]
+REQUIRED_COLUMNS = ["first_name", "last_name"]
+OPTIONAL_COLUMNS = ["email", "phone", "department", "designation", "joining_date"]
+VALID_STATUSES = {"Active", "Inactive"}
+EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+# Rows read, validated and sent per request (the API accepts up to 1000)
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "500"))
+
+
+def _normalize_header(name: Any) -> str:
+    """Map headers such as "First Name" or "first-name" to first_name"""
+    return str(name).strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def _cell_text(value: Any) -> str:
+    """Render an Excel cell as the text a CSV would contain"""
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))  # phone numbers typed as numbers
+    return str(value)
+
+
+def iter_file_chunks(file: BinaryIO, filename: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or XLSX file as a stream of DataFrame chunks of text columns
+
+    Args:
+        file: Binary file-like object (e.g. a Streamlit UploadedFile)
+        filename: Original filename, used to pick the parser
+        chunk_size: Rows per chunk
+
+    Yields:
+        DataFrames with normalized column names and string values
+    """
+    extension = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+    if extension == "csv":
+        reader = pd.read_csv(file, dtype=str, keep_default_na=False, chunksize=chunk_size)
+        for chunk in reader:
+            yield chunk.rename(columns=_normalize_header)
+    elif extension == "xlsx":
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [_normalize_header(h) for h in next(rows, ())]
+            batch = []
+            for row in rows:
+                if not any(cell is not None for cell in row):
+                    continue
+                batch.append([_cell_text(cell) for cell in row[:len(header)]])
+                if len(batch) >= chunk_size:
+                    yield pd.DataFrame(batch, columns=header)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=header)
+        finally:
+            workbook.close()
+    else:
+        raise ValueError("Unsupported file type. Upload a .csv or .xlsx file")
+
+
+def validate_chunk(df: pd.DataFrame, first_row: int) -> Tuple[List[Dict[str, Any]], List[int], List[Dict[str, Any]]]:
+    """
+    Validate one chunk of import rows
+
+    Args:
+        df: Chunk from iter_file_chunks
+        first_row: File row number of the chunk's first data row
+
+    Returns:
+        (employee dicts ready for bulk_create_employees,
+         file row number of each of those dicts,
+         [{"row", "error"}] for rejected rows)
+    """
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required column(s): {', '.join(missing)}")
+
+    df = df.reindex(columns=IMPORT_COLUMNS, fill_value="").fillna("").astype(str)
+    df = df.apply(lambda col: col.str.strip())
+    df.index = pd.RangeIndex(first_row, first_row + len(df))
+
+    status = df["status"].str.capitalize().replace("", "Active")
+    joining_date = pd.to_datetime(df["joining_date"], format="%Y-%m-%d", errors="coerce")
+
+    checks = [
+        ((df["first_name"] == "") | (df["last_name"] == ""), "first_name and last_name are required"),
+        ((df["email"] != "") & ~df["email"].str.match(EMAIL_PATTERN), "invalid email"),
+        ((df["joining_date"] != "") & joining_date.isna(), "joining_date must be YYYY-MM-DD"),
+        (~status.isin(VALID_STATUSES), "status must be Active or Inactive"),
+    ]
+    problems = pd.Series("", index=df.index)
+    for mask, message in checks:
+        problems = problems.where(~mask, problems + message + "; ")
+
+    invalid = problems != ""
+    errors = [
+        {"row": int(row), "error": message.rstrip("; ")}
+        for row, message in problems[invalid].items()
+    ]
+
+    valid = df[~invalid].copy()
+    valid["status"] = status[~invalid]
+    valid["joining_date"] = joining_date[~invalid].dt.strftime("%Y-%m-%d").fillna("")
+    # The API expects null, not "", for missing optional fields
+    valid[OPTIONAL_COLUMNS] = valid[OPTIONAL_COLUMNS].astype(object).where(valid[OPTIONAL_COLUMNS] != "", None)
+    records = valid[IMPORT_COLUMNS].to_dict("records")
+
+    return records, [int(row) for row in valid.index], errors
+
+
+def import_employees(
+    token: str,
+    file: BinaryIO,
+    filename: str,
+    chunk_size: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Import every row of a CSV/XLSX file through the bulk API
+
+    Args:
+        token: JWT authentication token
+        file: Binary file-like object
+        filename: Original filename (.csv or .xlsx)
+        chunk_size: Rows per chunk/request (default IMPORT_CHUNK_SIZE)
+        progress: Called with the number of rows processed after each chunk
+
+    Returns:
+        {"rows": rows read, "inserted": rows created,
+         "errors": [{"row": file row number, "error": message}]}
+    """
+    chunk_size = chunk_size or IMPORT_CHUNK_SIZE
+    report = {"rows": 0, "inserted": 0, "errors": []}
+
+    for chunk in iter_file_chunks(file, filename, chunk_size):
+        # Row 1 is the header, so data starts on row 2
+        records, row_numbers, errors = validate_chunk(chunk, report["rows"] + 2)
+        report["errors"].extend(errors)
+
+        if records:
+            result = bulk_create_employees(token, records, chunk_size=chunk_size)
+            report["inserted"] += len(result["inserted"])
+            report["errors"].extend(
+                {"row": row_numbers[e["index"]], "error": e["error"]} for e in result["errors"]
+            )
+
+        report["rows"] += len(chunk)
+        if progress:
+            progress(report["rows"])
+
+    report["errors"].sort(key=lambda e: e["row"])
+    return report
@@ -0,0 +1,170 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Content-addressed cache for generated export files
+
+Artifacts are stored under EXPORTS_DIR/cache/<key>/<filename>, where the
+key hashes the export kind with a fingerprint of the exported data. A
+repeat export of unchanged data returns the existing file instead of
+rebuilding it, and different data never overwrites an earlier file with
+the same name. Old and least recently used artifacts are evicted by age
+and total size.
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Tunables (override with environment variables)
+EXPORT_CACHE_MAX_MB = float(os.getenv("EXPORT_CACHE_MAX_MB", "512"))
+EXPORT_CACHE_MAX_AGE_HOURS = float(os.getenv("EXPORT_CACHE_MAX_AGE_HOURS", "168"))
+
+# Prefix (not suffix) so writers that check the extension still accept the path
+PARTIAL_PREFIX = ".partial-"
+
+
+def data_fingerprint(*parts: Any) -> str:
+    """Stable SHA-256 of JSON-serializable export inputs (rows, history, options)"""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ExportCache:
+    """Thread-safe artifact cache with age and size based eviction"""
+
+    def __init__(self, root: str, max_bytes: Optional[int] = None, max_age: Optional[float] = None):
+        self.root = root
+        self.max_bytes = max_bytes if max_bytes is not None else int(EXPORT_CACHE_MAX_MB * 1024 * 1024)
+        self.max_age = max_age if max_age is not None else EXPORT_CACHE_MAX_AGE_HOURS * 3600
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    @staticmethod
+    def make_key(kind: str, fingerprint: str) -> str:
+        return hashlib.sha256(f"{kind}:{fingerprint}".encode("utf-8")).hexdigest()[:32]
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _find(self, key: str) -> Optional[str]:
+        entry_dir = os.path.join(self.root, key)
+        try:
+            names = [n for n in os.listdir(entry_dir) if not n.startswith(PARTIAL_PREFIX)]
+        except FileNotFoundError:
+            return None
+        if not names:
+            return None
+        # The entry directory's mtime records the last use for eviction
+        os.utime(entry_dir)
+        return os.path.join(entry_dir, names[0])
+
+    def lookup(self, kind: str, fingerprint: str) -> Optional[str]:
+        """Path of the cached artifact for this data, or None"""
+        return self._find(self.make_key(kind, fingerprint))
+
+    def get_or_build(
+        self,
+        kind: str,
+        fingerprint: str,
+        filename: str,
+        build: Callable[[str], bool],
+    ) -> Optional[str]:
+        """
+        Return the cached artifact, building it on a miss
+
+        Args:
+            kind: Export type plus any options that change the output (e.g. "excel-xlsxwriter")
+            fingerprint: data_fingerprint() of the exported data
+            filename: Download filename for a newly built artifact
+            build: Writes the artifact to the given path; returns False if
+                there was nothing to export
+
+        Returns:
+            Path to the artifact, or None if build produced nothing
+        """
+        key = self.make_key(kind, fingerprint)
+        # Concurrent requests for the same artifact build it once
+        with self._key_lock(key):
+            cached = self._find(key)
+            if cached:
+                return cached
+
+            entry_dir = os.path.join(self.root, key)
+            os.makedirs(entry_dir, exist_ok=True)
+            staging_path = os.path.join(entry_dir, PARTIAL_PREFIX + filename)
+            try:
+                built = build(staging_path)
+            except Exception:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                raise
+            if not built or not os.path.exists(staging_path):
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                return None
+
+            # Publish atomically so readers never see a half-written file
+            filepath = os.path.join(entry_dir, filename)
+            os.replace(staging_path, filepath)
+
+        self.evict(keep=key)
+        return filepath
+
+    def evict(self, keep: Optional[str] = None):
+        """
+        Drop artifacts unused for longer than max_age, then the least
+        recently used ones until the cache fits in max_bytes
+
+        Args:
+            keep: Key that is never evicted (the artifact just returned)
+        """
+        entries = []
+        now = time.time()
+        try:
+            keys = os.listdir(self.root)
+        except FileNotFoundError:
+            return
+
+        for key in keys:
+            entry_dir = os.path.join(self.root, key)
+            try:
+                last_used = os.path.getmtime(entry_dir)
+                size = sum(
+                    os.path.getsize(os.path.join(entry_dir, name))
+                    for name in os.listdir(entry_dir)
+                    if not name.startswith(PARTIAL_PREFIX)
+                )
+            except OSError:
+                continue
+            entries.append((last_used, size, key))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for last_used, size, key in entries:
+            if key == keep or self._key_lock(key).locked():
+                continue
+            if now - last_used > self.max_age or total > self.max_bytes:
+                shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+                total -= size
+
+
+_cache: Optional[ExportCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_export_cache() -> ExportCache:
+    """Get the process-wide export cache under EXPORTS_DIR/cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from .export_utils import EXPORTS_DIR
+
+            _cache = ExportCache(os.path.join(EXPORTS_DIR, "cache"))
+        return _cache
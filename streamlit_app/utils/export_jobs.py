@@ -0,0 +1,371 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Background export jobs
+
+Exports are submitted as jobs and run on a worker pool outside the
+Streamlit script, so a long export survives page reloads and every
+admin can see and download it. Job state is persisted as JSON under
+EXPORTS_DIR/jobs. ZIP exports checkpoint each rendered chunk, so an
+interrupted job resumes where it stopped instead of starting over.
+Finished files live in the export cache (see export_cache.py).
+Tokens are never written to disk; resuming needs the caller's token.
+"""
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .export_cache import data_fingerprint, get_export_cache
+from .export_utils import (
+    EXPORTS_DIR,
+    get_timestamp,
+    export_all_to_excel,
+    export_all_to_pdf,
+    export_employee_to_word,
+    export_employee_to_pdf,
+    _write_pdf_entry,
+)
+from .prefetch import fetch_histories
+from .render_pool import RenderPool
+from .replica import get_synced_employees
+
+# Tunables (override with environment variables)
+EXPORT_JOB_WORKERS = int(os.getenv("EXPORT_JOB_WORKERS", "2"))
+# Employees rendered per ZIP checkpoint
+EXPORT_JOB_CHUNK_SIZE = int(os.getenv("EXPORT_JOB_CHUNK_SIZE", "200"))
+
+JOBS_DIR = os.path.join(EXPORTS_DIR, "jobs")
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+INTERRUPTED = "interrupted"
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+RESUMABLE_STATUSES = (FAILED, INTERRUPTED)
+
+
+@dataclass
+class ExportJob:
+    """Persisted state of one export job"""
+    job_id: str
+    kind: str
+    params: Dict[str, Any]
+    owner: str = ""
+    status: str = QUEUED
+    progress: float = 0.0
+    message: str = "Queued"
+    result_path: Optional[str] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    # Runner-specific resume state (e.g. ZIP chunks already rendered)
+    checkpoint: Dict[str, Any] = field(default_factory=dict)
+
+
+class JobContext:
+    """Handle a runner uses to report progress and persist its checkpoint"""
+
+    def __init__(self, manager: "ExportJobManager", job: ExportJob):
+        self._manager = manager
+        self._job = job
+        self.checkpoint = job.checkpoint
+        self.work_dir = os.path.join(manager.jobs_dir, job.job_id)
+
+    def report(self, progress: float, message: str = ""):
+        self._manager._update(self._job, progress=min(max(progress, 0.0), 1.0), message=message)
+
+    def save_checkpoint(self):
+        self._manager._update(self._job, checkpoint=self.checkpoint)
+
+
+def _run_excel(token: str, params: Dict[str, Any], ctx: JobContext) -> Optional[str]:
+    ctx.report(0.1, "Writing spreadsheet")
+    return export_all_to_excel(token)
+
+
+def _run_pdf(token: str, params: Dict[str, Any], ctx: JobContext) -> Optional[str]:
+    ctx.report(0.1, "Rendering report")
+    return export_all_to_pdf(token)
+
+
+def _run_word(token: str, params: Dict[str, Any], ctx: JobContext) -> Optional[str]:
+    ctx.report(0.1, "Rendering document")
+    return export_employee_to_word(params["emp_id"], token)
+
+
+def _run_employee_pdf(token: str, params: Dict[str, Any], ctx: JobContext) -> Optional[str]:
+    ctx.report(0.1, "Rendering document")
+    return export_employee_to_pdf(params["emp_id"], token)
+
+
+def _run_zip(token: str, params: Dict[str, Any], ctx: JobContext) -> Optional[str]:
+    """
+    Build the per-employee PDF archive in checkpointed chunks
+
+    The first run snapshots every employee and their history into the
+    job's work dir and checks the export cache. On a miss each chunk is
+    rendered into its own part archive; resuming skips finished parts and
+    renders the rest from the same snapshot, so the assembled ZIP is the
+    same as an uninterrupted run.
+    """
+    checkpoint = ctx.checkpoint
+    snapshot_path = os.path.join(ctx.work_dir, "items.json")
+
+    if "fingerprint" not in checkpoint:
+        employees = sorted(
+            (emp for emp in get_synced_employees(token) if emp.get("emp_id")),
+            key=lambda emp: emp["emp_id"],
+        )
+        if not employees:
+            return None
+
+        ctx.report(0.0, f"Fetching history for {len(employees)} employees")
+        histories = fetch_histories(token, (emp["emp_id"] for emp in employees))
+        items = [(emp, histories.get(emp["emp_id"], [])) for emp in employees]
+
+        fingerprint = data_fingerprint(items)
+        cached = get_export_cache().lookup("zip", fingerprint)
+        if cached:
+            return cached
+
+        os.makedirs(ctx.work_dir, exist_ok=True)
+        with open(snapshot_path, "w") as f:
+            json.dump(items, f)
+        checkpoint.update(
+            fingerprint=fingerprint,
+            generated_at=datetime.now().replace(microsecond=0).isoformat(),
+            chunk_size=EXPORT_JOB_CHUNK_SIZE,
+            parts_done=0,
+        )
+        ctx.save_checkpoint()
+    else:
+        with open(snapshot_path) as f:
+            items = [tuple(item) for item in json.load(f)]
+
+    generated_at = datetime.fromisoformat(checkpoint["generated_at"])
+    chunk_size = checkpoint["chunk_size"]
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    part_paths = [os.path.join(ctx.work_dir, f"part_{n:05d}.zip") for n in range(len(chunks))]
+
+    # One pool for the whole job: worker start-up (imports) is paid once
+    with RenderPool() as render_pool:
+        for part_no in range(checkpoint["parts_done"], len(chunks)):
+            # PDFs are already compressed; parts just hold them until assembly
+            partial_path = f"{part_paths[part_no]}.partial"
+            with zipfile.ZipFile(partial_path, "w", zipfile.ZIP_STORED) as part:
+                for emp, pdf_bytes in render_pool.render(chunks[part_no], generated_at):
+                    if pdf_bytes is not None:
+                        part.writestr(f"{emp['emp_id']}.pdf", pdf_bytes)
+            os.replace(partial_path, part_paths[part_no])
+
+            checkpoint["parts_done"] = part_no + 1
+            ctx.save_checkpoint()
+            done = min((part_no + 1) * chunk_size, len(items))
+            ctx.report(0.95 * done / len(items), f"Rendered {done} of {len(items)} employees")
+
+    ctx.report(0.95, "Assembling archive")
+    by_id = {emp["emp_id"]: emp for emp, _ in items}
+
+    def assemble(zip_filepath: str) -> bool:
+        written = 0
+        with zipfile.ZipFile(zip_filepath, "w", zipfile.ZIP_DEFLATED) as zipf:
+            used_names = set()
+            for part_path in part_paths:
+                with zipfile.ZipFile(part_path) as part:
+                    for name in part.namelist():
+                        emp = by_id[int(name.rsplit(".", 1)[0])]
+                        _write_pdf_entry(zipf, emp, part.read(name), generated_at, used_names)
+                        written += 1
+        return written > 0
+
+    return get_export_cache().get_or_build(
+        "zip",
+        checkpoint["fingerprint"],
+        f"Employee_PDFs_Archive_{get_timestamp()}.zip",
+        assemble,
+    )
+
+
+JOB_RUNNERS: Dict[str, Callable[[str, Dict[str, Any], JobContext], Optional[str]]] = {
+    "excel": _run_excel,
+    "pdf": _run_pdf,
+    "zip": _run_zip,
+    "word": _run_word,
+    "employee_pdf": _run_employee_pdf,
+}
+
+JOB_LABELS = {
+    "excel": "All Employees (Excel)",
+    "pdf": "All Employees (PDF)",
+    "zip": "All Employees (ZIP Archive)",
+    "word": "Single Employee (Word)",
+    "employee_pdf": "Single Employee (PDF)",
+}
+
+
+class ExportJobManager:
+    """Queue, run and track export jobs on a thread pool"""
+
+    def __init__(self, jobs_dir: str = JOBS_DIR, workers: Optional[int] = None):
+        self.jobs_dir = jobs_dir
+        self._jobs: Dict[str, ExportJob] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, workers or EXPORT_JOB_WORKERS),
+            thread_name_prefix="export-job",
+        )
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        self._load()
+
+    def _job_path(self, job_id: str) -> str:
+        return os.path.join(self.jobs_dir, f"{job_id}.json")
+
+    def _load(self):
+        """Reload persisted jobs; ones that were in flight are marked interrupted"""
+        for name in os.listdir(self.jobs_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.jobs_dir, name)) as f:
+                    job = ExportJob(**json.load(f))
+            except Exception as e:
+                print(f"Error loading export job {name}: {e}")
+                continue
+
+            if job.status in ACTIVE_STATUSES:
+                # The process running it is gone, but its checkpoint is not
+                job.status = INTERRUPTED
+                job.message = "Interrupted - resume to continue from the last checkpoint"
+                self._save(job)
+            self._jobs[job.job_id] = job
+
+    def _save(self, job: ExportJob):
+        """Write job state atomically (caller holds the lock or owns the job)"""
+        path = self._job_path(job.job_id)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(asdict(job), f)
+        os.replace(f"{path}.tmp", path)
+
+    def _update(self, job: ExportJob, **changes):
+        with self._lock:
+            for name, value in changes.items():
+                setattr(job, name, value)
+            job.updated_at = time.time()
+            self._save(job)
+
+    def _run(self, job: ExportJob, token: str):
+        self._update(job, status=RUNNING, message="Starting")
+        ctx = JobContext(self, job)
+        error = None
+        try:
+            result_path = JOB_RUNNERS[job.kind](token, job.params, ctx)
+        except Exception as e:
+            print(f"Error running export job {job.job_id}: {e}")
+            result_path = None
+            error = str(e)
+
+        if result_path:
+            self._update(job, status=DONE, progress=1.0, message="Done", result_path=result_path)
+            shutil.rmtree(ctx.work_dir, ignore_errors=True)
+        else:
+            self._update(job, status=FAILED, message="Failed", error=error or "Export produced no file")
+
+    def submit(self, kind: str, token: str, params: Optional[Dict[str, Any]] = None, owner: str = "") -> str:
+        """
+        Queue an export job
+
+        Args:
+            kind: One of JOB_RUNNERS ("excel", "pdf", "zip", "word", "employee_pdf")
+            token: JWT authentication token (kept in memory only)
+            params: Runner parameters, e.g. {"emp_id": 5} for single-employee exports
+            owner: Who submitted the job, for display
+
+        Returns:
+            Job id. An identical job that is already queued or running is
+            shared instead of starting a second one.
+        """
+        if kind not in JOB_RUNNERS:
+            raise ValueError(f"Unknown export job kind: {kind}")
+        params = params or {}
+
+        with self._lock:
+            for job in self._jobs.values():
+                if job.kind == kind and job.params == params and job.status in ACTIVE_STATUSES:
+                    return job.job_id
+
+            job = ExportJob(job_id=uuid.uuid4().hex[:12], kind=kind, params=params, owner=owner)
+            self._jobs[job.job_id] = job
+            self._save(job)
+
+        self._executor.submit(self._run, job, token)
+        return job.job_id
+
+    def resume(self, job_id: str, token: str) -> bool:
+        """Re-queue a failed or interrupted job from its last checkpoint"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in RESUMABLE_STATUSES:
+                return False
+            job.status = QUEUED
+            job.error = None
+            job.message = "Queued to resume"
+            job.updated_at = time.time()
+            self._save(job)
+
+        self._executor.submit(self._run, job, token)
+        return True
+
+    def remove(self, job_id: str) -> bool:
+        """Forget a job that is not running; its exported file is kept"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in ACTIVE_STATUSES:
+                return False
+            del self._jobs[job_id]
+            try:
+                os.remove(self._job_path(job_id))
+            except FileNotFoundError:
+                pass
+        shutil.rmtree(os.path.join(self.jobs_dir, job_id), ignore_errors=True)
+        return True
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Snapshot of one job's state (status, progress, message, result_path, ...)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return asdict(job) if job else None
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Snapshots of all jobs, newest first"""
+        with self._lock:
+            jobs = [asdict(job) for job in self._jobs.values()]
+        return sorted(jobs, key=lambda job: job["created_at"], reverse=True)
+
+
+_manager: Optional[ExportJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> ExportJobManager:
+    """Get the process-wide export job manager, creating it on first use"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ExportJobManager()
+        return _manager
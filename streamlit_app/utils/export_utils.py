@@ -8,24 +8,38 @@
 """
 Export Utilities for Employee Management System
 Handles Excel, Word, and PDF exports for employee data
+
+pandas, python-docx and fpdf are imported inside the functions that use
+them, so pages that merely import this module do not pay their import
+time until an export actually runs.
 """
+import csv
+import itertools
 import os
-import pandas as pd
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from fpdf import FPDF
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
 import zipfile
-import tempfile
 
-from .api_client import BASE_URL, get_headers, get_employees, get_employee, get_employment_history
+from .api_client import BASE_URL, get_headers, get_employee, get_employment_history, iter_audit_logs
+from .export_cache import data_fingerprint, get_export_cache
+from .prefetch import fetch_histories
+from .replica import get_synced_employees
+from .render_pool import iter_rendered_pdfs
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from docx.document import Document
+    from fpdf import FPDF
 
 
-# Create exports directory if it doesn't exist
+# Exports are written here; the directory is created on first use
 EXPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "exports")
-os.makedirs(EXPORTS_DIR, exist_ok=True)
+
+
+def ensure_exports_dir() -> str:
+    """Create EXPORTS_DIR if needed and return it"""
+    os.makedirs(EXPORTS_DIR, exist_ok=True)
+    return EXPORTS_DIR
 
 
 def get_timestamp() -> str:
@@ -33,83 +47,253 @@ def get_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d")
 
 
-def export_all_to_excel(token: str) -> Optional[str]:
+# Excel writer engine: "xlsxwriter" streams rows in constant memory,
+# "openpyxl" is the original in-memory writer kept for comparison
+EXCEL_EXPORT_ENGINE = os.getenv("EXCEL_EXPORT_ENGINE", "xlsxwriter")
+EXCEL_MAX_COLUMN_WIDTH = 50
+
+
+def _employees_to_frame(employees: List[Dict[str, Any]]) -> "pd.DataFrame":
+    """
+    Build the export DataFrame from API rows with column-wise operations
+    
+    Args:
+        employees: Employee records as returned by the API
+        
+    Returns:
+        DataFrame with the export column names, empty strings for missing values
+    """
+    import pandas as pd
+    
+    fields = [
+        "emp_id", "first_name", "last_name", "email", "phone",
+        "department", "designation", "joining_date", "status", "created_at",
+    ]
+    raw = pd.DataFrame.from_records(employees).reindex(columns=fields)
+    text = raw.astype(object).where(raw.notna(), "")
+    
+    return pd.DataFrame({
+        "Employee ID": text["emp_id"],
+        "First Name": text["first_name"],
+        "Last Name": text["last_name"],
+        "Full Name": (text["first_name"].astype(str) + " " + text["last_name"].astype(str)).str.strip(),
+        "Email": text["email"],
+        "Phone": text["phone"],
+        "Department": text["department"],
+        "Designation": text["designation"],
+        "Joining Date": text["joining_date"],
+        "Status": text["status"],
+        "Created At": text["created_at"],
+    })
+
+
+def _column_widths(df: "pd.DataFrame") -> List[int]:
+    """Compute Excel column widths from the longest value (or header) per column"""
+    import pandas as pd
+    
+    value_lengths = df.astype(str).apply(lambda col: col.str.len().max()).fillna(0)
+    header_lengths = pd.Series([len(str(c)) for c in df.columns], index=df.columns)
+    widths = pd.concat([value_lengths, header_lengths], axis=1).max(axis=1) + 2
+    return widths.clip(upper=EXCEL_MAX_COLUMN_WIDTH).astype(int).tolist()
+
+
+def _write_excel_xlsxwriter(df: "pd.DataFrame", filepath: str):
+    """
+    Write the export with xlsxwriter in constant_memory mode
+    
+    Rows are flushed to disk as they are written, so memory stays flat
+    regardless of row count. Widths and header style are set up front
+    instead of by revisiting every cell.
+    """
+    import xlsxwriter
+    
+    workbook = xlsxwriter.Workbook(filepath, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet("Employees")
+        header_format = workbook.add_format({
+            "bold": True,
+            "font_color": "#FFFFFF",
+            "font_size": 11,
+            "bg_color": "#366092",
+            "align": "center",
+            "valign": "vcenter",
+        })
+        
+        for col_idx, width in enumerate(_column_widths(df)):
+            worksheet.set_column(col_idx, col_idx, width)
+        
+        # constant_memory requires strictly row-by-row writes
+        worksheet.write_row(0, 0, list(df.columns), header_format)
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None), 1):
+            worksheet.write_row(row_idx, 0, row)
+    finally:
+        workbook.close()
+
+
+def _write_excel_openpyxl(df: "pd.DataFrame", filepath: str):
+    """Write the export with openpyxl, sizing columns by scanning every cell"""
+    import pandas as pd
+    
+    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Employees', index=False)
+        
+        # Get the workbook and worksheet
+        workbook = writer.book
+        worksheet = writer.sheets['Employees']
+        
+        # Auto-adjust column widths
+        for column in worksheet.columns:
+            max_length = 0
+            column_letter = column[0].column_letter
+            for cell in column:
+                try:
+                    if len(str(cell.value)) > max_length:
+                        max_length = len(str(cell.value))
+                except:
+                    pass
+            adjusted_width = min(max_length + 2, EXCEL_MAX_COLUMN_WIDTH)
+            worksheet.column_dimensions[column_letter].width = adjusted_width
+        
+        # Format header row
+        from openpyxl.styles import Font, PatternFill, Alignment
+        
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF", size=11)
+        
+        for cell in worksheet[1]:
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = Alignment(horizontal="center", vertical="center")
+
+
+EXCEL_WRITERS = {
+    "xlsxwriter": _write_excel_xlsxwriter,
+    "openpyxl": _write_excel_openpyxl,
+}
+
+
+def export_all_to_excel(token: str, engine: Optional[str] = None) -> Optional[str]:
     """
     Export all employees to Excel format
     
+    Args:
+        token: JWT authentication token
+        engine: "xlsxwriter" (constant memory) or "openpyxl" (default EXCEL_EXPORT_ENGINE)
+    
     Returns:
         Path to generated Excel file or None if error
     """
     try:
-        # Get all employees from API
-        employees = get_employees(token)
+        # Get all employees from the delta-synced replica
+        employees = get_synced_employees(token)
         
         if not employees:
             return None
         
-        # Prepare data for DataFrame
-        excel_data = []
-        for emp in employees:
-            excel_data.append({
-                "Employee ID": emp.get("emp_id", ""),
-                "First Name": emp.get("first_name", ""),
-                "Last Name": emp.get("last_name", ""),
-                "Full Name": f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip(),
-                "Email": emp.get("email") or "",
-                "Phone": emp.get("phone") or "",
-                "Department": emp.get("department") or "",
-                "Designation": emp.get("designation") or "",
-                "Joining Date": emp.get("joining_date") or "",
-                "Status": emp.get("status", ""),
-                "Created At": emp.get("created_at", ""),
-            })
-        
-        # Create DataFrame
-        df = pd.DataFrame(excel_data)
-        
-        # Generate filename
-        filename = f"employee_data_{get_timestamp()}.xlsx"
-        filepath = os.path.join(EXPORTS_DIR, filename)
-        
-        # Write to Excel with formatting
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Employees', index=False)
-            
-            # Get the workbook and worksheet
-            workbook = writer.book
-            worksheet = writer.sheets['Employees']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Format header row
-            from openpyxl.styles import Font, PatternFill, Alignment
-            
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_font = Font(bold=True, color="FFFFFF", size=11)
-            
-            for cell in worksheet[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+        engine = engine or EXCEL_EXPORT_ENGINE
+        writer = EXCEL_WRITERS[engine]
         
-        return filepath
+        def build(filepath: str) -> bool:
+            writer(_employees_to_frame(employees), filepath)
+            return True
+        
+        # Unchanged data is served from the export cache instead of rebuilt
+        return get_export_cache().get_or_build(
+            f"excel-{engine}",
+            data_fingerprint(employees),
+            f"employee_data_{get_timestamp()}.xlsx",
+            build,
+        )
         
     except Exception as e:
         print(f"Error exporting to Excel: {e}")
         return None
 
 
+def _build_employee_docx(emp: Dict[str, Any], history: List[Dict[str, Any]]) -> "Document":
+    """
+    Render a single employee profile into a Word document
+    
+    Args:
+        emp: Employee record as returned by the API
+        history: Employment history records for the employee
+        
+    Returns:
+        python-docx Document ready to be saved
+    """
+    from docx import Document
+    from docx.shared import Inches, Pt
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    
+    # Create Word document
+    doc = Document()
+    
+    # Set document margins
+    sections = doc.sections
+    for section in sections:
+        section.top_margin = Inches(0.5)
+        section.bottom_margin = Inches(0.5)
+        section.left_margin = Inches(1)
+        section.right_margin = Inches(1)
+    
+    # Title
+    title = doc.add_heading(f"Employee Profile", 0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    # Employee Name
+    name_para = doc.add_paragraph()
+    name_run = name_para.add_run(f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip())
+    name_run.font.size = Pt(20)
+    name_run.bold = True
+    name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph()  # Spacing
+    
+    # Basic Information Section
+    doc.add_heading("Basic Information", level=1)
+    
+    info_items = [
+        ("Employee ID", str(emp.get("emp_id", ""))),
+        ("Department", emp.get("department") or "N/A"),
+        ("Designation", emp.get("designation") or "N/A"),
+        ("Email", emp.get("email") or "N/A"),
+        ("Phone", emp.get("phone") or "N/A"),
+        ("Joining Date", str(emp.get("joining_date") or "N/A")),
+        ("Status", emp.get("status", "N/A")),
+    ]
+    
+    for label, value in info_items:
+        para = doc.add_paragraph()
+        para.add_run(f"{label}: ").bold = True
+        para.add_run(value)
+    
+    doc.add_paragraph()  # Spacing
+    
+    # Employment History Section
+    if history:
+        doc.add_heading("Employment History", level=1)
+        for idx, hist in enumerate(history, 1):
+            doc.add_paragraph(f"{idx}. {hist.get('company_name', 'N/A')}", style='List Bullet')
+            para = doc.add_paragraph()
+            para.add_run("   Position: ").bold = True
+            para.add_run(hist.get("position", "N/A"))
+            para = doc.add_paragraph()
+            para.add_run("   Duration: ").bold = True
+            para.add_run(f"{hist.get('start_date', 'N/A')} to {hist.get('end_date', 'N/A')}")
+            doc.add_paragraph()  # Spacing
+    else:
+        doc.add_heading("Employment History", level=1)
+        doc.add_paragraph("No previous employment history recorded.")
+    
+    # Footer with developer credit
+    doc.add_paragraph()  # Spacing
+    footer_para = doc.add_paragraph()
+    footer_text = f"Generated by Employee Management System | Developed by Sam Ranjith Paul | github.com/samranjithpaul | linkedin.com/in/Samranjithpaul | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    footer_para.add_run(footer_text).italic = True
+    footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    return doc
+
+
 def export_employee_to_word(emp_id: int, token: str) -> Optional[str]:
     """
     Export single employee to Word document
@@ -130,88 +314,151 @@ def export_employee_to_word(emp_id: int, token: str) -> Optional[str]:
         # Get employment history
         history = get_employment_history(token, emp_id)
         
-        # Create Word document
-        doc = Document()
-        
-        # Set document margins
-        sections = doc.sections
-        for section in sections:
-            section.top_margin = Inches(0.5)
-            section.bottom_margin = Inches(0.5)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
-        
-        # Title
-        title = doc.add_heading(f"Employee Profile", 0)
-        title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Employee Name
-        name_para = doc.add_paragraph()
-        name_run = name_para.add_run(f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip())
-        name_run.font.size = Pt(20)
-        name_run.bold = True
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        doc.add_paragraph()  # Spacing
-        
-        # Basic Information Section
-        doc.add_heading("Basic Information", level=1)
-        
-        info_items = [
-            ("Employee ID", str(emp.get("emp_id", ""))),
-            ("Department", emp.get("department") or "N/A"),
-            ("Designation", emp.get("designation") or "N/A"),
-            ("Email", emp.get("email") or "N/A"),
-            ("Phone", emp.get("phone") or "N/A"),
-            ("Joining Date", str(emp.get("joining_date") or "N/A")),
-            ("Status", emp.get("status", "N/A")),
-        ]
-        
-        for label, value in info_items:
-            para = doc.add_paragraph()
-            para.add_run(f"{label}: ").bold = True
-            para.add_run(value)
-        
-        doc.add_paragraph()  # Spacing
-        
-        # Employment History Section
-        if history:
-            doc.add_heading("Employment History", level=1)
-            for idx, hist in enumerate(history, 1):
-                doc.add_paragraph(f"{idx}. {hist.get('company_name', 'N/A')}", style='List Bullet')
-                para = doc.add_paragraph()
-                para.add_run("   Position: ").bold = True
-                para.add_run(hist.get("position", "N/A"))
-                para = doc.add_paragraph()
-                para.add_run("   Duration: ").bold = True
-                para.add_run(f"{hist.get('start_date', 'N/A')} to {hist.get('end_date', 'N/A')}")
-                doc.add_paragraph()  # Spacing
-        else:
-            doc.add_heading("Employment History", level=1)
-            doc.add_paragraph("No previous employment history recorded.")
-        
-        # Footer with developer credit
-        doc.add_paragraph()  # Spacing
-        footer_para = doc.add_paragraph()
-        footer_text = f"Generated by Employee Management System | Developed by Sam Ranjith Paul | github.com/samranjithpaul | linkedin.com/in/Samranjithpaul | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        footer_para.add_run(footer_text).italic = True
-        footer_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # Generate filename
-        first_name = emp.get("first_name", "Employee").replace(" ", "_")
-        last_name = emp.get("last_name", "").replace(" ", "_")
-        filename = f"Employee_{first_name}_{last_name}_Profile.docx"
-        filepath = os.path.join(EXPORTS_DIR, filename)
-        
-        # Save document
-        doc.save(filepath)
+        # Unchanged profiles are served from the export cache
+        def build(filepath: str) -> bool:
+            _build_employee_docx(emp, history).save(filepath)
+            return True
         
-        return filepath
+        return get_export_cache().get_or_build(
+            "word",
+            data_fingerprint(emp, history),
+            _employee_filename(emp, "docx"),
+            build,
+        )
         
     except Exception as e:
         print(f"Error exporting to Word: {e}")
         return None
 
 
+def _build_employee_pdf(
+    emp: Dict[str, Any],
+    history: List[Dict[str, Any]],
+    generated_at: Optional[datetime] = None,
+) -> "FPDF":
+    """
+    Render a single employee profile into an FPDF document
+    
+    Args:
+        emp: Employee record as returned by the API
+        history: Employment history records for the employee
+        generated_at: Timestamp stamped into the document (default now);
+            fixing it makes the output byte-for-byte reproducible
+        
+    Returns:
+        FPDF document ready to be written out
+    """
+    from fpdf import FPDF
+    
+    generated_at = generated_at or datetime.now()
+    
+    # Create PDF
+    pdf = FPDF()
+    pdf.set_creation_date(generated_at)
+    pdf.add_page()
+    
+    # Set font
+    pdf.set_font("Arial", "B", 20)
+    
+    # Title
+    pdf.cell(0, 15, "Employee Profile", ln=True, align="C")
+    pdf.ln(5)
+    
+    # Employee Name
+    full_name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(0, 10, full_name, ln=True, align="C")
+    pdf.ln(10)
+    
+    # Draw line
+    pdf.line(10, pdf.get_y(), 200, pdf.get_y())
+    pdf.ln(5)
+    
+    # Basic Information
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, "Basic Information", ln=True)
+    pdf.ln(3)
+    
+    pdf.set_font("Arial", "", 11)
+    
+    info_items = [
+        ("Employee ID", str(emp.get("emp_id", ""))),
+        ("Department", emp.get("department") or "N/A"),
+        ("Designation", emp.get("designation") or "N/A"),
+        ("Email", emp.get("email") or "N/A"),
+        ("Phone", emp.get("phone") or "N/A"),
+        ("Joining Date", str(emp.get("joining_date") or "N/A")),
+        ("Status", emp.get("status", "N/A")),
+    ]
+    
+    for label, value in info_items:
+        pdf.set_font("Arial", "B", 11)
+        pdf.cell(60, 8, f"{label}:", ln=0)
+        pdf.set_font("Arial", "", 11)
+        pdf.cell(0, 8, value, ln=True)
+    
+    pdf.ln(5)
+    pdf.line(10, pdf.get_y(), 200, pdf.get_y())
+    pdf.ln(5)
+    
+    # Employment History
+    pdf.set_font("Arial", "B", 14)
+    pdf.cell(0, 10, "Employment History", ln=True)
+    pdf.ln(3)
+    
+    if history:
+        pdf.set_font("Arial", "", 11)
+        for idx, hist in enumerate(history, 1):
+            pdf.set_font("Arial", "B", 11)
+            pdf.cell(0, 8, f"{idx}. {hist.get('company_name', 'N/A')}", ln=True)
+            pdf.set_font("Arial", "", 10)
+            pdf.cell(20, 6, "", ln=0)  # Indent
+            pdf.cell(0, 6, f"Position: {hist.get('position', 'N/A')}", ln=True)
+            pdf.cell(20, 6, "", ln=0)  # Indent
+            pdf.cell(0, 6, f"Duration: {hist.get('start_date', 'N/A')} to {hist.get('end_date', 'N/A')}", ln=True)
+            pdf.ln(3)
+    else:
+        pdf.set_font("Arial", "", 11)
+        pdf.cell(0, 8, "No previous employment history recorded.", ln=True)
+    
+    # Footer
+    pdf.set_y(-20)
+    pdf.set_font("Arial", "I", 9)
+    pdf.cell(0, 10, f"Generated by EMS System - {generated_at.strftime('%Y-%m-%d %H:%M:%S')}", align="C")
+    
+    return pdf
+
+
+def _employee_filename(emp: Dict[str, Any], extension: str) -> str:
+    """Build the Employee_<First>_<Last>_Profile.<ext> filename"""
+    first_name = emp.get("first_name", "Employee").replace(" ", "_")
+    last_name = emp.get("last_name", "").replace(" ", "_")
+    return f"Employee_{first_name}_{last_name}_Profile.{extension}"
+
+
+def _render_employee_pdf_bytes(
+    emp: Dict[str, Any],
+    history: List[Dict[str, Any]],
+    generated_at: Optional[datetime] = None,
+) -> bytes:
+    """Render an employee profile PDF into an in-memory buffer"""
+    return bytes(_build_employee_pdf(emp, history, generated_at).output())
+
+
+def _save_employee_pdf(emp: Dict[str, Any], history: List[Dict[str, Any]]) -> Optional[str]:
+    """Render an employee profile PDF into the export cache and return its path"""
+    def build(filepath: str) -> bool:
+        _build_employee_pdf(emp, history).output(filepath)
+        return True
+    
+    return get_export_cache().get_or_build(
+        "employee-pdf",
+        data_fingerprint(emp, history),
+        _employee_filename(emp, "pdf"),
+        build,
+    )
+
+
 def export_employee_to_pdf(emp_id: int, token: str) -> Optional[str]:
     """
     Export single employee to PDF format
@@ -232,21 +479,34 @@ def export_employee_to_pdf(emp_id: int, token: str) -> Optional[str]:
         # Get employment history
         history = get_employment_history(token, emp_id)
         
-        # Create PDF
-        pdf = FPDF()
-        pdf.add_page()
+        return _save_employee_pdf(emp, history)
         
-        # Set font
-        pdf.set_font("Arial", "B", 20)
+    except Exception as e:
+        print(f"Error exporting to PDF: {e}")
+        return None
+
+
+def _build_all_employees_pdf(employees: List[Dict[str, Any]]) -> "FPDF":
+    """Render the multi-page all-employees report"""
+    from fpdf import FPDF
+    
+    # Create PDF
+    pdf = FPDF()
+    
+    # Add a page for each employee
+    for idx, emp in enumerate(employees, 1):
+        # One page per employee
+        pdf.add_page()
         
         # Title
-        pdf.cell(0, 15, "Employee Profile", ln=True, align="C")
+        pdf.set_font("Arial", "B", 18)
+        pdf.cell(0, 15, "All Employees Report", ln=True, align="C")
         pdf.ln(5)
         
         # Employee Name
         full_name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
         pdf.set_font("Arial", "B", 16)
-        pdf.cell(0, 10, full_name, ln=True, align="C")
+        pdf.cell(0, 10, f"Employee #{idx}: {full_name}", ln=True, align="C")
         pdf.ln(10)
         
         # Draw line
@@ -254,11 +514,11 @@ def export_employee_to_pdf(emp_id: int, token: str) -> Optional[str]:
         pdf.ln(5)
         
         # Basic Information
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Basic Information", ln=True)
+        pdf.set_font("Arial", "B", 12)
+        pdf.cell(0, 8, "Basic Information", ln=True)
         pdf.ln(3)
         
-        pdf.set_font("Arial", "", 11)
+        pdf.set_font("Arial", "", 10)
         
         info_items = [
             ("Employee ID", str(emp.get("emp_id", ""))),
@@ -271,54 +531,23 @@ def export_employee_to_pdf(emp_id: int, token: str) -> Optional[str]:
         ]
         
         for label, value in info_items:
-            pdf.set_font("Arial", "B", 11)
-            pdf.cell(60, 8, f"{label}:", ln=0)
-            pdf.set_font("Arial", "", 11)
-            pdf.cell(0, 8, value, ln=True)
+            pdf.set_font("Arial", "B", 10)
+            pdf.cell(50, 7, f"{label}:", ln=0)
+            pdf.set_font("Arial", "", 10)
+            pdf.cell(0, 7, value, ln=True)
         
         pdf.ln(5)
-        pdf.line(10, pdf.get_y(), 200, pdf.get_y())
-        pdf.ln(5)
-        
-        # Employment History
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Employment History", ln=True)
-        pdf.ln(3)
-        
-        if history:
-            pdf.set_font("Arial", "", 11)
-            for idx, hist in enumerate(history, 1):
-                pdf.set_font("Arial", "B", 11)
-                pdf.cell(0, 8, f"{idx}. {hist.get('company_name', 'N/A')}", ln=True)
-                pdf.set_font("Arial", "", 10)
-                pdf.cell(20, 6, "", ln=0)  # Indent
-                pdf.cell(0, 6, f"Position: {hist.get('position', 'N/A')}", ln=True)
-                pdf.cell(20, 6, "", ln=0)  # Indent
-                pdf.cell(0, 6, f"Duration: {hist.get('start_date', 'N/A')} to {hist.get('end_date', 'N/A')}", ln=True)
-                pdf.ln(3)
-        else:
-            pdf.set_font("Arial", "", 11)
-            pdf.cell(0, 8, "No previous employment history recorded.", ln=True)
-        
-        # Footer
-        pdf.set_y(-20)
-        pdf.set_font("Arial", "I", 9)
-        pdf.cell(0, 10, f"Generated by EMS System - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", align="C")
-        
-        # Generate filename
-        first_name = emp.get("first_name", "Employee").replace(" ", "_")
-        last_name = emp.get("last_name", "").replace(" ", "_")
-        filename = f"Employee_{first_name}_{last_name}_Profile.pdf"
-        filepath = os.path.join(EXPORTS_DIR, filename)
-        
-        # Save PDF
-        pdf.output(filepath)
         
-        return filepath
-        
-    except Exception as e:
-        print(f"Error exporting to PDF: {e}")
-        return None
+        # Check if we need a new page for next employee
+        if pdf.get_y() > 250 and idx < len(employees):
+            continue  # Will add new page in next iteration
+    
+    # Footer on last page with developer credit
+    pdf.set_y(-20)
+    pdf.set_font("Arial", "I", 8)
+    pdf.cell(0, 10, f"Generated by EMS | Developed by Sam Ranjith Paul | github.com/samranjithpaul | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total Employees: {len(employees)}", align="C")
+    
+    return pdf
 
 
 def export_all_to_pdf(token: str) -> Optional[str]:
@@ -330,131 +559,162 @@ def export_all_to_pdf(token: str) -> Optional[str]:
     """
     try:
         # Get all employees
-        employees = get_employees(token)
+        employees = get_synced_employees(token)
         
         if not employees:
             return None
         
-        # Create PDF
-        pdf = FPDF()
+        def build(filepath: str) -> bool:
+            _build_all_employees_pdf(employees).output(filepath)
+            return True
         
-        # Add a page for each employee
-        for idx, emp in enumerate(employees, 1):
-            # Add new page (except for first employee)
-            if idx > 1:
-                pdf.add_page()
-            
-            # Title
-            pdf.set_font("Arial", "B", 18)
-            pdf.cell(0, 15, "All Employees Report", ln=True, align="C")
-            pdf.ln(5)
-            
-            # Employee Name
-            full_name = f"{emp.get('first_name', '')} {emp.get('last_name', '')}".strip()
-            pdf.set_font("Arial", "B", 16)
-            pdf.cell(0, 10, f"Employee #{idx}: {full_name}", ln=True, align="C")
-            pdf.ln(10)
-            
-            # Draw line
-            pdf.line(10, pdf.get_y(), 200, pdf.get_y())
-            pdf.ln(5)
-            
-            # Basic Information
-            pdf.set_font("Arial", "B", 12)
-            pdf.cell(0, 8, "Basic Information", ln=True)
-            pdf.ln(3)
-            
-            pdf.set_font("Arial", "", 10)
-            
-            info_items = [
-                ("Employee ID", str(emp.get("emp_id", ""))),
-                ("Department", emp.get("department") or "N/A"),
-                ("Designation", emp.get("designation") or "N/A"),
-                ("Email", emp.get("email") or "N/A"),
-                ("Phone", emp.get("phone") or "N/A"),
-                ("Joining Date", str(emp.get("joining_date") or "N/A")),
-                ("Status", emp.get("status", "N/A")),
-            ]
-            
-            for label, value in info_items:
-                pdf.set_font("Arial", "B", 10)
-                pdf.cell(50, 7, f"{label}:", ln=0)
-                pdf.set_font("Arial", "", 10)
-                pdf.cell(0, 7, value, ln=True)
-            
-            pdf.ln(5)
-            
-            # Check if we need a new page for next employee
-            if pdf.get_y() > 250 and idx < len(employees):
-                continue  # Will add new page in next iteration
-        
-        # Footer on last page with developer credit
-        pdf.set_y(-20)
-        pdf.set_font("Arial", "I", 8)
-        pdf.cell(0, 10, f"Generated by EMS | Developed by Sam Ranjith Paul | github.com/samranjithpaul | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Total Employees: {len(employees)}", align="C")
-        
-        # Generate filename
-        filename = f"All_Employees_Report_{get_timestamp()}.pdf"
-        filepath = os.path.join(EXPORTS_DIR, filename)
-        
-        # Save PDF
-        pdf.output(filepath)
-        
-        return filepath
+        # Unchanged data is served from the export cache instead of rebuilt
+        return get_export_cache().get_or_build(
+            "all-pdf",
+            data_fingerprint(employees),
+            f"All_Employees_Report_{get_timestamp()}.pdf",
+            build,
+        )
         
     except Exception as e:
         print(f"Error exporting all to PDF: {e}")
         return None
 
 
-def export_all_pdfs_to_zip(token: str) -> Optional[str]:
+def _write_pdf_entry(
+    zipf: zipfile.ZipFile,
+    emp: Dict[str, Any],
+    pdf_bytes: bytes,
+    generated_at: datetime,
+    used_names: set,
+):
+    """Add one employee's PDF to an archive under a unique, reproducible entry"""
+    # Employees sharing a name would otherwise overwrite each other
+    arcname = _employee_filename(emp, "pdf")
+    if arcname in used_names:
+        arcname = _employee_filename(emp, f"{emp['emp_id']}.pdf")
+    used_names.add(arcname)
+    
+    entry_info = zipfile.ZipInfo(arcname, date_time=generated_at.timetuple()[:6])
+    entry_info.compress_type = zipfile.ZIP_DEFLATED
+    with zipf.open(entry_info, 'w') as entry:
+        entry.write(pdf_bytes)
+
+
+def export_all_pdfs_to_zip(
+    token: str,
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    render_workers: Optional[int] = None,
+) -> Optional[str]:
     """
     Export all employees as individual PDFs and bundle them in a ZIP file
     
+    Args:
+        token: JWT authentication token
+        max_workers: Concurrent history requests (default EXPORT_FETCH_WORKERS)
+        timeout: Per-request timeout in seconds (default EXPORT_FETCH_TIMEOUT)
+        render_workers: PDF rendering processes (default EXPORT_RENDER_WORKERS)
+    
     Returns:
         Path to generated ZIP file or None if error
     """
     try:
-        # Get all employees
-        employees = get_employees(token)
+        # Get all employees (rows are reused, not re-fetched one by one)
+        employees = sorted(
+            (emp for emp in get_synced_employees(token) if emp.get("emp_id")),
+            key=lambda emp: emp["emp_id"],
+        )
         
         if not employees:
             return None
         
-        # Create temporary directory for PDFs
-        temp_dir = tempfile.mkdtemp()
-        pdf_files = []
-        
-        # Generate PDF for each employee
-        for emp in employees:
-            emp_id = emp.get("emp_id")
-            if emp_id:
-                pdf_path = export_employee_to_pdf(emp_id, token)
-                if pdf_path:
-                    # Copy to temp directory
-                    import shutil
-                    temp_pdf_path = os.path.join(temp_dir, os.path.basename(pdf_path))
-                    shutil.copy2(pdf_path, temp_pdf_path)
-                    pdf_files.append(temp_pdf_path)
-        
-        if not pdf_files:
-            return None
-        
-        # Create ZIP file
-        zip_filename = f"Employee_PDFs_Archive_{get_timestamp()}.zip"
-        zip_filepath = os.path.join(EXPORTS_DIR, zip_filename)
+        # Prefetch every employee's history in parallel
+        histories = fetch_histories(
+            token,
+            (emp["emp_id"] for emp in employees),
+            max_workers=max_workers,
+            timeout=timeout,
+        )
         
-        with zipfile.ZipFile(zip_filepath, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for pdf_file in pdf_files:
-                zipf.write(pdf_file, os.path.basename(pdf_file))
+        items = [(emp, histories.get(emp["emp_id"], [])) for emp in employees]
         
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        def build(zip_filepath: str) -> bool:
+            # One timestamp for every document and entry keeps the archive reproducible
+            generated_at = datetime.now().replace(microsecond=0)
+            written = 0
+            
+            # Stream each PDF from memory straight into its entry
+            with zipfile.ZipFile(zip_filepath, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                used_names = set()
+                for emp, pdf_bytes in iter_rendered_pdfs(items, generated_at, workers=render_workers):
+                    if pdf_bytes is None:
+                        continue
+                    _write_pdf_entry(zipf, emp, pdf_bytes, generated_at, used_names)
+                    written += 1
+            
+            return written > 0
         
-        return zip_filepath
+        # The cache publishes the finished archive atomically
+        return get_export_cache().get_or_build(
+            "zip",
+            data_fingerprint(items),
+            f"Employee_PDFs_Archive_{get_timestamp()}.zip",
+            build,
+        )
         
     except Exception as e:
         print(f"Error creating ZIP archive: {e}")
         return None
 
+
+AUDIT_LOG_COLUMNS = ["log_id", "timestamp", "admin_id", "emp_id", "action", "details"]
+
+
+def export_audit_logs_to_csv(
+    token: str,
+    admin_id: Optional[int] = None,
+    emp_id: Optional[int] = None,
+    action: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Optional[str]:
+    """
+    Export the audit log entries matching the filters to CSV
+    
+    Rows are streamed from the API and written as they arrive, so memory
+    stays flat however many entries the range contains. If the stream
+    cannot be opened or breaks part-way, no file is published.
+    
+    Args:
+        token: JWT authentication token
+        admin_id, emp_id, action: Exact-match filters
+        start, end: Time range, start <= timestamp < end
+    
+    Returns:
+        Path to generated CSV file or None if error
+    """
+    filename = f"audit_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    filepath = os.path.join(ensure_exports_dir(), filename)
+    partial_path = f"{filepath}.partial"
+    
+    try:
+        # Open the stream first: an unreachable or failing API raises here,
+        # before a header-only file exists that could pass for an empty range
+        entries = iter_audit_logs(token, admin_id, emp_id, action, start, end)
+        first = next(entries, None)
+        with open(partial_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=AUDIT_LOG_COLUMNS, extrasaction="ignore")
+            writer.writeheader()
+            if first is not None:
+                for entry in itertools.chain([first], entries):
+                    writer.writerow(entry)
+        
+        os.replace(partial_path, filepath)
+        return filepath
+        
+    except Exception as e:
+        print(f"Error exporting audit logs: {e}")
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        return None
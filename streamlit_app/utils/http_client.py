@@ -0,0 +1,114 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Pooled HTTP session used by the API client
+
+A single requests.Session is shared by every API call in the process so
+connections to the Rust backend are kept alive and reused instead of
+paying a new TCP handshake per request.
+"""
+import os
+import threading
+from typing import Any, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Tunables (override with environment variables)
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "20"))
+API_CONNECT_TIMEOUT = float(os.getenv("API_CONNECT_TIMEOUT", "3.05"))
+API_READ_TIMEOUT = float(os.getenv("API_READ_TIMEOUT", "30"))
+API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
+API_BACKOFF_FACTOR = float(os.getenv("API_BACKOFF_FACTOR", "0.3"))
+
+# Only idempotent methods are retried automatically; a retried POST could
+# create the same employee twice and a retried DELETE would report a 404.
+RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "OPTIONS"})
+RETRY_STATUSES = (502, 503, 504)
+
+
+class ApiSession:
+    """
+    Thread-safe wrapper around a pooled, keep-alive requests.Session
+
+    Args:
+        base_url: Root URL of the API, e.g. http://localhost:8000
+        pool_size: Maximum number of pooled connections to the API host
+        timeout: Default (connect, read) timeout in seconds
+        max_retries: Retry attempts for connection errors and 502/503/504
+        backoff_factor: Exponential backoff factor between retries
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = API_POOL_SIZE,
+        timeout: Tuple[float, float] = (API_CONNECT_TIMEOUT, API_READ_TIMEOUT),
+        max_retries: int = API_MAX_RETRIES,
+        backoff_factor: float = API_BACKOFF_FACTOR,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    def _build_session(self) -> requests.Session:
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.pool_size,
+            pool_block=True,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """Lazily create the shared session (once per process)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """Send a request to `base_url + path` using the pooled session"""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def get(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
@@ -0,0 +1,246 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Bulk payslip import from a ZIP archive
+
+Each entry is matched to an employee by manifest.csv (if the archive has
+one) or by its name: a folder named after the employee ID
+("42/march.pdf") or a file name that starts with it ("42_march.pdf").
+A "YYYY-MM" in the name sets the pay period. Entries are read straight
+out of the archive, never extracted to disk, and uploaded concurrently.
+Files whose checksum the employee already has are skipped, so importing
+the same archive again does not create duplicates.
+"""
+import csv
+import hashlib
+import io
+import os
+import re
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from .api_client import iter_employees, list_payslips, upload_payslip
+
+MANIFEST_NAME = "manifest.csv"
+MANIFEST_COLUMNS = ["filename", "emp_id", "email", "pay_period"]
+PAYSLIP_EXTENSIONS = {"pdf", "xlsx", "xls", "docx", "doc"}
+
+# Concurrent uploads (override with environment variables)
+PAYSLIP_IMPORT_WORKERS = int(os.getenv("PAYSLIP_IMPORT_WORKERS", "4"))
+
+# Leading employee ID, but not the year of a leading "YYYY-MM" period
+EMP_ID_PATTERN = re.compile(r"^(\d+)(?!-\d{2}(?:\D|$))(?:[_\-\s.]|$)")
+PERIOD_PATTERN = re.compile(r"(?<!\d)(\d{4})-(\d{2})(?!\d)")
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Result statuses
+UPLOADED = "uploaded"
+DUPLICATE = "duplicate"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+def _parse_period(text: str) -> Optional[date]:
+    """First day of the month for "YYYY-MM" or "YYYY-MM-DD" text, else None"""
+    match = PERIOD_PATTERN.search(text or "")
+    if not match:
+        return None
+    try:
+        return date(int(match.group(1)), int(match.group(2)), 1)
+    except ValueError:
+        return None
+
+
+def match_entry(name: str) -> Tuple[Optional[int], Optional[date]]:
+    """
+    Match an archive entry to an employee by naming convention
+
+    Args:
+        name: Entry path inside the ZIP, e.g. "42/2026-03.pdf" or "42_2026-03.pdf"
+
+    Returns:
+        (emp_id or None, pay period or None)
+    """
+    parts = [p for p in name.split("/") if p]
+    emp_id = None
+    for part in reversed(parts):
+        match = EMP_ID_PATTERN.match(part)
+        if match:
+            emp_id = int(match.group(1))
+            break
+    return emp_id, _parse_period(parts[-1] if parts else "")
+
+
+def read_manifest(archive: zipfile.ZipFile, token: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Load manifest.csv from the archive root, if there is one
+
+    Rows name an entry (filename) and either emp_id or an employee email,
+    plus an optional pay_period (YYYY-MM).
+
+    Returns:
+        {entry name: {"emp_id", "pay_period", "error"}} or None without a manifest
+
+    Raises:
+        RuntimeError if the manifest uses emails and the employee lookup fails
+    """
+    try:
+        info = archive.getinfo(MANIFEST_NAME)
+    except KeyError:
+        return None
+
+    with archive.open(info) as raw:
+        rows = list(csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8-sig")))
+    rows = [{str(k).strip().lower(): (v or "").strip() for k, v in row.items() if k} for row in rows]
+
+    # Resolve emails only when the manifest uses them (one streamed pass)
+    emails: Dict[str, int] = {}
+    if any(not row.get("emp_id") and row.get("email") for row in rows):
+        # A failed lookup must not turn every email row into "no employee"
+        try:
+            for employee in iter_employees(token):
+                if employee.get("email"):
+                    emails[employee["email"].lower()] = employee["emp_id"]
+        except Exception as e:
+            raise RuntimeError(f"could not look up employees by email: {e}") from e
+
+    manifest = {}
+    for row in rows:
+        entry = {"emp_id": None, "pay_period": _parse_period(row.get("pay_period", "")), "error": None}
+        if row.get("emp_id", "").isdigit():
+            entry["emp_id"] = int(row["emp_id"])
+        elif row.get("email"):
+            entry["emp_id"] = emails.get(row["email"].lower())
+            if entry["emp_id"] is None:
+                entry["error"] = f"no employee with email {row['email']}"
+        else:
+            entry["error"] = "manifest row has no emp_id or email"
+        if row.get("pay_period") and entry["pay_period"] is None:
+            entry["error"] = "pay_period must be YYYY-MM"
+        manifest[row.get("filename", "")] = entry
+    return manifest
+
+
+def _entry_checksum(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> str:
+    """SHA-256 of an entry's contents, decompressed in chunks"""
+    digest = hashlib.sha256()
+    with archive.open(info) as entry:
+        for chunk in iter(lambda: entry.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def import_payslip_zip(
+    token: str,
+    file: BinaryIO,
+    default_period: Optional[date] = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Upload every payslip in a ZIP archive to its employee
+
+    Args:
+        token: JWT authentication token
+        file: Seekable binary file object of the ZIP (e.g. a Streamlit UploadedFile)
+        default_period: Pay period for entries that do not name one
+        workers: Concurrent uploads (default PAYSLIP_IMPORT_WORKERS)
+        progress: Called with (entries done, total entries) as uploads finish
+
+    Returns:
+        One {"file", "emp_id", "pay_period", "status", "detail"} per entry,
+        where status is uploaded, duplicate, skipped or failed
+    """
+    results: List[Dict[str, Any]] = []
+
+    with zipfile.ZipFile(file) as archive:
+        manifest = read_manifest(archive, token)
+        entries = [
+            info for info in archive.infolist()
+            if not info.is_dir() and info.filename != MANIFEST_NAME
+            and not os.path.basename(info.filename).startswith(".")
+            and "__MACOSX/" not in info.filename
+        ]
+
+        tasks = []
+        for info in entries:
+            result = {"file": info.filename, "emp_id": None, "pay_period": None, "status": SKIPPED, "detail": ""}
+            results.append(result)
+
+            extension = info.filename.rsplit(".", 1)[-1].lower() if "." in info.filename else ""
+            if extension not in PAYSLIP_EXTENSIONS:
+                result["detail"] = "unsupported file type"
+                continue
+
+            if manifest is not None:
+                entry = manifest.get(info.filename) or manifest.get(os.path.basename(info.filename))
+                if entry is None:
+                    result["detail"] = "not listed in manifest"
+                    continue
+                if entry["error"]:
+                    result["detail"] = entry["error"]
+                    continue
+                emp_id, period = entry["emp_id"], entry["pay_period"]
+            else:
+                emp_id, period = match_entry(info.filename)
+                if emp_id is None:
+                    result["detail"] = "no employee ID in name"
+                    continue
+
+            period = period or default_period
+            result["emp_id"] = emp_id
+            result["pay_period"] = period.strftime("%Y-%m") if period else None
+            tasks.append((info, result, period))
+
+        # Identical entries for the same employee within this archive are uploaded once
+        seen: Dict[Tuple[int, str], str] = {}
+        seen_lock = threading.Lock()
+        done = len(results) - len(tasks)
+
+        def ingest(info: zipfile.ZipInfo, result: Dict[str, Any], period: Optional[date]):
+            checksum = _entry_checksum(archive, info)
+            with seen_lock:
+                first = seen.setdefault((result["emp_id"], checksum), info.filename)
+            if first != info.filename:
+                result["status"], result["detail"] = DUPLICATE, f"same file as {first}"
+                return
+            if list_payslips(token, result["emp_id"], checksum=checksum, limit=1):
+                result["status"], result["detail"] = DUPLICATE, "already uploaded"
+                return
+
+            with archive.open(info) as entry:
+                payslip = upload_payslip(
+                    token,
+                    result["emp_id"],
+                    entry,
+                    pay_period=period,
+                    filename=os.path.basename(info.filename),
+                    size=info.file_size,
+                )
+            if payslip:
+                result["status"], result["detail"] = UPLOADED, payslip.get("filename", "")
+            else:
+                result["status"], result["detail"] = FAILED, "upload rejected (check the employee ID)"
+
+        if progress:
+            progress(done, len(results))
+        with ThreadPoolExecutor(max_workers=max(1, workers or PAYSLIP_IMPORT_WORKERS)) as pool:
+            futures = {pool.submit(ingest, *task): task[1] for task in tasks}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    futures[future]["status"], futures[future]["detail"] = FAILED, str(e)
+                done += 1
+                if progress:
+                    progress(done, len(results))
+
+    return results
@@ -0,0 +1,68 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Concurrent prefetch of per-employee data for bulk exports
+
+History is read through the batched /employees/batch endpoint, so N
+employees cost ceil(N / EXPORT_FETCH_BATCH_SIZE) requests, several of
+which are kept in flight at once.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Iterable, Optional
+
+from .api_client import get_employees_with_history
+
+# Tunables (override with environment variables)
+EXPORT_FETCH_WORKERS = int(os.getenv("EXPORT_FETCH_WORKERS", "8"))
+EXPORT_FETCH_TIMEOUT = float(os.getenv("EXPORT_FETCH_TIMEOUT", "10"))
+EXPORT_FETCH_BATCH_SIZE = int(os.getenv("EXPORT_FETCH_BATCH_SIZE", "500"))
+
+
+def fetch_histories(
+    token: str,
+    emp_ids: Iterable[int],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Fetch employment history for many employees in batches
+
+    Args:
+        token: JWT authentication token
+        emp_ids: Employee IDs to fetch history for
+        max_workers: Concurrent batch requests in flight (default EXPORT_FETCH_WORKERS)
+        timeout: Per-request timeout in seconds (default EXPORT_FETCH_TIMEOUT)
+
+    Returns:
+        Mapping of emp_id to its history list (empty for ids the API does
+        not return, i.e. deleted employees)
+
+    Raises:
+        RuntimeError (or a requests error) if any batch fails; callers must
+        not record that as "no history"
+    """
+    ids = list(dict.fromkeys(emp_id for emp_id in emp_ids if emp_id))
+    if not ids:
+        return {}
+
+    batches = [ids[i:i + EXPORT_FETCH_BATCH_SIZE] for i in range(0, len(ids), EXPORT_FETCH_BATCH_SIZE)]
+    workers = max(1, min(max_workers or EXPORT_FETCH_WORKERS, len(batches)))
+    request_timeout = timeout or EXPORT_FETCH_TIMEOUT
+
+    def fetch(batch: List[int]) -> List[Dict[str, Any]]:
+        return get_employees_with_history(
+            token, batch, chunk_size=EXPORT_FETCH_BATCH_SIZE, timeout=request_timeout
+        )
+
+    histories: Dict[int, List[Dict[str, Any]]] = {emp_id: [] for emp_id in ids}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ems-prefetch") as pool:
+        for employees in pool.map(fetch, batches):
+            for emp in employees:
+                histories[emp["emp_id"]] = emp.get("history") or []
+    return histories
@@ -0,0 +1,122 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Process-wide read cache for API GET responses
+
+Streamlit reruns the whole page script on every widget interaction, so
+the same employee reads are repeated constantly. Entries are grouped by
+endpoint, each with its own TTL and LRU size limit. Once an entry
+expires it is revalidated with If-None-Match instead of being
+re-downloaded.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class CachePolicy:
+    """TTL (seconds) and maximum number of entries for one endpoint"""
+    ttl: float
+    max_entries: int
+
+
+@dataclass
+class CacheEntry:
+    """Cached response body plus the headers needed to reuse it"""
+    payload: Any
+    headers: Dict[str, str]
+    etag: Optional[str]
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+# Per-endpoint policies (override with environment variables)
+DEFAULT_POLICIES = {
+    "employees": CachePolicy(float(os.getenv("CACHE_TTL_EMPLOYEES", "30")), int(os.getenv("CACHE_SIZE_EMPLOYEES", "64"))),
+    "stats": CachePolicy(float(os.getenv("CACHE_TTL_STATS", "30")), int(os.getenv("CACHE_SIZE_STATS", "16"))),
+    "employee": CachePolicy(float(os.getenv("CACHE_TTL_EMPLOYEE", "60")), int(os.getenv("CACHE_SIZE_EMPLOYEE", "1024"))),
+    "history": CachePolicy(float(os.getenv("CACHE_TTL_HISTORY", "120")), int(os.getenv("CACHE_SIZE_HISTORY", "1024"))),
+}
+
+CacheKey = Tuple[Optional[Hashable], str, Tuple]
+
+
+class ReadCache:
+    """
+    Thread-safe TTL + LRU cache, partitioned by endpoint
+
+    Keys are (resource, token, params). `resource` is the emp_id for
+    per-employee endpoints and None for collection endpoints, so writes
+    can invalidate exactly the entries they affect.
+    """
+
+    def __init__(self, policies: Optional[Dict[str, CachePolicy]] = None):
+        self.policies = dict(policies or DEFAULT_POLICIES)
+        self._entries: Dict[str, "OrderedDict[CacheKey, CacheEntry]"] = {
+            endpoint: OrderedDict() for endpoint in self.policies
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(resource: Optional[Hashable], token: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+        return (resource, token, tuple(sorted((params or {}).items())))
+
+    def get(self, endpoint: str, key: CacheKey) -> Optional[CacheEntry]:
+        """Return the entry (fresh or stale) and mark it recently used"""
+        with self._lock:
+            entries = self._entries[endpoint]
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+            return entry
+
+    def put(self, endpoint: str, key: CacheKey, payload: Any, headers: Dict[str, str], etag: Optional[str]):
+        """Store a response, evicting the least recently used entries over the limit"""
+        policy = self.policies[endpoint]
+        with self._lock:
+            entries = self._entries[endpoint]
+            entries[key] = CacheEntry(payload, headers, etag, time.monotonic() + policy.ttl)
+            entries.move_to_end(key)
+            while len(entries) > policy.max_entries:
+                entries.popitem(last=False)
+
+    def touch(self, endpoint: str, key: CacheKey):
+        """Extend an entry's TTL after a 304 Not Modified revalidation"""
+        policy = self.policies[endpoint]
+        with self._lock:
+            entry = self._entries[endpoint].get(key)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + policy.ttl
+
+    def invalidate(self, endpoint: str, resource: Optional[Hashable] = None):
+        """
+        Drop cached entries for an endpoint
+
+        Args:
+            endpoint: Endpoint name, e.g. "employee"
+            resource: Only drop entries for this resource (emp_id); None drops all
+        """
+        with self._lock:
+            entries = self._entries[endpoint]
+            if resource is None:
+                entries.clear()
+            else:
+                for key in [k for k in entries if k[0] == resource]:
+                    del entries[key]
+
+    def clear(self):
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
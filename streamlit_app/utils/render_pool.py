@@ -0,0 +1,141 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Multi-process PDF rendering backend for bulk exports
+
+FPDF rendering is pure Python and CPU-bound, so bulk jobs split the
+employee list into shards and render each shard in a worker process.
+Results are always yielded in input order, so the assembled output does
+not depend on which shard finishes first.
+"""
+import math
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+
+# Tunables (override with environment variables)
+EXPORT_RENDER_WORKERS = int(os.getenv("EXPORT_RENDER_WORKERS", str(os.cpu_count() or 1)))
+EXPORT_RENDER_SHARD_SIZE = int(os.getenv("EXPORT_RENDER_SHARD_SIZE", "100"))
+EXPORT_RENDER_START_METHOD = os.getenv("EXPORT_RENDER_START_METHOD", "spawn")
+
+RenderItem = Tuple[Dict[str, Any], List[Dict[str, Any]]]
+
+
+def _render_shard(shard: List[RenderItem], generated_at: datetime) -> List[Optional[bytes]]:
+    """Render one shard of (employee, history) pairs to PDF bytes (runs in a worker)"""
+    from .export_utils import _render_employee_pdf_bytes
+
+    rendered = []
+    for emp, history in shard:
+        try:
+            rendered.append(_render_employee_pdf_bytes(emp, history, generated_at))
+        except Exception as e:
+            print(f"Error rendering PDF for employee {emp.get('emp_id')}: {e}")
+            rendered.append(None)
+    return rendered
+
+
+class RenderPool:
+    """
+    Worker processes for rendering, reused across batches
+
+    Spawned workers re-import the renderers (fpdf, reportlab) when they
+    start, so jobs that render in chunks create one pool and pass every
+    chunk through it instead of starting a pool per chunk.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = max(1, workers or EXPORT_RENDER_WORKERS)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "RenderPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shut the worker processes down (they are started again if needed)"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            context = multiprocessing.get_context(EXPORT_RENDER_START_METHOD)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+        return self._executor
+
+    def render(
+        self,
+        items: List[RenderItem],
+        generated_at: datetime,
+        shard_size: Optional[int] = None,
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[bytes]]]:
+        """
+        Render one batch of employee profile PDFs
+
+        Args:
+            items: (employee, history) pairs in output order
+            generated_at: Timestamp stamped into every document, so identical
+                input always produces identical bytes
+            shard_size: Maximum employees per shard (default
+                EXPORT_RENDER_SHARD_SIZE); small batches are split further
+                so every worker gets a shard
+
+        Yields:
+            (employee, pdf_bytes) in the same order as `items`; pdf_bytes is
+            None when that employee failed to render
+        """
+        shard_size = min(shard_size or EXPORT_RENDER_SHARD_SIZE, math.ceil(len(items) / self.workers))
+        shard_size = max(1, shard_size)
+        shards = [items[i:i + shard_size] for i in range(0, len(items), shard_size)]
+
+        if self.workers == 1 or len(shards) <= 1:
+            for shard in shards:
+                yield from zip((emp for emp, _ in shard), _render_shard(shard, generated_at))
+            return
+
+        pool = self._pool()
+        # Keep a bounded window of shards in flight so finished PDFs never
+        # pile up in memory faster than the caller consumes them
+        pending = deque()
+        shard_iter = iter(shards)
+        for shard in shard_iter:
+            pending.append((shard, pool.submit(_render_shard, shard, generated_at)))
+            if len(pending) >= self.workers * 2:
+                break
+
+        while pending:
+            shard, future = pending.popleft()
+            next_shard = next(shard_iter, None)
+            if next_shard is not None:
+                pending.append((next_shard, pool.submit(_render_shard, next_shard, generated_at)))
+            yield from zip((emp for emp, _ in shard), future.result())
+
+
+def iter_rendered_pdfs(
+    items: List[RenderItem],
+    generated_at: datetime,
+    workers: Optional[int] = None,
+    shard_size: Optional[int] = None,
+) -> Iterator[Tuple[Dict[str, Any], Optional[bytes]]]:
+    """
+    Render employee profile PDFs in a pool of their own (see RenderPool.render)
+
+    Args:
+        items: (employee, history) pairs in output order
+        generated_at: Timestamp stamped into every document
+        workers: Worker processes (default EXPORT_RENDER_WORKERS; 1 renders inline)
+        shard_size: Maximum employees per shard (default EXPORT_RENDER_SHARD_SIZE)
+    """
+    with RenderPool(workers) as pool:
+        yield from pool.render(items, generated_at, shard_size)
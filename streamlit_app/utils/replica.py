@@ -0,0 +1,127 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Local employee replica kept current from the /employees/changes feed
+
+The first sync downloads a full snapshot. Later syncs only apply the
+rows changed (upserts) or deleted (tombstones) since the previous
+`as_of`, so refreshing costs O(changes) instead of O(headcount).
+"""
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Any, Optional
+
+from .api_client import get_employee_changes
+
+# Tunables (override with environment variables)
+# Re-read this many seconds before the last as_of so writes committed
+# just after the previous sync are not skipped; re-applying is harmless
+REPLICA_OVERLAP_SECONDS = float(os.getenv("REPLICA_OVERLAP_SECONDS", "5"))
+# Minimum seconds between syncs; reruns inside the window reuse the replica
+REPLICA_SYNC_INTERVAL = float(os.getenv("REPLICA_SYNC_INTERVAL", "2"))
+
+
+class EmployeeReplica:
+    """Thread-safe in-memory copy of the employees table"""
+
+    def __init__(self):
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._as_of: Optional[datetime] = None
+        self._last_sync = 0.0
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[List[Dict[str, Any]], List[int], bool], None]] = []
+        # Bumped whenever a sync changes the data; cheap change detection for callers
+        self.version = 0
+
+    def add_listener(self, listener: Callable[[List[Dict[str, Any]], List[int], bool], None]):
+        """
+        Register a callback run after every sync that changed the data
+
+        Called (under the replica lock, after `version` is bumped) with the
+        rows that changed, the deleted emp_ids and whether the sync was a
+        full snapshot (every row passed, anything not listed is gone).
+        """
+        self._listeners.append(listener)
+
+    def sync(self, token: str, force: bool = False) -> bool:
+        """
+        Pull and apply changes since the last sync
+
+        Args:
+            token: JWT authentication token
+            force: Ignore REPLICA_SYNC_INTERVAL and always ask the API
+
+        Returns:
+            True if the replica is usable (synced now or earlier), False otherwise
+        """
+        with self._lock:
+            if not force and self._as_of is not None and time.monotonic() - self._last_sync < REPLICA_SYNC_INTERVAL:
+                return True
+
+            since = None
+            if self._as_of is not None:
+                since = (self._as_of - timedelta(seconds=REPLICA_OVERLAP_SECONDS)).isoformat()
+
+            changes = get_employee_changes(token, since)
+            if changes is None:
+                return self._as_of is not None
+
+            full = since is None
+            if full:
+                self._rows = {}
+            upserts, deleted = [], []
+            for emp in changes.get("upserts", []):
+                if self._rows.get(emp["emp_id"]) != emp:
+                    self._rows[emp["emp_id"]] = emp
+                    upserts.append(emp)
+            for emp_id in changes.get("deleted", []):
+                if self._rows.pop(emp_id, None) is not None:
+                    deleted.append(emp_id)
+
+            self._as_of = datetime.fromisoformat(changes["as_of"])
+            self._last_sync = time.monotonic()
+            if full or upserts or deleted:
+                self.version += 1
+                for listener in self._listeners:
+                    try:
+                        listener(upserts, deleted, full)
+                    except Exception as e:
+                        print(f"Error in replica listener: {e}")
+            return True
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """All replicated employees ordered by emp_id"""
+        with self._lock:
+            return [self._rows[emp_id] for emp_id in sorted(self._rows)]
+
+    def get(self, emp_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._rows.get(emp_id)
+
+
+_replica = EmployeeReplica()
+
+
+def get_replica() -> EmployeeReplica:
+    """Get the process-wide employee replica"""
+    return _replica
+
+
+def get_synced_employees(token: str) -> List[Dict[str, Any]]:
+    """
+    Get all employees from the replica after applying pending changes
+
+    Drop-in replacement for api_client.get_employees for bulk readers
+    such as exports.
+    """
+    replica = get_replica()
+    if not replica.sync(token):
+        return []
+    return replica.rows()
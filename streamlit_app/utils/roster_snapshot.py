@@ -0,0 +1,216 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Typed columnar snapshot of the employee roster
+
+The replica's rows are converted once per data version into an Arrow
+table: Arrow strings, dictionary-encoded (categorical) department,
+designation and status, a date joining_date and timestamp created_at /
+updated_at. The table is written to ROSTER_SNAPSHOT_DIR as an
+uncompressed Arrow IPC (Feather v2) file named by a fingerprint of the
+data. Every session and worker process on the host memory-maps that
+same file instead of parsing JSON into object columns, and a new file
+is written only when the data changes.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .replica import get_replica
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# Tunables (override with environment variables)
+# Shared by all workers on the host, so it must not be per-process
+ROSTER_SNAPSHOT_DIR = os.getenv("ROSTER_SNAPSHOT_DIR", os.path.join(tempfile.gettempdir(), "ems_roster"))
+# Snapshot files kept on disk (older versions may still be mapped by other workers)
+ROSTER_SNAPSHOT_KEEP = int(os.getenv("ROSTER_SNAPSHOT_KEEP", "3"))
+
+# Bump when the table layout changes so old files are not read
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_PREFIX = f"roster-v{SNAPSHOT_FORMAT}-"
+
+STRING_FIELDS = ["first_name", "last_name", "email", "phone"]
+CATEGORY_FIELDS = ["department", "designation", "status"]
+TIMESTAMP_FIELDS = ["created_at", "updated_at"]
+
+
+def roster_fingerprint(employees: List[Dict[str, Any]]) -> str:
+    """
+    Data version of a roster: every write bumps updated_at and deletes
+    drop rows, so (emp_id, updated_at) pairs identify the contents
+    """
+    digest = hashlib.sha256()
+    for emp in employees:
+        digest.update(f"{emp['emp_id']}:{emp.get('updated_at')}\n".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def build_roster_table(employees: List[Dict[str, Any]]) -> "pa.Table":
+    """Convert API employee records into the typed snapshot table"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    def column(field: str, type_: "pa.DataType") -> "pa.Array":
+        return pa.array([emp.get(field) for emp in employees], type_)
+
+    columns = {"emp_id": column("emp_id", pa.int32())}
+    for field in STRING_FIELDS:
+        columns[field] = column(field, pa.string())
+    for field in CATEGORY_FIELDS:
+        columns[field] = pc.dictionary_encode(column(field, pa.string()))
+    columns["joining_date"] = pc.cast(column("joining_date", pa.string()), pa.date32())
+    for field in TIMESTAMP_FIELDS:
+        columns[field] = pc.cast(column(field, pa.string()), pa.timestamp("us"))
+    return pa.table(columns)
+
+
+def _write_snapshot(table: "pa.Table", path: str):
+    """Write the table as an Arrow IPC file, published atomically"""
+    import pyarrow as pa
+
+    staging_path = f"{path}.{uuid.uuid4().hex}.partial"
+    try:
+        with pa.OSFile(staging_path, "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(staging_path, path)
+    except Exception:
+        if os.path.exists(staging_path):
+            os.remove(staging_path)
+        raise
+
+
+def _read_snapshot(path: str) -> "pa.Table":
+    """Memory-map a snapshot file; column buffers point into the page cache"""
+    import pyarrow as pa
+
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def _remove_old_snapshots(current: str):
+    """Keep the ROSTER_SNAPSHOT_KEEP most recently used snapshot files"""
+    try:
+        names = [n for n in os.listdir(ROSTER_SNAPSHOT_DIR) if n.startswith(SNAPSHOT_PREFIX)]
+    except FileNotFoundError:
+        return
+    paths = [os.path.join(ROSTER_SNAPSHOT_DIR, n) for n in names]
+    paths = [p for p in paths if p != current]
+
+    def last_used(path: str) -> float:
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return 0.0
+
+    for path in sorted(paths, key=last_used, reverse=True)[max(ROSTER_SNAPSHOT_KEEP - 1, 0):]:
+        try:
+            # Leftover .partial files of crashed writers are removed too;
+            # mapped files stay readable for processes still using them
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class RosterSnapshot:
+    """One data version of the roster as an Arrow table and a pandas frame"""
+
+    def __init__(self, fingerprint: str, table: "pa.Table"):
+        self.fingerprint = fingerprint
+        self.table = table
+        self._frame: Optional["pd.DataFrame"] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    @property
+    def frame(self) -> "pd.DataFrame":
+        """
+        pandas view of the table, converted once and shared by all sessions
+
+        Strings stay Arrow-backed, dictionary columns become categoricals
+        and joining_date, created_at and updated_at are datetime64.
+        Shared: do not mutate it in place.
+        """
+        with self._lock:
+            if self._frame is None:
+                import pandas as pd
+                import pyarrow as pa
+
+                string_dtype = pd.StringDtype("pyarrow")
+                self._frame = self.table.to_pandas(
+                    types_mapper={pa.string(): string_dtype, pa.large_string(): string_dtype}.get,
+                    date_as_object=False,
+                )
+            return self._frame
+
+
+_snapshot: Optional[RosterSnapshot] = None
+_snapshot_replica_version = -1
+_snapshot_lock = threading.Lock()
+
+
+def load_roster_snapshot(employees: List[Dict[str, Any]], fingerprint: Optional[str] = None) -> RosterSnapshot:
+    """
+    Snapshot of `employees`, reusing the file another worker already wrote
+    for the same data or building and publishing it
+    """
+    fingerprint = fingerprint or roster_fingerprint(employees)
+    path = os.path.join(ROSTER_SNAPSHOT_DIR, f"{SNAPSHOT_PREFIX}{fingerprint}.arrow")
+    try:
+        table = _read_snapshot(path)
+        # The file's mtime records the last use for cleanup
+        os.utime(path)
+    except Exception:
+        # Missing (or unreadable, which a rewrite replaces)
+        os.makedirs(ROSTER_SNAPSHOT_DIR, exist_ok=True)
+        _write_snapshot(build_roster_table(employees), path)
+        _remove_old_snapshots(path)
+        table = _read_snapshot(path)
+    return RosterSnapshot(fingerprint, table)
+
+
+def get_roster_snapshot(token: str) -> Optional[RosterSnapshot]:
+    """
+    Get the typed roster snapshot, current with the replica
+
+    Syncs the replica (at most every REPLICA_SYNC_INTERVAL seconds); the
+    snapshot is only reloaded when the replica's data changed.
+
+    Returns:
+        RosterSnapshot, or None if the roster could not be loaded
+    """
+    global _snapshot, _snapshot_replica_version
+    replica = get_replica()
+    if not replica.sync(token):
+        return None
+    with _snapshot_lock:
+        if _snapshot is not None and _snapshot_replica_version == replica.version:
+            return _snapshot
+        version = replica.version
+        try:
+            employees = replica.rows()
+            fingerprint = roster_fingerprint(employees)
+            if _snapshot is None or _snapshot.fingerprint != fingerprint:
+                _snapshot = load_roster_snapshot(employees, fingerprint)
+            _snapshot_replica_version = version
+        except Exception as e:
+            print(f"Error loading roster snapshot: {e}")
+        return _snapshot
+
+
+def get_roster_frame(token: str) -> Optional["pd.DataFrame"]:
+    """Typed pandas DataFrame of every employee (shared; do not mutate)"""
+    snapshot = get_roster_snapshot(token)
+    return snapshot.frame if snapshot is not None else None
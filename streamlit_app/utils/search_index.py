@@ -0,0 +1,343 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+In-memory search index over the employee replica
+
+Names and emails are normalized (case and accents folded) and split into
+tokens. A query term matches a token exactly, as a prefix (type-ahead,
+via a sorted vocabulary) or, for alphabetic terms, within one or two
+typos (candidates from a trigram index, confirmed by edit distance).
+Phone numbers are matched as digit substrings through a digit-trigram
+index. Results are ranked by how well every query term matched.
+
+The index is rebuilt only when the replica reloads a full snapshot.
+Incremental syncs and writes made through api_client (create, update,
+delete) update just the affected employee.
+"""
+import os
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import Counter
+from heapq import nsmallest
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .api_client import add_employee_listener
+from .replica import get_replica
+
+# Searched text fields and their ranking weight
+FIELD_WEIGHTS = {"first_name": 1.0, "last_name": 1.0, "email": 0.8}
+PHONE_FIELD = "phone"
+
+# Tunables (override with environment variables)
+# Terms shorter than this are matched exactly or by prefix only
+SEARCH_FUZZY_MIN_LENGTH = int(os.getenv("SEARCH_FUZZY_MIN_LENGTH", "4"))
+SEARCH_DEFAULT_LIMIT = int(os.getenv("SEARCH_DEFAULT_LIMIT", "50"))
+
+# Per-term scores before field weights; a prefix scores between PREFIX and
+# EXACT depending on how much of the token it covers
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+FUZZY_SCORE = 1.5
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+PHONE_QUERY_PATTERN = re.compile(r"^[\d\s()+\-.]+$")
+MIN_PHONE_DIGITS = 3
+
+
+def normalize(text: Any) -> str:
+    """Casefold and strip accents ("José" -> "jose")"""
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokenize(text: Any) -> List[str]:
+    """Normalized alphanumeric tokens of a field value or query"""
+    return TOKEN_PATTERN.findall(normalize(text)) if text else []
+
+
+def _trigrams(token: str) -> Set[str]:
+    """Trigrams of a token padded with "$" so short tokens and word edges count"""
+    padded = f"${token}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _digit_trigrams(digits: str) -> Set[str]:
+    return {digits[i:i + 3] for i in range(len(digits) - 2)}
+
+
+def _edit_distance(a: str, b: str, bound: int) -> int:
+    """Edit distance (adjacent transpositions count once), or bound + 1 once it exceeds bound"""
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > bound:
+            return bound + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class EmployeeSearchIndex:
+    """Thread-safe token, prefix and trigram index of employees"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clear()
+        # Replica version the index reflects
+        self.version = -1
+
+    def _clear(self):
+        self._docs: Dict[int, Dict[str, Any]] = {}
+        # emp_id -> {token: best field weight}, to unindex an employee
+        self._doc_tokens: Dict[int, Dict[str, float]] = {}
+        # token -> {emp_id: best field weight}
+        self._postings: Dict[str, Dict[int, float]] = {}
+        # Sorted distinct tokens, for prefix lookups by bisection
+        self._vocab: List[str] = []
+        # trigram -> alphabetic tokens containing it, for typo tolerance
+        self._trigrams: Dict[str, Set[str]] = {}
+        self._phones: Dict[int, str] = {}
+        self._phone_trigrams: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ---- Maintenance ----
+
+    def rebuild(self, employees: Iterable[Dict[str, Any]], version: int):
+        """Replace the whole index with `employees`"""
+        with self._lock:
+            self._clear()
+            for emp in employees:
+                self._add(emp, keep_sorted=False)
+            self._vocab = sorted(self._postings)
+            self.version = version
+
+    def apply_changes(self, upserts: List[Dict[str, Any]], deleted: List[int], full: bool, version: int):
+        """Apply one replica sync (replica listener)"""
+        if full:
+            self.rebuild(upserts, version)
+            return
+        with self._lock:
+            for emp in upserts:
+                self.upsert(emp)
+            for emp_id in deleted:
+                self.remove(emp_id)
+            self.version = version
+
+    def upsert(self, emp: Dict[str, Any]):
+        """Index a new or changed employee"""
+        with self._lock:
+            if self._docs.get(emp["emp_id"]) == emp:
+                return
+            self.remove(emp["emp_id"])
+            self._add(emp, keep_sorted=True)
+
+    def update_fields(self, emp_id: int, fields: Dict[str, Any]):
+        """Merge changed fields into an indexed employee (a new one needs a full record)"""
+        with self._lock:
+            current = self._docs.get(emp_id)
+            if current is not None or "first_name" in fields:
+                self.upsert({**(current or {}), **fields, "emp_id": emp_id})
+
+    def remove(self, emp_id: int):
+        """Drop an employee from the index (no-op if absent)"""
+        with self._lock:
+            if self._docs.pop(emp_id, None) is None:
+                return
+            for token in self._doc_tokens.pop(emp_id):
+                postings = self._postings[token]
+                del postings[emp_id]
+                if not postings:
+                    self._drop_token(token)
+            phone = self._phones.pop(emp_id, "")
+            for gram in _digit_trigrams(phone):
+                members = self._phone_trigrams[gram]
+                members.discard(emp_id)
+                if not members:
+                    del self._phone_trigrams[gram]
+
+    def _add(self, emp: Dict[str, Any], keep_sorted: bool):
+        emp_id = emp["emp_id"]
+        self._docs[emp_id] = emp
+
+        tokens: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(emp.get(field)):
+                tokens[token] = max(weight, tokens.get(token, 0.0))
+        self._doc_tokens[emp_id] = tokens
+        for token, weight in tokens.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                if keep_sorted:
+                    insort(self._vocab, token)
+                if token.isalpha():
+                    for gram in _trigrams(token):
+                        self._trigrams.setdefault(gram, set()).add(token)
+            postings[emp_id] = weight
+
+        phone = re.sub(r"\D", "", str(emp.get(PHONE_FIELD) or ""))
+        if phone:
+            self._phones[emp_id] = phone
+            for gram in _digit_trigrams(phone):
+                self._phone_trigrams.setdefault(gram, set()).add(emp_id)
+
+    def _drop_token(self, token: str):
+        del self._postings[token]
+        position = bisect_left(self._vocab, token)
+        if position < len(self._vocab) and self._vocab[position] == token:
+            del self._vocab[position]
+        if token.isalpha():
+            for gram in _trigrams(token):
+                members = self._trigrams[gram]
+                members.discard(token)
+                if not members:
+                    del self._trigrams[gram]
+
+    # ---- Queries ----
+
+    def _match_term(self, term: str) -> Dict[int, float]:
+        """Best score per employee for one query term"""
+        scores: Dict[int, float] = {}
+
+        def add(token: str, score: float):
+            for emp_id, weight in self._postings[token].items():
+                if score * weight > scores.get(emp_id, 0.0):
+                    scores[emp_id] = score * weight
+
+        # Exact and prefix matches: the vocabulary run starting at `term`
+        position = bisect_left(self._vocab, term)
+        while position < len(self._vocab) and self._vocab[position].startswith(term):
+            token = self._vocab[position]
+            add(token, EXACT_SCORE if token == term else PREFIX_SCORE + len(term) / len(token))
+            position += 1
+
+        # Typos: tokens sharing enough trigrams, confirmed by edit distance.
+        # An edit changes at most three padded trigrams, a transposition four.
+        if len(term) >= SEARCH_FUZZY_MIN_LENGTH and term.isalpha():
+            max_edits = 1 if len(term) <= 5 else 2
+            grams = _trigrams(term)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self._trigrams.get(gram, ()))
+            for token, count in shared.items():
+                if (
+                    count >= len(grams) - 4 * max_edits
+                    and abs(len(token) - len(term)) <= max_edits
+                    and not token.startswith(term)
+                ):
+                    distance = _edit_distance(term, token, max_edits)
+                    if distance <= max_edits:
+                        add(token, FUZZY_SCORE * (1 - distance / (len(term) + 1)))
+        return scores
+
+    def _match_phone(self, digits: str) -> Dict[int, float]:
+        """Employees whose phone contains `digits`; a full-number match ranks first"""
+        candidates: Optional[Set[int]] = None
+        for gram in sorted(_digit_trigrams(digits), key=lambda g: len(self._phone_trigrams.get(g, ()))):
+            members = self._phone_trigrams.get(gram, set())
+            candidates = set(members) if candidates is None else candidates & members
+            if not candidates:
+                return {}
+        return {
+            emp_id: EXACT_SCORE * len(digits) / len(self._phones[emp_id])
+            for emp_id in candidates or ()
+            if digits in self._phones[emp_id]
+        }
+
+    def search(self, query: str, limit: Optional[int] = SEARCH_DEFAULT_LIMIT, **filters: Any) -> List[Dict[str, Any]]:
+        """
+        Find employees by name, email or phone, best match first
+
+        Every term of the query has to match (exactly, as a prefix or with a
+        typo); a query that looks like a phone number matches phone digits.
+
+        Args:
+            query: Free text, e.g. "jane", "jon smi", "doe@acme", "555 0142"
+            limit: Maximum results (None for all)
+            **filters: Exact field matches applied to the results, e.g.
+                department="Sales"; None values are ignored
+
+        Returns:
+            Matching employee records
+        """
+        with self._lock:
+            digits = re.sub(r"\D", "", query)
+            if PHONE_QUERY_PATTERN.match(query) and len(digits) >= MIN_PHONE_DIGITS:
+                scores = self._match_phone(digits)
+            else:
+                scores = None
+                for term in dict.fromkeys(tokenize(query)):
+                    term_scores = self._match_term(term)
+                    if scores is None:
+                        scores = term_scores
+                    else:
+                        smaller, larger = sorted((scores, term_scores), key=len)
+                        scores = {emp_id: s + larger[emp_id] for emp_id, s in smaller.items() if emp_id in larger}
+                    if not scores:
+                        return []
+                scores = scores or {}
+
+            active_filters = {field: value for field, value in filters.items() if value is not None}
+            if active_filters:
+                scores = {
+                    emp_id: score for emp_id, score in scores.items()
+                    if all(self._docs[emp_id].get(field) == value for field, value in active_filters.items())
+                }
+
+            def rank(item):
+                return -item[1], item[0]
+
+            ranked = nsmallest(limit, scores.items(), key=rank) if limit else sorted(scores.items(), key=rank)
+            return [self._docs[emp_id] for emp_id, _ in ranked]
+
+
+_index = EmployeeSearchIndex()
+
+
+def _on_replica_sync(upserts: List[Dict[str, Any]], deleted: List[int], full: bool):
+    _index.apply_changes(upserts, deleted, full, get_replica().version)
+
+
+def _on_employee_write(emp_id: int, fields: Optional[Dict[str, Any]]):
+    if fields is None:
+        _index.remove(emp_id)
+    else:
+        _index.update_fields(emp_id, fields)
+
+
+get_replica().add_listener(_on_replica_sync)
+add_employee_listener(_on_employee_write)
+
+
+def get_search_index(token: str) -> Optional[EmployeeSearchIndex]:
+    """
+    Get the process-wide search index, current with the replica
+
+    Syncs the replica (at most every REPLICA_SYNC_INTERVAL seconds) and
+    builds the index the first time. Returns None if no replica could be
+    loaded, so callers can fall back to searching through the API.
+    """
+    replica = get_replica()
+    if not replica.sync(token):
+        return None
+    if _index.version != replica.version:
+        # Built after the replica was already loaded
+        _index.rebuild(replica.rows(), replica.version)
+    return _index
@@ -0,0 +1,141 @@
+# ================================================================
+#  Employee Management System (EMS)
+#  Developed by: Sam Ranjith Paul
+#  GitHub: https://github.com/samranjithpaul
+#  LinkedIn: https://www.linkedin.com/in/Samranjithpaul
+#  Unauthorized removal of this header is prohibited.
+# ================================================================
+"""
+Workforce analytics over the typed roster snapshot
+
+Headcount breakdowns, hires per month and the tenure distribution are
+vectorized groupbys over the shared snapshot frame (categorical
+department/designation/status, datetime64 joining_date). Results are
+computed once per data version and day and shared by every session.
+Prior-employment figures come from SQL aggregates
+(api_client.get_employment_history_stats).
+"""
+import threading
+from datetime import date
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+from .roster_snapshot import RosterSnapshot
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+UNASSIGNED = "Unassigned"
+ACTIVE_STATUS = "Active"
+
+# Tenure buckets in years: [0, 1), [1, 2), ... [10, inf)
+TENURE_BINS = [0, 1, 2, 3, 5, 10, float("inf")]
+TENURE_LABELS = ["< 1 yr", "1-2 yrs", "2-3 yrs", "3-5 yrs", "5-10 yrs", "10+ yrs"]
+DAYS_PER_YEAR = 365.25
+
+
+def _with_unassigned(column: "pd.Series") -> "pd.Series":
+    """Categorical column with missing values counted as UNASSIGNED"""
+    if not column.isna().any():
+        return column
+    if UNASSIGNED not in column.cat.categories:
+        column = column.cat.add_categories([UNASSIGNED])
+    return column.fillna(UNASSIGNED)
+
+
+def headcount_by(frame: "pd.DataFrame", column: str) -> "pd.DataFrame":
+    """
+    Employees per value of `column`, split by status
+
+    Returns:
+        DataFrame indexed by the column's values, one count column per
+        status, largest groups first
+    """
+    counts = (
+        frame.groupby([_with_unassigned(frame[column]), _with_unassigned(frame["status"])], observed=True)
+        .size()
+        .unstack(fill_value=0)
+    )
+    return counts.loc[counts.sum(axis=1).sort_values(ascending=False).index]
+
+
+def hires_per_month(frame: "pd.DataFrame") -> "pd.Series":
+    """Employees by joining month, including months without hires (indexed by month start)"""
+    import pandas as pd
+
+    months = frame["joining_date"].dropna().dt.to_period("M")
+    if months.empty:
+        # Keep a DatetimeIndex so callers can still compare it with dates
+        return pd.Series(dtype="int64", index=pd.DatetimeIndex([]), name="hires")
+    counts = months.value_counts()
+    span = pd.period_range(counts.index.min(), counts.index.max(), freq="M")
+    counts = counts.reindex(span, fill_value=0)
+    counts.index = counts.index.to_timestamp()
+    return counts.rename("hires")
+
+
+def tenure_years(frame: "pd.DataFrame", today: date) -> "pd.Series":
+    """Years since joining of active employees with a joining date"""
+    import pandas as pd
+
+    active = frame.loc[frame["status"] == ACTIVE_STATUS, "joining_date"].dropna()
+    return (pd.Timestamp(today) - active).dt.days / DAYS_PER_YEAR
+
+
+def tenure_distribution(tenure: "pd.Series") -> "pd.Series":
+    """Active employees per tenure bucket (TENURE_LABELS order)"""
+    import pandas as pd
+
+    buckets = pd.cut(tenure, TENURE_BINS, labels=TENURE_LABELS, right=False)
+    return buckets.value_counts(sort=False).rename_axis("tenure").rename("employees")
+
+
+def compute_workforce_analytics(frame: "pd.DataFrame", today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    All roster analytics for the analytics page
+
+    Returns:
+        {"total", "active", "departments", "median_tenure_years",
+         "hires_last_12_months", "by_department", "by_designation",
+         "by_status", "hires_per_month", "tenure"}
+    """
+    import pandas as pd
+
+    today = today or date.today()
+    tenure = tenure_years(frame, today)
+    hires = hires_per_month(frame)
+    this_month = pd.Timestamp(today).to_period("M")
+    last_12_months = (hires.index >= (this_month - 11).to_timestamp()) & (hires.index <= this_month.to_timestamp())
+    status_counts = _with_unassigned(frame["status"]).value_counts()
+
+    return {
+        "total": len(frame),
+        "active": int(status_counts.get(ACTIVE_STATUS, 0)),
+        "departments": int(frame["department"].nunique()),
+        "median_tenure_years": float(tenure.median()) if not tenure.empty else None,
+        "hires_last_12_months": int(hires[last_12_months].sum()),
+        "by_department": headcount_by(frame, "department"),
+        "by_designation": headcount_by(frame, "designation"),
+        "by_status": status_counts.rename("employees"),
+        "hires_per_month": hires,
+        "tenure": tenure_distribution(tenure),
+    }
+
+
+_results: Dict[Tuple[str, date], Dict[str, Any]] = {}
+_results_lock = threading.Lock()
+
+
+def get_workforce_analytics(snapshot: RosterSnapshot, today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Analytics for a roster snapshot, computed once per data version and
+    day (tenure depends on the date) and shared by all sessions
+    """
+    key = (snapshot.fingerprint, today or date.today())
+    with _results_lock:
+        result = _results.get(key)
+        if result is None:
+            result = compute_workforce_analytics(snapshot.frame, key[1])
+            # Only the current data version is worth keeping
+            _results.clear()
+            _results[key] = result
+        return result